@@ -0,0 +1,186 @@
+import bisect
+from collections import namedtuple
+from datetime import date
+
+from asset_index import AssetIndex
+from sort_index import amount_sort_key, due_date_sort_key
+from utils import DEFAULT_CURRENCY, asset_currency
+
+NO_MATURITY = "만기일 없음" # 만기월 그룹에서 만기일이 없거나 잘못된 자산의 그룹 이름
+
+def _maturity_month(tab_name, asset):
+    missing, due_ordinal = due_date_sort_key(asset)
+    return NO_MATURITY if missing else date.fromordinal(due_ordinal).strftime("%Y-%m")
+
+# 그룹 기준 이름 -> (탭 이름, 자산)으로 그룹 값을 구하는 함수
+GROUP_DIMENSIONS = {
+    '자산 종류': lambda tab_name, asset: str(asset.get('자산 종류', '')),
+    '세부 분류': lambda tab_name, asset: str(asset.get('세부 분류', '')),
+    '만기월': _maturity_month,
+    '탭': lambda tab_name, asset: tab_name,
+}
+
+def _convert(amount, rate):
+    """원화(환율 1.0)는 정수 그대로 두고, 그 외 통화만 환율을 곱합니다."""
+    return amount if rate == 1.0 else amount * rate
+
+# 그룹 하나의 집계 결과 (금액은 원화 환산). share는 조회 범위(탭 또는 전체) 합계 대비 비중 (0.0 ~ 1.0)
+GroupSummary = namedtuple('GroupSummary', ['value', 'total', 'count', 'minimum', 'maximum', 'share'])
+
+
+class _CurrencyBucket:
+    """그룹 안의 통화 하나: 원래 통화 기준 합계와 최소/최대 계산을 위한 정렬된 금액 리스트."""
+    __slots__ = ('total', 'amounts')
+
+    def __init__(self):
+        self.total = 0
+        self.amounts = []
+
+
+class _Group:
+    """그룹 하나의 건수와 통화별 버킷."""
+    __slots__ = ('count', 'buckets')
+
+    def __init__(self):
+        self.count = 0 # 금액이 잘못된 자산도 포함한 자산 수
+        self.buckets = {} # 통화 코드 -> _CurrencyBucket
+
+
+class AggregationEngine(AssetIndex):
+    """
+    그룹별 금액 집계(합계, 건수, 최소, 최대, 비중)를 증분으로 유지하는 인덱스입니다.
+    그룹은 기준별로 (탭 이름, 그룹 값) 키로 보관하므로 탭 하나 또는 전체 탭 범위로 조회할 수 있고,
+    자산 하나가 바뀌면 그 자산이 속한 그룹만 갱신됩니다.
+    금액은 그룹 안에서 통화별 버킷에 원래 통화로 누적하고 조회 시 버킷마다 환율을 한 번 곱하므로,
+    환율이 바뀌어도 다시 집계할 필요가 없습니다. 환율이 없는 통화는 환산 합계에서 제외됩니다.
+    """
+
+    def __init__(self, rate_lookup=None):
+        self._groups = {dimension: {} for dimension in GROUP_DIMENSIONS}
+        # 통화 코드 -> 원화 환산 환율 (없으면 None). 기본값은 원화만 1.0
+        self.rate_lookup = rate_lookup or (lambda currency: 1.0 if currency == DEFAULT_CURRENCY else None)
+
+    def clear(self):
+        self._groups = {dimension: {} for dimension in GROUP_DIMENSIONS}
+
+    def _apply(self, tab_name, asset, adding):
+        missing, amount = amount_sort_key(asset)
+        if missing and adding:
+            print(f"경고: 유효하지 않은 금액 데이터가 발견되었습니다: {asset.get('금액')}")
+        currency = asset_currency(asset)
+        for dimension, value_func in GROUP_DIMENSIONS.items():
+            groups = self._groups[dimension]
+            key = (tab_name, value_func(tab_name, asset))
+            group = groups.get(key)
+            if adding:
+                if group is None:
+                    group = groups[key] = _Group()
+                group.count += 1
+                if not missing:
+                    bucket = group.buckets.get(currency)
+                    if bucket is None:
+                        bucket = group.buckets[currency] = _CurrencyBucket()
+                    bucket.total += amount
+                    bisect.insort(bucket.amounts, amount)
+            elif group is not None:
+                group.count -= 1
+                bucket = group.buckets.get(currency)
+                if not missing and bucket is not None:
+                    bucket.total -= amount
+                    position = bisect.bisect_left(bucket.amounts, amount)
+                    if position < len(bucket.amounts) and bucket.amounts[position] == amount:
+                        del bucket.amounts[position]
+                    if not bucket.amounts:
+                        del group.buckets[currency]
+                if group.count <= 0:
+                    del groups[key]
+
+    def assets_added(self, tab_name, assets):
+        for asset in assets:
+            self._apply(tab_name, asset, True)
+
+    def assets_removed(self, tab_name, assets):
+        for asset in assets:
+            self._apply(tab_name, asset, False)
+
+    def tab_removed(self, tab_name, assets):
+        # 탭의 그룹만 키로 골라 삭제 (자산을 하나씩 빼지 않음)
+        for groups in self._groups.values():
+            for key in [key for key in groups if key[0] == tab_name]:
+                del groups[key]
+
+    def tab_renamed(self, old_name, new_name):
+        for dimension, groups in self._groups.items():
+            for key in [key for key in groups if key[0] == old_name]:
+                group = groups.pop(key)
+                value = new_name if dimension == '탭' else key[1]
+                groups[(new_name, value)] = group
+
+    # --- 조회 ---
+    def _converted_total(self, group):
+        """그룹의 원화 환산 합계 (통화 버킷마다 곱셈 한 번)."""
+        total = 0
+        for currency, bucket in group.buckets.items():
+            rate = self.rate_lookup(currency)
+            if rate is not None:
+                total += _convert(bucket.total, rate)
+        return total
+
+    def tab_total(self, tab_name):
+        """탭의 원화 환산 금액 합계를 반환합니다. (통화 수에 비례)"""
+        group = self._groups['탭'].get((tab_name, tab_name))
+        return self._converted_total(group) if group is not None else 0
+
+    def grand_total(self):
+        """모든 탭의 원화 환산 금액 합계를 반환합니다. (탭 수 x 통화 수에 비례)"""
+        return sum(self._converted_total(group) for group in self._groups['탭'].values())
+
+    def currency_totals(self, tab_name):
+        """탭의 통화별 원래 통화 기준 합계 {통화 코드: 합계}를 반환합니다."""
+        group = self._groups['탭'].get((tab_name, tab_name))
+        return {currency: bucket.total for currency, bucket in group.buckets.items()} if group is not None else {}
+
+    def category_totals(self):
+        """
+        (탭, 자산 종류)별 건수와 통화별 원래 통화 기준 합계를 반환합니다.
+        ({(탭, 자산 종류): 건수}, {(탭, 자산 종류, 통화): 합계}) (일괄 재계산 결과와 비교용)
+        """
+        counts, totals = {}, {}
+        for (tab_name, category), group in self._groups['자산 종류'].items():
+            counts[(tab_name, category)] = group.count
+            for currency, bucket in group.buckets.items():
+                totals[(tab_name, category, currency)] = bucket.total
+        return counts, totals
+
+    def summarize(self, dimension, tab_name=None):
+        """
+        dimension(GROUP_DIMENSIONS의 키) 기준 그룹별 집계를 합계 내림차순의 GroupSummary 리스트로 반환합니다.
+        tab_name을 주면 해당 탭만, None이면 모든 탭을 합쳐서 집계합니다. (그룹 수에 비례)
+        """
+        rates = {} # 이번 조회에서 사용할 통화별 환율 (통화당 한 번만 조회)
+        merged = {} # 그룹 값 -> [원화 환산 합계, 건수, 최소, 최대]
+        for (group_tab, value), group in self._groups[dimension].items():
+            if tab_name is not None and group_tab != tab_name:
+                continue
+            entry = merged.get(value)
+            if entry is None:
+                entry = merged[value] = [0, 0, None, None]
+            entry[1] += group.count
+            for currency, bucket in group.buckets.items():
+                if currency not in rates:
+                    rates[currency] = self.rate_lookup(currency)
+                rate = rates[currency]
+                if rate is None:
+                    continue
+                entry[0] += _convert(bucket.total, rate)
+                minimum, maximum = _convert(bucket.amounts[0], rate), _convert(bucket.amounts[-1], rate)
+                entry[2] = minimum if entry[2] is None else min(entry[2], minimum)
+                entry[3] = maximum if entry[3] is None else max(entry[3], maximum)
+
+        scope_total = sum(entry[0] for entry in merged.values())
+        summaries = [
+            GroupSummary(value, total, count, minimum, maximum, total / scope_total if scope_total else 0.0)
+            for value, (total, count, minimum, maximum) in merged.items()
+        ]
+        summaries.sort(key=lambda summary: (-summary.total, summary.value))
+        return summaries
@@ -1,9 +1,61 @@
+import functools
 import json
 import os
-import csv
-import hashlib
+import threading
+from collections import namedtuple
+from datetime import date
 from PyQt5.QtCore import QObject, pyqtSignal, QDate
 
+from utils import asset_currency
+
+from completion_index import CompletionIndex
+from sort_index import AssetSortIndex, amount_sort_key
+from column_sizer import ColumnLengthIndex
+from aggregation_engine import AggregationEngine
+from maturity_index import MaturityIndex
+from fx_rates import FxRateTable
+from snapshot_store import SnapshotStore
+from asset_store import ShardedAssetStore
+from content_hash import ContentHashIndex
+from asset_formats import ASSET_FIELDS, read_assets, write_assets
+from import_profiles import ImportProfileStore
+from tab_snapshots import TabSnapshotIndex
+from undo_commands import (
+    UndoStack, AddAssetsCommand, UpdateAssetsCommand, RemoveAssetsCommand,
+    AddTabCommand, RemoveTabCommand, RenameTabCommand, CompositeCommand
+)
+
+# 병합 가져오기에서 같은 자산으로 보는 기본 키 필드
+DEFAULT_UPSERT_KEY_FIELDS = ("자산 명", "세부 분류", "만기일")
+
+# 병합 가져오기 계획
+# inserts: 추가할 자산 데이터 리스트, updates: [(현재 자산, 교체할 자산), ...],
+# unchanged: 내용이 같아 건너뛸 행 수, duplicates: 파일 안에서 키가 중복되어 뒤의 행으로 대체된 행 수
+# version: 계획을 만들 때 읽은 탭 스냅샷 버전 (적용 시점에 탭이 바뀌었는지 확인)
+UpsertPlan = namedtuple("UpsertPlan", ["tab_name", "inserts", "updates", "unchanged", "duplicates", "version"])
+
+def _synchronized(method):
+    """
+    데이터를 변경하는 메서드를 쓰기 잠금(AssetDataManager._lock) 안에서 실행하도록 감쌉니다.
+    감싼 메서드는 Qt가 남는 시그널 인자를 버려 주지 못하므로 시그널에 직접 연결하지 말고 람다로 연결합니다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _upsert_key(asset, key_fields):
+    return tuple(str(asset.get(field, "")).strip() for field in key_fields)
+
+def _comparable_fields(asset):
+    """가져오기 항목 기준 비교용 값 (금액은 숫자로, 통화는 기본값 포함으로 비교)"""
+    amount = amount_sort_key(asset)
+    if amount[0]:
+        amount = (2, str(asset.get('금액', '')).strip()) # 숫자가 아닌 금액은 문자열로 비교
+    return (amount, asset_currency(asset)) + tuple(
+        str(asset.get(field, "")).strip() for field in ASSET_FIELDS if field not in ("금액", "통화"))
+
 class AssetDataManager(QObject):
     # 탭 목록이 변경되었음을 알리는 시그널 (UI 갱신용)
     tab_list_changed = pyqtSignal()
@@ -11,17 +63,79 @@ class AssetDataManager(QObject):
     data_changed = pyqtSignal(str)
     # 초기 데이터 로드가 완료되었음을 알리는 시그널 (전체 데이터 전달)
     data_loaded = pyqtSignal(dict) 
+    # 실행 취소/다시 실행 가능 상태가 변경되었음을 알리는 시그널 (메뉴 활성화 갱신용)
+    undo_state_changed = pyqtSignal()
+    # 스냅샷이 저장되었음을 알리는 시그널 (추이 차트 갱신용)
+    snapshot_taken = pyqtSignal()
 
-    def __init__(self, data_file="assets.json"):
+    def __init__(self, data_file="assets.json", data_dir="asset_data"):
         super().__init__()
-        self.data_file = data_file
+        self.data_file = data_file # 이전 단일 파일 형식 (있으면 data_dir의 탭별 파일로 자동 변환)
+        self.store = ShardedAssetStore(data_dir) # 탭별 파일 저장소 (변경된 탭만 저장)
         self.assets = {} # 모든 자산 데이터를 저장할 딕셔너리 {탭이름: [자산1, 자산2, ...]}
+        self._lock = threading.RLock() # 쓰기 잠금 (데이터 변경은 모두 이 잠금 안에서 수행)
         self.last_no = 0 # 자산 고유 번호 생성을 위한 카운터
+        self._indexes = [] # 데이터 변경을 통보받는 증분 인덱스 목록 (register_index 참고)
+        self._completion_indexes = {} # 필드 이름 -> CompletionIndex
+        self.undo_stack = UndoStack() # 변경 내역 (변경된 행만 보관하는 명령 객체)
+        self.fx_rates = FxRateTable() # 통화별 원화 환산 환율 (변경 시 fx_rates.rates_changed)
+        self.snapshot_store = SnapshotStore() # 날짜별 과거 상태 (변경분 + 주기적 키프레임)
+        self._snapshot_stale = False # 마지막 스냅샷 이후 데이터가 바뀌었는지 (refresh_snapshot 참고)
+        self.import_profiles = ImportProfileStore() # 가져오기 파일의 열 매핑 프로필 (헤더로 자동 선택)
         self._load_data()
+        self._content_hashes = self.register_index(ContentHashIndex()) # 탭별 내용 해시 (변경 없는 저장/갱신 생략)
+        self._tab_snapshots = self.register_index(TabSnapshotIndex()) # 백그라운드 작업용 탭별 불변 스냅샷
+        self.register_index(self.store)
+        self._verify_integrity()
+        self._sort_index = self.register_index(AssetSortIndex()) # 탭별 정렬 순열 캐시
+        self._column_length_index = self.register_index(ColumnLengthIndex()) # 컬럼별 가장 긴 표시 값 (열 너비 추정용)
+        self._aggregation = self.register_index(AggregationEngine(self.fx_rates.rate)) # 그룹별 금액 집계 (원화 환산)
+        self._maturity_index = self.register_index(MaturityIndex()) # 전체 탭의 만기일 순 인덱스
 
     def _load_data(self):
         """
-        데이터 파일을 로드합니다. 파일이 없거나 비어있으면 빈 딕셔너리로 초기화합니다.
+        탭별 데이터 파일을 로드합니다. 아직 없고 이전 단일 파일(data_file)이 있으면 읽어서 탭별 파일로 변환합니다.
+        """
+        if self.store.exists():
+            try:
+                self.assets = self.store.load()
+                self.last_no = self._get_max_asset_no()
+            except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"데이터 목록 파일 로드 중 오류 발생: {e}. 빈 데이터로 시작합니다.")
+                self.assets = {}
+        else:
+            self._load_legacy_data()
+            if self.assets:
+                self._migrate_legacy_data()
+
+        # 데이터 로드 완료 시그널 emit
+        self.data_loaded.emit(self.assets)
+
+    def _verify_integrity(self):
+        """
+        로드한 탭의 내용 해시를 탭 파일에 저장된 해시와 비교하여, 일치하지 않는 탭 이름 리스트를 반환합니다.
+        (파일이 외부에서 수정되었거나 손상된 경우)
+        """
+        mismatched_tabs = []
+        for tab_name in self.assets:
+            saved_hash = self.store.saved_hash(tab_name)
+            if saved_hash is not None and saved_hash != self._content_hashes.tab_hash(tab_name):
+                print(f"경고: 탭 '{tab_name}'의 데이터가 저장된 해시와 일치하지 않습니다. 파일이 외부에서 수정되었거나 손상되었을 수 있습니다.")
+                mismatched_tabs.append(tab_name)
+        return mismatched_tabs
+
+    def _migrate_legacy_data(self):
+        """단일 파일 데이터를 탭별 파일로 저장하고, 원래 파일은 .bak으로 이름을 바꿔 보관합니다."""
+        try:
+            self.store.migrate(self.assets)
+            os.replace(self.data_file, self.data_file + ".bak")
+            print(f"데이터 파일 '{self.data_file}'을(를) 탭별 파일 형식으로 변환했습니다.")
+        except OSError as e:
+            print(f"데이터 파일 변환 중 오류 발생: {e}")
+
+    def _load_legacy_data(self):
+        """
+        이전 단일 파일 형식의 데이터 파일을 로드합니다. 파일이 없거나 비어있으면 빈 딕셔너리로 초기화합니다.
         """
         if os.path.exists(self.data_file):
             try:
@@ -50,17 +164,17 @@ class AssetDataManager(QObject):
         #     # AssetDataManager의 add_tab_data 메서드를 직접 호출
         #     self.add_tab_data("내 자산") # 이 메서드는 이미 _save_data와 시그널을 처리합니다.
 
-        # 데이터 로드 완료 시그널 emit
-        self.data_loaded.emit(self.assets)
-
-
     def _save_data(self):
-        """현재 자산 데이터를 파일에 저장합니다."""
+        """
+        변경 사항을 확정합니다. 변경된 탭의 스냅샷을 발행하고,
+        변경된 탭의 데이터 파일(과 탭 목록이 바뀌었으면 목록 파일)만 저장합니다.
+        """
+        self._tab_snapshots.publish(self.assets)
+        self._snapshot_stale = True
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.assets, f, indent=4, ensure_ascii=False)
+            self.store.save(self.assets, self._content_hashes.tab_hash)
         except Exception as e:
-            print(f"데이터 파일 '{self.data_file}' 저장 중 오류 발생: {e}")
+            print(f"데이터 파일 '{self.store.directory}' 저장 중 오류 발생: {e}")
 
     def _get_max_asset_no(self):
         """현재 저장된 모든 자산 중 가장 큰 'no' 값을 찾아 반환합니다."""
@@ -71,6 +185,124 @@ class AssetDataManager(QObject):
                     max_no = max(max_no, asset['no'])
         return max_no
 
+    # --- 증분 인덱스 관리 ---
+    def register_index(self, index):
+        """
+        AssetIndex를 등록하고 현재 데이터로 한 번 구축합니다.
+        이후 자산 추가/수정/삭제와 탭 변경 사항이 해당 인덱스에 통보됩니다.
+        """
+        index.rebuild(self.assets)
+        self._indexes.append(index)
+        return index
+
+    def _notify_assets_added(self, tab_name, assets):
+        for index in self._indexes:
+            index.assets_added(tab_name, assets)
+
+    def _notify_assets_removed(self, tab_name, assets):
+        for index in self._indexes:
+            index.assets_removed(tab_name, assets)
+
+    def _notify_assets_updated(self, tab_name, changes):
+        for index in self._indexes:
+            index.assets_updated(tab_name, changes)
+
+    def _notify_tab_removed(self, tab_name, assets):
+        for index in self._indexes:
+            index.tab_removed(tab_name, assets)
+
+    def _notify_tab_renamed(self, old_name, new_name):
+        for index in self._indexes:
+            index.tab_renamed(old_name, new_name)
+
+    # --- 스냅샷 읽기 (잠금 없음, 모든 스레드에서 사용 가능) ---
+    # 위의 인덱스 조회 메서드와 get_assets_by_tab은 GUI 스레드 전용이며,
+    # 백그라운드 작업은 아래 스냅샷을 읽어야 합니다.
+    def get_tab_snapshot(self, tab_name):
+        """
+        tab_name 탭의 마지막으로 확정된 불변 스냅샷(TabSnapshot: tab_name, version, assets 튜플)을 반환합니다.
+        탭이 없으면 None입니다. 스냅샷은 이후 변경의 영향을 받지 않으며, 탭이 바뀌면 version이 증가합니다.
+        """
+        return self._tab_snapshots.snapshot(tab_name)
+
+    def get_all_tab_snapshots(self):
+        """모든 탭의 불변 스냅샷 {탭 이름: TabSnapshot}을 반환합니다. (한 시점의 일관된 상태, 탭 순서 유지)"""
+        return dict(self._tab_snapshots.snapshots())
+
+    def get_completion_index(self, field_name):
+        """
+        field_name(예: '자산 명')의 자동 완성 인덱스를 반환합니다.
+        처음 요청될 때 전체 자산으로 구축되고, 이후에는 변경 사항만 반영됩니다.
+        """
+        index = self._completion_indexes.get(field_name)
+        if index is None:
+            index = self.register_index(CompletionIndex(field_name))
+            self._completion_indexes[field_name] = index
+        return index
+
+    def get_completion_fields(self):
+        """자동 완성 인덱스가 만들어진 필드 이름 목록"""
+        return list(self._completion_indexes)
+
+    @_synchronized
+    def apply_index_rebuild(self, result, snapshots):
+        """
+        snapshots({탭 이름: TabSnapshot})로 실행한 batch_jobs.IndexRebuildJob 결과를 반영합니다.
+        자동 완성 인덱스는 다시 센 사용 횟수로 교체하고, 증분 집계가 재계산 결과와 다르면 집계를 다시 구축합니다.
+        작업 중에 데이터가 바뀌었으면(스냅샷이 다르면) 반영하지 않고 None을 반환하며,
+        반영하면 집계가 어긋나 있었는지 여부(True/False)를 반환합니다.
+        """
+        current = self._tab_snapshots.snapshots()
+        if current.keys() != snapshots.keys() or any(current[tab_name] is not snapshot for tab_name, snapshot in snapshots.items()):
+            return None
+        aggregates, term_counts = result
+        for field_name, counts in term_counts.items():
+            index = self._completion_indexes.get(field_name)
+            if index is not None:
+                index.clear()
+                for value, count in counts.items():
+                    index.add_value(value, count)
+
+        expected_counts, expected_totals = {}, {}
+        for (tab_name, category, currency), (count, total) in aggregates.items():
+            expected_counts[(tab_name, category)] = expected_counts.get((tab_name, category), 0) + count
+            if total:
+                expected_totals[(tab_name, category, currency)] = total
+        counts, totals = self._aggregation.category_totals()
+        drifted = counts != expected_counts or {key: total for key, total in totals.items() if total} != expected_totals
+        if drifted:
+            print("경고: 증분 집계가 전체 재계산 결과와 달라 집계를 다시 구축합니다.")
+            self._aggregation.rebuild(self.assets)
+        return drifted
+
+    def get_sorted_assets(self, tab_name, sort_spec):
+        """
+        탭의 자산을 sort_spec 순서로 반환합니다.
+        sort_spec: [(필드 이름, 오름차순 여부), ...] (앞의 항목이 우선, sort_index.SORT_KEY_FUNCS의 필드만 사용)
+        금액은 정수, 만기일은 날짜 서수, 문자열은 대소문자 무시로 비교하며 정렬 결과는 캐시됩니다.
+        """
+        return self._sort_index.sorted_assets(tab_name, sort_spec)
+
+    def get_sorted_nos(self, tab_name, sort_spec):
+        """get_sorted_assets와 같은 순서의 자산 'no' 목록을 반환합니다."""
+        return self._sort_index.sorted_nos(tab_name, sort_spec)
+
+    def get_asset_by_no(self, tab_name, no):
+        """탭에서 'no'에 해당하는 자산을 O(1)로 찾아 반환합니다. 없으면 None."""
+        return self._sort_index.get_asset(tab_name, no)
+
+    def get_longest_assets(self, tab_name, column, limit):
+        """탭에서 column의 표시 문자열이 가장 긴 자산을 최대 limit개 반환합니다. (열 너비 추정용)"""
+        return self._column_length_index.longest_assets(tab_name, column, limit)
+
+    def get_maturing_assets(self, start_date, end_date):
+        """
+        start_date ~ end_date(datetime.date, 양 끝 포함)에 만기가 도래하는 모든 탭의 자산을 만기일 순으로 반환합니다.
+        반환값: [(탭 이름, 자산), ...] (만기일 인덱스로 O(log n + k))
+        """
+        return [(tab_name, asset) for _, tab_name, asset
+                in self._maturity_index.between(start_date.toordinal(), end_date.toordinal())]
+
     def get_all_tab_names(self):
         """현재 존재하는 모든 탭의 이름을 반환합니다."""
         return list(self.assets.keys())
@@ -79,24 +311,29 @@ class AssetDataManager(QObject):
         """특정 탭의 모든 자산 목록을 반환합니다. 해당 탭이 없으면 빈 리스트를 반환합니다."""
         return self.assets.get(tab_name, [])
 
+    @_synchronized
     def add_tab_data(self, tab_name):
         """새로운 탭을 추가하고 파일에 저장합니다."""
         if tab_name in self.assets:
             return False # 이미 존재하는 탭
-        self.assets[tab_name] = []
+        self._insert_tab(tab_name, [], None)
+        self._record(AddTabCommand(tab_name))
         self._save_data()
         self.tab_list_changed.emit() # 탭 목록 변경 시그널 발생
         return True
 
+    @_synchronized
     def delete_tab_data(self, tab_name):
-        """탭과 해당 탭의 모든 자산 데이터를 삭제합니다."""
+        """탭과 해당 탭의 모든 자산 데이터를 삭제합니다. (실행 취소로 복원 가능)"""
         if tab_name not in self.assets:
             return False # 존재하지 않는 탭
-        del self.assets[tab_name]
+        position, removed_assets = self._remove_tab(tab_name)
+        self._record(RemoveTabCommand(tab_name, position, removed_assets))
         self._save_data()
         self.tab_list_changed.emit() # 탭 목록 변경 시그널 발생
         return True
 
+    @_synchronized
     def rename_tab_data_key(self, old_name, new_name):
         """탭 이름을 변경합니다."""
         if old_name not in self.assets:
@@ -104,41 +341,189 @@ class AssetDataManager(QObject):
         if new_name in self.assets and new_name != old_name:
             return False # 새 이름이 이미 존재함
 
-        # 딕셔너리 순서 유지를 위해 임시 딕셔너리 생성
-        temp_assets = {}
-        for key, value in self.assets.items():
-            if key == old_name:
-                temp_assets[new_name] = value
-            else:
-                temp_assets[key] = value
-        self.assets = temp_assets
+        self._rename_tab(old_name, new_name)
+        self._record(RenameTabCommand(old_name, new_name))
         
         self._save_data()
         self.tab_list_changed.emit()
         return True
 
-    def add_asset(self, tab_name, asset_data):
+    # --- 변경 기본 연산 ---
+    # 아래 메서드들은 데이터와 인덱스만 갱신하며, 저장/시그널/실행 취소 기록은 호출자가 처리합니다.
+    # 실행 취소 명령(undo_commands)도 이 연산들을 통해 변경을 되돌립니다.
+
+    def _insert_tab(self, tab_name, assets, position):
+        """탭을 position 위치(None이면 맨 끝)에 삽입합니다."""
+        if position is None or position >= len(self.assets):
+            self.assets[tab_name] = assets
+        else:
+            # 딕셔너리 순서 유지를 위해 지정 위치에 끼워 넣은 새 딕셔너리 생성 (탭 개수만큼만 순회)
+            items = list(self.assets.items())
+            items.insert(position, (tab_name, assets))
+            self.assets = dict(items)
+        self._notify_assets_added(tab_name, assets)
+
+    def _remove_tab(self, tab_name):
+        """탭을 삭제하고 (탭 순서상의 위치, 자산 리스트)를 반환합니다."""
+        position = list(self.assets).index(tab_name)
+        removed_assets = self.assets.pop(tab_name)
+        self._notify_tab_removed(tab_name, removed_assets)
+        return position, removed_assets
+
+    def _rename_tab(self, old_name, new_name):
         """
-        지정된 탭에 새 자산을 추가하고 파일에 저장합니다.
-        asset_data 딕셔너리에 'no' 필드를 추가하고,
-        만기일이 빈 문자열이면 저장하지 않도록 처리합니다.
+        탭 이름을 변경합니다. 탭 순서는 유지됩니다.
+        자산 리스트는 그대로 두고 키만 바꾸며(탭 개수만큼만 순회), 저장 시에는 탭 목록 파일만 다시 씁니다.
         """
-        if tab_name not in self.assets:
-            print(f"경고: 탭 '{tab_name}'가 존재하지 않아 자산을 추가할 수 없습니다.")
-            return False
+        self.assets = {new_name if key == old_name else key: value for key, value in self.assets.items()}
+        self._notify_tab_renamed(old_name, new_name)
 
+    def _prepare_new_asset(self, asset_data):
+        """
+        asset_data를 복사하여 새 'no'를 할당한 자산 딕셔너리를 반환합니다.
+        만기일이 빈 문자열이면 저장하지 않도록 제거합니다.
+        """
         self.last_no += 1
         new_asset = asset_data.copy()
         new_asset['no'] = self.last_no
         
         # 만기일이 빈 문자열이면 제거
-        if '만기일' in new_asset and not new_asset['만기일'].strip():
+        if '만기일' in new_asset and not str(new_asset['만기일']).strip():
             del new_asset['만기일']
+        return new_asset
+
+    def _append_assets(self, tab_name, new_assets):
+        """'no'가 할당된 자산들을 탭 끝에 추가합니다."""
+        self.assets[tab_name].extend(new_assets)
+        self._notify_assets_added(tab_name, new_assets)
+
+    def _remove_appended_assets(self, tab_name, appended_assets):
+        """
+        _append_assets로 추가했던 자산들을 제거합니다.
+        탭 끝부분이 그대로라면 꼬리만 잘라내므로 탭 크기와 무관하게 O(추가된 행 수)입니다.
+        """
+        tab_assets = self.assets[tab_name]
+        count = len(appended_assets)
+        if count and len(tab_assets) >= count and all(
+                current is appended for current, appended in zip(tab_assets[-count:], appended_assets)):
+            del tab_assets[-count:]
+            self._notify_assets_removed(tab_name, appended_assets)
+        else:
+            self._remove_assets_by_no(tab_name, {asset['no'] for asset in appended_assets})
+
+    def _remove_assets_by_no(self, tab_name, nos):
+        """'no'가 nos에 포함된 자산들을 삭제하고 [(원래 위치, 자산), ...]을 반환합니다."""
+        tab_assets = self.assets[tab_name]
+        remaining_assets = []
+        removed_rows = []
+        for position, asset in enumerate(tab_assets):
+            if 'no' in asset and asset['no'] in nos:
+                removed_rows.append((position, asset))
+            else:
+                remaining_assets.append(asset)
+        if removed_rows:
+            tab_assets[:] = remaining_assets
+            self._notify_assets_removed(tab_name, [asset for _, asset in removed_rows])
+        return removed_rows
+
+    def _insert_assets_at(self, tab_name, rows):
+        """
+        [(위치, 자산), ...]을 원래 위치에 다시 삽입합니다. (_remove_assets_by_no의 역연산)
+        기존 목록과 한 번의 병합으로 처리하므로 O(탭 크기 + 삽입 행 수)입니다.
+        """
+        tab_assets = self.assets[tab_name]
+        merged_assets = []
+        source_index = 0
+        for position, asset in sorted(rows, key=lambda row: row[0]):
+            while len(merged_assets) < position and source_index < len(tab_assets):
+                merged_assets.append(tab_assets[source_index])
+                source_index += 1
+            merged_assets.append(asset)
+        merged_assets.extend(tab_assets[source_index:])
+        tab_assets[:] = merged_assets
+        self._notify_assets_added(tab_name, [asset for _, asset in rows])
+
+    def _replace_assets(self, tab_name, changes):
+        """[(현재 자산, 교체할 자산), ...]에 따라 같은 'no'의 자산을 교체합니다."""
+        tab_assets = self.assets[tab_name]
+        positions = {asset['no']: i for i, asset in enumerate(tab_assets) if 'no' in asset}
+        applied_changes = []
+        for current_asset, replacement in changes:
+            i = positions.get(current_asset.get('no'))
+            if i is None:
+                continue
+            applied_changes.append((tab_assets[i], replacement))
+            tab_assets[i] = replacement
+        if applied_changes:
+            self._notify_assets_updated(tab_name, applied_changes)
+
+    # --- 실행 취소 / 다시 실행 ---
+    def _record(self, command):
+        """변경 명령을 실행 취소 스택에 기록합니다."""
+        self.undo_stack.push(command)
+        self.undo_state_changed.emit()
+
+    def can_undo(self):
+        return self.undo_stack.can_undo()
+
+    def can_redo(self):
+        return self.undo_stack.can_redo()
+
+    @_synchronized
+    def undo(self):
+        """마지막 변경을 되돌립니다. 되돌릴 변경이 없으면 False를 반환합니다."""
+        if not self.undo_stack.can_undo():
+            return False
+        command = self.undo_stack.pop_undo()
+        self._after_history_change(command, command.undo(self))
+        return True
+
+    @_synchronized
+    def redo(self):
+        """되돌린 변경을 다시 적용합니다. 다시 실행할 변경이 없으면 False를 반환합니다."""
+        if not self.undo_stack.can_redo():
+            return False
+        command = self.undo_stack.pop_redo()
+        self._after_history_change(command, command.redo(self))
+        return True
+
+    def _after_history_change(self, command, changed_tabs):
+        """실행 취소/다시 실행 후 저장하고 필요한 시그널을 발생시킵니다."""
+        self._save_data()
+        if command.changes_tab_list:
+            self.tab_list_changed.emit()
+        for tab_name in dict.fromkeys(changed_tabs): # 순서를 유지하며 중복 제거
+            if tab_name in self.assets:
+                self.data_changed.emit(tab_name)
+        self.undo_state_changed.emit()
+
+    def add_asset(self, tab_name, asset_data):
+        """
+        지정된 탭에 새 자산을 추가하고 파일에 저장합니다.
+        asset_data 딕셔너리에 'no' 필드를 추가하고,
+        만기일이 빈 문자열이면 저장하지 않도록 처리합니다.
+        """
+        return len(self.add_assets(tab_name, [asset_data])) > 0
+
+    @_synchronized
+    def add_assets(self, tab_name, asset_data_list):
+        """
+        지정된 탭에 여러 자산을 한 번에 추가합니다.
+        연속된 'no' 범위를 할당하고, 파일 저장과 data_changed 시그널은 한 번만 발생합니다.
+        추가된 자산 딕셔너리 리스트를 반환합니다.
+        """
+        if tab_name not in self.assets:
+            print(f"경고: 탭 '{tab_name}'가 존재하지 않아 자산을 추가할 수 없습니다.")
+            return []
+        if not asset_data_list:
+            return []
 
-        self.assets[tab_name].append(new_asset)
+        new_assets = [self._prepare_new_asset(asset_data) for asset_data in asset_data_list]
+        self._append_assets(tab_name, new_assets)
+        self._record(AddAssetsCommand(tab_name, new_assets))
         self._save_data()
         self.data_changed.emit(tab_name) # 해당 탭의 데이터 변경 시그널 발생
-        return True
+        return new_assets
 
     def update_asset(self, tab_name, original_asset, updated_asset_data):
         """
@@ -153,147 +538,288 @@ class AssetDataManager(QObject):
             print("오류: 원본 자산에 'no' 필드가 없습니다. 업데이트할 수 없습니다.")
             return False
 
-        original_no = original_asset['no']
-        
-        found = False
-        for i, asset in enumerate(self.assets[tab_name]):
-            if 'no' in asset and asset['no'] == original_no:
-                # 'no' 필드를 제외한 나머지 필드를 업데이트
-                updated_asset_with_no = updated_asset_data.copy()
-                updated_asset_with_no['no'] = original_no # 기존 'no' 유지
-                
-                # 만기일이 빈 문자열이면 제거
-                if '만기일' in updated_asset_with_no and not updated_asset_with_no['만기일'].strip():
-                    del updated_asset_with_no['만기일']
-                elif '만기일' not in updated_asset_with_no:
-                     # 만기일이 아예 없으면 (예: 폼에서 입력하지 않은 경우) 기존 데이터에서 만기일이 있다면 제거
-                    if '만기일' in self.assets[tab_name][i]:
-                        del self.assets[tab_name][i]['만기일']
-
-
-                self.assets[tab_name][i] = updated_asset_with_no
-                found = True
-                break
-        
-        if found:
-            self._save_data()
-            self.data_changed.emit(tab_name)
+        if self.update_assets(tab_name, [(original_asset, updated_asset_data)]):
             return True
-        else:
-            print(f"자산 번호 '{original_no}'를 탭 '{tab_name}'에서 찾을 수 없습니다.")
-            return False
+        print(f"자산 번호 '{original_asset['no']}'를 탭 '{tab_name}'에서 찾을 수 없습니다.")
+        return False
+
+    @_synchronized
+    def update_assets(self, tab_name, updates):
+        """
+        지정된 탭의 여러 자산을 한 번에 업데이트합니다.
+        updates: [(원본 자산, 수정된 자산 데이터), ...]. 원본 자산의 'no'로 대상을 찾습니다.
+        파일 저장과 data_changed 시그널은 한 번만 발생하며, 업데이트된 자산 수를 반환합니다.
+        """
+        if tab_name not in self.assets:
+            print(f"경고: 탭 '{tab_name}'가 존재하지 않습니다.")
+            return 0
+
+        tab_assets = self.assets[tab_name]
+        hash_before = self._content_hashes.tab_hash(tab_name)
+        # 'no' -> 리스트 위치 매핑을 한 번만 구축하여 각 업데이트를 O(1)로 처리
+        positions = {asset['no']: i for i, asset in enumerate(tab_assets) if 'no' in asset}
+
+        changes = []
+        for original_asset, updated_asset_data in updates:
+            original_no = original_asset.get('no')
+            i = positions.get(original_no)
+            if i is None:
+                continue
+            # 'no' 필드를 제외한 나머지 필드를 업데이트
+            updated_asset_with_no = updated_asset_data.copy()
+            updated_asset_with_no['no'] = original_no # 기존 'no' 유지
+
+            # 만기일이 빈 문자열이면 제거
+            # (만기일이 아예 없는 경우 기존 자산 딕셔너리를 통째로 교체하므로 별도 처리 불필요)
+            if '만기일' in updated_asset_with_no and not str(updated_asset_with_no['만기일']).strip():
+                del updated_asset_with_no['만기일']
+
+            changes.append((tab_assets[i], updated_asset_with_no))
+            tab_assets[i] = updated_asset_with_no
+
+        if not changes:
+            return 0
+        self._notify_assets_updated(tab_name, changes)
+        if self._content_hashes.tab_hash(tab_name) == hash_before:
+            return len(changes) # 내용이 그대로이면 기록/저장/화면 갱신 생략
+        self._record(UpdateAssetsCommand(tab_name, changes))
+        self._save_data()
+        self.data_changed.emit(tab_name)
+        return len(changes)
 
     def delete_assets(self, tab_name, assets_to_delete):
         """
         지정된 탭에서 선택된 여러 자산을 'no' 필드를 기준으로 삭제합니다.
         """
+        # 삭제할 자산의 'no' 값만 모아 delete_assets_by_no로 처리합니다.
+        return self.delete_assets_by_no(tab_name, [asset['no'] for asset in assets_to_delete if 'no' in asset])
+
+    @_synchronized
+    def delete_assets_by_no(self, tab_name, nos):
+        """지정된 탭에서 'no'가 nos에 포함된 자산들을 삭제합니다."""
         if tab_name not in self.assets:
             print(f"경고: 탭 '{tab_name}'가 존재하지 않아 자산을 삭제할 수 없습니다.")
             return False
 
-        original_asset_list = self.assets[tab_name]
-        updated_asset_list = []
-        deleted_count = 0
-        
-        # 삭제할 자산의 'no' 값만 집합으로 만듭니다.
-        nos_to_delete = {asset['no'] for asset in assets_to_delete if 'no' in asset}
-
-        for asset in original_asset_list:
-            if 'no' in asset and asset['no'] in nos_to_delete:
-                deleted_count += 1
-            else:
-                updated_asset_list.append(asset)
-        
-        self.assets[tab_name] = updated_asset_list
+        nos_to_delete = set(nos)
+        # 삭제된 행은 원래 위치와 함께 실행 취소 기록으로 보관됩니다.
+        removed_rows = self._remove_assets_by_no(tab_name, nos_to_delete)
+        if not removed_rows:
+            return False # 일치하는 자산이 없으면 저장/화면 갱신 생략
+        self._record(RemoveAssetsCommand(tab_name, removed_rows))
         self._save_data()
         self.data_changed.emit(tab_name)
         
-        return deleted_count > 0 # 하나라도 삭제되었으면 True 반환
+        return len(removed_rows) > 0 # 하나라도 삭제되었으면 True 반환
 
 
     def get_total_amount_by_tab(self, tab_name):
-        """특정 탭의 모든 자산 금액을 합산하여 반환합니다."""
-        total = 0
-        for asset in self.assets.get(tab_name, []):
-            try:
-                # '금액' 필드가 문자열일 경우 숫자만 추출하여 변환
-                amount_str = str(asset.get('금액', '0')).replace(',', '').strip()
-                total += int(amount_str)
-            except ValueError:
-                print(f"경고: 유효하지 않은 금액 데이터가 발견되었습니다: {asset.get('금액')}")
-                continue
-        return total
+        """
+        특정 탭의 모든 자산 금액을 원화로 환산한 합계를 반환합니다.
+        (집계 엔진이 통화별로 증분 유지, 유효하지 않은 금액과 환율이 없는 통화는 제외)
+        """
+        return self._aggregation.tab_total(tab_name)
+
+    def get_currency_totals_by_tab(self, tab_name):
+        """특정 탭의 통화별 합계 {통화 코드: 원래 통화 기준 합계}를 반환합니다."""
+        return self._aggregation.currency_totals(tab_name)
+
+    def get_group_summary(self, dimension, tab_name=None):
+        """
+        dimension('자산 종류', '세부 분류', '만기월', '탭') 기준의 그룹별 집계를 반환합니다.
+        tab_name이 None이면 모든 탭을 합쳐 집계합니다. 결과는 합계 내림차순의 GroupSummary 리스트입니다.
+        """
+        return self._aggregation.summarize(dimension, tab_name)
+
+    def get_current_totals(self):
+        """현재 원화 합계 {'total': 전체, 'tabs': {탭 이름: 합계}, 'categories': {자산 종류: 합계}}를 반환합니다."""
+        tab_totals = {tab_name: self.get_total_amount_by_tab(tab_name) for tab_name in self.assets}
+        return {
+            'total': sum(tab_totals.values()),
+            'tabs': tab_totals,
+            'categories': {group.value: group.total for group in self.get_group_summary('자산 종류')},
+        }
+
+    @_synchronized
+    def take_snapshot(self, on_date=None):
+        """
+        모든 탭의 현재 상태를 on_date(기본 오늘) 스냅샷으로 저장합니다. (같은 날짜는 덮어씀)
+        전체/탭별/자산 종류별 원화 합계도 함께 기록합니다. 성공하면 True를 반환합니다.
+        """
+        try:
+            self.snapshot_store.take_snapshot(self.assets, self.get_current_totals(), on_date)
+        except (OSError, ValueError) as e:
+            print(f"스냅샷 저장 중 오류 발생: {e}")
+            return False
+        self._snapshot_stale = False
+        self.snapshot_taken.emit()
+        return True
+
+    def take_daily_snapshot(self):
+        """오늘 스냅샷이 아직 없으면 저장합니다."""
+        if not self.snapshot_store.has_snapshot(date.today()):
+            self.take_snapshot()
+
+    @_synchronized
+    def refresh_snapshot(self, on_date):
+        """
+        on_date 스냅샷이 마지막 스냅샷이고 그 뒤로 데이터가 바뀌었으면 현재 상태로 다시 저장합니다.
+        종료 직전과 자정 직후에 호출해 그날의 마지막 상태가 기록되도록 합니다.
+        """
+        entries = self.snapshot_store.entries()
+        if self._snapshot_stale and entries and entries[-1]['date'] == on_date.isoformat():
+            self.take_snapshot(on_date)
+
+    def get_snapshot(self, on_date):
+        """on_date(datetime.date) 시점의 {탭 이름: [자산, ...]}을 복원합니다. 이전 스냅샷이 없으면 None입니다."""
+        try:
+            return self.snapshot_store.load_snapshot(on_date)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"스냅샷 복원 중 오류 발생: {e}")
+            return None
+
+    def get_snapshot_history(self):
+        """스냅샷 목록 [{'date', 'kind', 'totals'}, ...]을 날짜 순으로 반환합니다."""
+        return self.snapshot_store.entries()
 
-    def export_data_to_csv(self, tab_name, file_path):
+    def export_data_to_file(self, tab_name, file_path):
         """
-        현재 탭의 자산 데이터를 CSV 파일로 내보냅니다.
-        'no' 필드는 CSV에 포함하지 않습니다.
+        현재 탭의 자산 데이터를 파일 확장자에 맞는 형식(CSV, XLSX, JSONL, Parquet)으로 내보냅니다.
+        'no' 필드는 포함하지 않습니다. 탭 스냅샷을 읽으므로 백그라운드 스레드에서 실행해도 됩니다.
         """
-        assets = self.assets.get(tab_name, [])
+        snapshot = self.get_tab_snapshot(tab_name)
+        assets = snapshot.assets if snapshot else ()
         if not assets:
             print(f"경고: 탭 '{tab_name}'에 내보낼 자산 데이터가 없습니다.")
             return False
 
-        # CSV 헤더 (No. 필드 제외)
-        headers = ["자산 종류", "세부 분류", "자산 명", "금액", "만기일", "알림", "비고"]
-
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=headers)
-                writer.writeheader()
-                for asset in assets:
-                    # 'no' 필드를 제외한 딕셔너리 생성
-                    row_data = {k: v for k, v in asset.items() if k != 'no'}
-                    writer.writerow(row_data)
+            write_assets(file_path, assets)
             return True
         except Exception as e:
-            print(f"CSV 파일 내보내기 중 오류 발생: {e}")
+            print(f"파일 내보내기 중 오류 발생: {e}")
             return False
 
-    def import_data_from_csv(self, tab_name, file_path, clear_existing=False):
+    def plan_import_upsert(self, tab_name, file_path, key_fields=DEFAULT_UPSERT_KEY_FIELDS):
+        """
+        파일(CSV, XLSX, JSONL, Parquet)을 tab_name 탭에 병합할 계획(UpsertPlan)을 만듭니다. 데이터는 바꾸지 않습니다.
+        탭의 자산을 key_fields 값으로 해시 인덱스에 담은 뒤 각 행을 한 번만 보고
+        추가(키 없음)/갱신(키 있음, 내용 다름)/변경 없음으로 분류합니다. (O(탭 크기 + 행 수))
+        탭 스냅샷을 읽으므로 백그라운드 스레드에서 실행해도 됩니다. 실패하면 None을 반환합니다.
         """
-        CSV 파일에서 자산 데이터를 지정된 탭으로 가져옵니다.
+        snapshot = self.get_tab_snapshot(tab_name)
+        if snapshot is None:
+            print(f"오류: 탭 '{tab_name}'이(가) 존재하지 않습니다.")
+            return None
+        try:
+            batches = read_assets(file_path, make_transformer=self.import_profiles.compile_for_header)
+            imported_assets = [asset_data for batch in batches for asset_data in batch]
+        except FileNotFoundError:
+            print(f"오류: 파일 '{file_path}'를 찾을 수 없습니다.")
+            return None
+        except Exception as e:
+            print(f"파일 가져오기 중 오류 발생: {e}")
+            return None
+
+        existing_by_key = {}
+        for asset in snapshot.assets:
+            existing_by_key.setdefault(_upsert_key(asset, key_fields), asset) # 키가 같은 기존 자산은 앞의 것 기준
+
+        # 파일 안에서 키가 중복되면 뒤의 행이 앞의 행을 대체
+        incoming_by_key = {}
+        for asset_data in imported_assets:
+            incoming_by_key[_upsert_key(asset_data, key_fields)] = asset_data
+        duplicates = len(imported_assets) - len(incoming_by_key)
+
+        inserts, updates, unchanged = [], [], 0
+        for key, asset_data in incoming_by_key.items():
+            current_asset = existing_by_key.get(key)
+            if current_asset is None:
+                inserts.append(asset_data)
+            elif _comparable_fields(current_asset) == _comparable_fields(asset_data):
+                unchanged += 1
+            else:
+                replacement = dict(current_asset, **asset_data) # 가져오기 항목에 없는 필드는 기존 값 유지
+                if not str(replacement.get('만기일', '')).strip():
+                    replacement.pop('만기일', None)
+                updates.append((current_asset, replacement))
+        return UpsertPlan(tab_name, inserts, updates, unchanged, duplicates, snapshot.version)
+
+    @_synchronized
+    def apply_import_upsert(self, plan):
+        """
+        plan_import_upsert로 만든 계획의 차이만 적용합니다. 갱신과 추가는 실행 취소 한 번으로 되돌릴 수 있으며
+        저장과 data_changed 시그널은 한 번만 발생합니다. (추가 수, 갱신 수)를 반환합니다.
+        계획을 만든 뒤 탭이 변경되었으면(스냅샷 버전이 다르면) 적용하지 않고 None을 반환합니다.
+        """
+        tab_name = plan.tab_name
+        snapshot = self.get_tab_snapshot(tab_name)
+        if snapshot is None or snapshot.version != plan.version:
+            print(f"경고: 병합 계획을 만든 뒤 탭 '{tab_name}'이(가) 변경되어 적용하지 않습니다. 다시 시도하세요.")
+            return None
+        if not (plan.inserts or plan.updates):
+            return 0, 0
+
+        commands = []
+        if plan.updates:
+            self._replace_assets(tab_name, plan.updates)
+            commands.append(UpdateAssetsCommand(tab_name, plan.updates))
+        new_assets = [self._prepare_new_asset(asset_data) for asset_data in plan.inserts]
+        if new_assets:
+            self._append_assets(tab_name, new_assets)
+            commands.append(AddAssetsCommand(tab_name, new_assets))
+        self._record(CompositeCommand("병합 가져오기", commands))
+        self._save_data()
+        self.data_changed.emit(tab_name)
+        return len(new_assets), len(plan.updates)
+
+    @_synchronized
+    def import_data_from_file(self, tab_name, file_path, clear_existing=False, batch_size=5000):
+        """
+        파일(CSV, XLSX, JSONL, Parquet)에서 자산 데이터를 지정된 탭으로 가져옵니다.
+        열 매핑은 파일 헤더로 자동 선택한 가져오기 프로필을 따릅니다. (import_profiles.last_detected)
         clear_existing이 True이면 기존 데이터를 삭제하고 가져옵니다.
+        행은 batch_size개씩 읽어 바로 탭에 추가하며, 도중에 오류가 나면 가져오기 전 상태로 되돌립니다.
+        실행 취소 기록, 저장, data_changed 시그널은 마지막에 한 번만 발생합니다.
         """
         if tab_name not in self.assets:
             print(f"오류: 탭 '{tab_name}'이(가) 존재하지 않습니다.")
             return False
 
+        hash_before = self._content_hashes.tab_hash(tab_name)
+        removed_rows = []
         imported_assets = []
         try:
-            with open(file_path, 'r', newline='', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # CSV 열 이름과 내부 딕셔너리 키를 매핑하여 처리
-                    # 필요한 경우 여기서 데이터 유효성 검사 및 타입 변환 수행
-                    asset_data = {
-                        "자산 종류": row.get("자산 종류", ""),
-                        "세부 분류": row.get("세부 분류", ""),
-                        "자산 명": row.get("자산 명", ""),
-                        "금액": row.get("금액", "0").replace(',', ''), # 금액은 문자열로 읽어와 숫자만 남김
-                        "만기일": row.get("만기일", ""),
-                        "알림": row.get("알림", ""),
-                        "비고": row.get("비고", "")
-                    }
-                    imported_assets.append(asset_data)
-            
+            batches = read_assets(file_path, batch_size, self.import_profiles.compile_for_header)
             if clear_existing:
-                self.assets[tab_name] = [] # 기존 데이터 삭제
-            
-            # 가져온 각 자산에 새로운 'no' 번호를 할당하여 추가
-            for asset in imported_assets:
-                self.last_no += 1
-                asset['no'] = self.last_no
-                self.assets[tab_name].append(asset)
-
-            self._save_data()
-            self.data_changed.emit(tab_name)
-            return True
-
-        except FileNotFoundError:
-            print(f"오류: CSV 파일 '{file_path}'를 찾을 수 없습니다.")
-            return False
+                # 기존 데이터 삭제 (실행 취소 시 원래 위치로 복원)
+                existing_nos = {asset['no'] for asset in self.assets[tab_name] if 'no' in asset}
+                removed_rows = self._remove_assets_by_no(tab_name, existing_nos)
+
+            for batch in batches:
+                # 가져온 각 자산에 새로운 'no' 번호를 할당하여 추가
+                new_assets = [self._prepare_new_asset(asset_data) for asset_data in batch]
+                self._append_assets(tab_name, new_assets)
+                imported_assets.extend(new_assets)
         except Exception as e:
-            print(f"CSV 파일 가져오기 중 오류 발생: {e}")
+            if isinstance(e, FileNotFoundError):
+                print(f"오류: 파일 '{file_path}'를 찾을 수 없습니다.")
+            else:
+                print(f"파일 가져오기 중 오류 발생: {e}")
+            # 이미 추가한 배치와 삭제한 기존 데이터를 되돌림
+            if imported_assets:
+                self._remove_appended_assets(tab_name, imported_assets)
+            if removed_rows:
+                self._insert_assets_at(tab_name, removed_rows)
             return False
 
+        if self._content_hashes.tab_hash(tab_name) == hash_before:
+            return True # 빈 파일을 가져온 경우 등 내용이 그대로이면 기록/저장/화면 갱신 생략
+        commands = []
+        if removed_rows:
+            commands.append(RemoveAssetsCommand(tab_name, removed_rows))
+        commands.append(AddAssetsCommand(tab_name, imported_assets))
+        self._record(CompositeCommand("파일 가져오기", commands))
+        self._save_data()
+        self.data_changed.emit(tab_name)
+        return True
@@ -0,0 +1,244 @@
+import csv
+import json
+import os
+from datetime import date, datetime
+
+from utils import DEFAULT_CURRENCY
+
+try:
+    import openpyxl # 선택 의존성: XLSX 가져오기/내보내기에만 필요
+except ImportError:
+    openpyxl = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet # 선택 의존성: Parquet 가져오기/내보내기에만 필요
+except ImportError:
+    pyarrow = None
+
+# 가져오기/내보내기 항목 (No. 필드 제외)
+ASSET_FIELDS = ["자산 종류", "세부 분류", "자산 명", "금액", "통화", "만기일", "알림", "비고"]
+
+# --- 정규화 ---
+def cell_text(value):
+    """셀 값을 텍스트로 정규화합니다. (날짜 셀은 YYYY-MM-DD, 정수 값의 실수는 정수 표기)"""
+    if type(value) is str: # CSV/JSONL의 대부분의 값
+        return value.strip()
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d") # XLSX/Parquet의 날짜 셀
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) # XLSX 숫자 셀의 1000.0
+    return str(value).strip()
+
+def make_row_normalizer(header):
+    """
+    헤더(열 이름 리스트)로부터 행(튜플/리스트) -> 자산 데이터 딕셔너리 변환 함수를 만듭니다.
+    열 위치는 파일마다 한 번만 찾고, 행마다 위치로 값을 꺼내 텍스트로 정규화합니다.
+    (금액은 콤마 제거, 통화는 대문자/기본값, 없는 열이나 값(None)은 빈 문자열, 금액은 "0")
+    """
+    positions = {str(name).strip(): i for i, name in enumerate(header) if name is not None}
+    field_positions = [(field, positions.get(field), "0" if field == "금액" else "") for field in ASSET_FIELDS]
+
+    def normalize(row):
+        asset_data = {}
+        for field, position, default in field_positions:
+            value = row[position] if position is not None and position < len(row) else None
+            asset_data[field] = default if value is None else cell_text(value)
+        asset_data["금액"] = asset_data["금액"].replace(',', '') # 금액은 문자열로 읽어와 숫자만 남김
+        asset_data["통화"] = asset_data["통화"].upper() or DEFAULT_CURRENCY
+        return asset_data
+
+    return normalize
+
+def asset_row(asset):
+    """내보내기용 행 (ASSET_FIELDS 순서, 통화는 기본값 포함)"""
+    return [asset.get(field, "") if field != "통화" else asset.get("통화") or DEFAULT_CURRENCY for field in ASSET_FIELDS]
+
+
+# --- 형식 ---
+class AssetFileFormat:
+    """
+    가져오기/내보내기 파일 형식의 기본 클래스입니다.
+    read(file_path)는 (헤더 리스트, 행 이터레이터)를 반환하며 행은 파일을 읽어 나가며 하나씩 만들어집니다.
+    write(file_path, rows)는 ASSET_FIELDS 헤더와 행들을 씁니다.
+    """
+    name = ""
+    extensions = ()
+    requirement = None # 필요한 선택 패키지 이름 (없으면 None)
+
+    def available(self):
+        return True
+
+    def read(self, file_path):
+        raise NotImplementedError
+
+    def write(self, file_path, rows):
+        raise NotImplementedError
+
+
+class CsvFormat(AssetFileFormat):
+    name = "CSV 파일"
+    extensions = (".csv",)
+
+    def read(self, file_path):
+        # 헤더는 따로 읽고 행은 제너레이터 안에서 파일을 열므로, 오류가 나거나 행을 읽지 않아도 파일이 열린 채 남지 않음
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+            header = next(csv.reader(csvfile), [])
+
+        def rows():
+            with open(file_path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+                reader = csv.reader(csvfile)
+                next(reader, None) # 헤더
+                yield from reader
+
+        return header, rows()
+
+    def write(self, file_path, rows):
+        with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(ASSET_FIELDS)
+            writer.writerows(rows)
+
+
+class JsonLinesFormat(AssetFileFormat):
+    """한 줄에 자산 하나의 JSON 객체. 헤더는 ASSET_FIELDS이며 없는 키는 빈 값입니다."""
+    name = "JSON Lines"
+    extensions = (".jsonl", ".ndjson")
+
+    def read(self, file_path):
+        def rows():
+            with open(file_path, 'r', encoding='utf-8-sig') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        record = json.loads(line)
+                        yield [record.get(field) for field in ASSET_FIELDS]
+
+        return list(ASSET_FIELDS), rows()
+
+    def write(self, file_path, rows):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(dict(zip(ASSET_FIELDS, row)), ensure_ascii=False))
+                f.write("\n")
+
+
+class XlsxFormat(AssetFileFormat):
+    """첫 번째 시트의 첫 행을 헤더로 읽습니다. (openpyxl 읽기 전용 모드로 행 단위 스트리밍)"""
+    name = "Excel 통합 문서"
+    extensions = (".xlsx",)
+    requirement = "openpyxl"
+
+    def available(self):
+        return openpyxl is not None
+
+    def read(self, file_path):
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        row_iter = workbook.worksheets[0].iter_rows(values_only=True)
+        header = list(next(row_iter, ()))
+
+        def rows():
+            try:
+                yield from row_iter
+            finally:
+                workbook.close()
+
+        return header, rows()
+
+    def write(self, file_path, rows):
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("자산")
+        sheet.append(ASSET_FIELDS)
+        for row in rows:
+            sheet.append(row)
+        workbook.save(file_path)
+
+
+class ParquetFormat(AssetFileFormat):
+    """pyarrow로 레코드 배치 단위(BATCH_SIZE행)로 읽어 행으로 풀어냅니다."""
+    name = "Parquet"
+    extensions = (".parquet",)
+    requirement = "pyarrow"
+    BATCH_SIZE = 8192
+
+    def available(self):
+        return pyarrow is not None
+
+    def read(self, file_path):
+        parquet_file = pyarrow.parquet.ParquetFile(file_path)
+
+        def rows():
+            for batch in parquet_file.iter_batches(batch_size=self.BATCH_SIZE):
+                yield from zip(*(column.to_pylist() for column in batch.columns))
+
+        return list(parquet_file.schema_arrow.names), rows()
+
+    def write(self, file_path, rows):
+        columns = list(zip(*rows)) or [()] * len(ASSET_FIELDS)
+        table = pyarrow.table({field: pyarrow.array([cell_text(value) for value in column], type=pyarrow.string())
+                               for field, column in zip(ASSET_FIELDS, columns)})
+        pyarrow.parquet.write_table(table, file_path)
+
+
+# --- 등록 ---
+_FORMATS = [] # 등록 순서 (파일 대화 상자 필터 순서)
+
+def register_format(file_format):
+    """가져오기/내보내기 형식을 등록합니다."""
+    _FORMATS.append(file_format)
+    return file_format
+
+def available_formats():
+    """현재 환경에서 사용할 수 있는 (선택 패키지가 설치된) 형식 목록"""
+    return [file_format for file_format in _FORMATS if file_format.available()]
+
+def format_for_path(file_path):
+    """파일 확장자에 맞는 형식을 반환합니다. 알 수 없는 확장자면 ValueError, 패키지가 없으면 RuntimeError."""
+    extension = os.path.splitext(file_path)[1].lower()
+    for file_format in _FORMATS:
+        if extension in file_format.extensions:
+            if not file_format.available():
+                raise RuntimeError(f"{file_format.name} 형식에는 {file_format.requirement} 패키지가 필요합니다. (pip install {file_format.requirement})")
+            return file_format
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {extension or '(확장자 없음)'}")
+
+def file_dialog_filter():
+    """QFileDialog용 필터 문자열 (사용 가능한 형식 + 모든 파일)"""
+    filters = [f"{file_format.name} ({' '.join('*' + extension for extension in file_format.extensions)})"
+               for file_format in available_formats()]
+    return ";;".join(filters + ["모든 파일 (*)"])
+
+def read_assets(file_path, batch_size=5000, make_transformer=make_row_normalizer):
+    """
+    파일을 읽어 정규화된 자산 데이터 딕셔너리 리스트를 batch_size개씩 내보내는 제너레이터입니다.
+    ('no' 미할당)
+    make_transformer: 헤더 -> 행 변환 함수. 변환 함수가 None을 반환한 행은 건너뜁니다.
+    (기본은 ASSET_FIELDS 이름의 열을 읽는 make_row_normalizer, 가져오기 프로필은 import_profiles 참고)
+    """
+    header, rows = format_for_path(file_path).read(file_path)
+    transform = make_transformer(header)
+    batch = []
+    for row in rows:
+        if not any(value not in (None, "") for value in row):
+            continue # 빈 행
+        asset_data = transform(row)
+        if asset_data is None:
+            continue
+        batch.append(asset_data)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def write_assets(file_path, assets):
+    """자산 리스트를 파일 확장자에 맞는 형식으로 내보냅니다."""
+    format_for_path(file_path).write(file_path, (asset_row(asset) for asset in assets))
+
+
+register_format(CsvFormat())
+register_format(XlsxFormat())
+register_format(JsonLinesFormat())
+register_format(ParquetFormat())
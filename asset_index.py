@@ -0,0 +1,40 @@
+class AssetIndex:
+    """
+    AssetDataManager의 데이터 변경을 통보받아 증분으로 유지되는 인덱스의 기본 클래스입니다.
+    AssetDataManager.register_index()로 등록하면 전체 데이터로 한 번 구축된 뒤,
+    이후에는 추가/삭제/수정된 자산만 전달받습니다.
+    """
+
+    def rebuild(self, assets_by_tab):
+        """전체 데이터({탭이름: [자산, ...]})로 인덱스를 처음부터 다시 구축합니다."""
+        self.clear()
+        for tab_name, assets in assets_by_tab.items():
+            self.assets_added(tab_name, assets)
+
+    def clear(self):
+        """인덱스를 비웁니다."""
+        pass
+
+    def assets_added(self, tab_name, assets):
+        """tab_name 탭에 assets가 추가되었을 때 호출됩니다."""
+        pass
+
+    def assets_removed(self, tab_name, assets):
+        """tab_name 탭에서 assets가 삭제되었을 때 호출됩니다."""
+        pass
+
+    def assets_updated(self, tab_name, changes):
+        """
+        tab_name 탭의 자산이 수정되었을 때 호출됩니다.
+        changes: [(이전 자산, 새 자산), ...]. 기본 구현은 삭제 후 추가로 처리합니다.
+        """
+        self.assets_removed(tab_name, [old for old, _ in changes])
+        self.assets_added(tab_name, [new for _, new in changes])
+
+    def tab_removed(self, tab_name, assets):
+        """탭이 삭제되었을 때 호출됩니다. 기본 구현은 탭의 모든 자산 삭제로 처리합니다."""
+        self.assets_removed(tab_name, assets)
+
+    def tab_renamed(self, old_name, new_name):
+        """탭 이름이 변경되었을 때 호출됩니다."""
+        pass
@@ -0,0 +1,167 @@
+from datetime import date
+
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QApplication
+from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import QColor, QFontMetrics, QStaticText, QTransform, QPalette
+
+from utils import format_currency
+from asset_table_model import AMOUNT_COLUMN, D_DAY_COLUMN, AMOUNT_ROLE, DUE_ORDINAL_ROLE, CURRENCY_ROLE, INVALID_DATE
+
+class AssetItemDelegate(QStyledItemDelegate):
+    """
+    자산 테이블의 셀을 그리는 델리게이트입니다.
+    금액과 D-Day는 모델이 제공하는 원시 정수(AMOUNT_ROLE, DUE_ORDINAL_ROLE)로부터 그릴 때 포맷하며,
+    값별로 미리 배치된 QStaticText를 캐시하므로 화면에 보이는 셀만 포맷/레이아웃 비용이 듭니다.
+    만기가 지났거나 임박한 행은 아이템 브러시 없이 paint에서 배경색을 칠합니다.
+    """
+    NEAR_MATURITY_DAYS = 30 # 이 일수 이내로 남은 자산은 '만기 임박'으로 표시
+    MAX_CACHED_TEXTS = 4096 # 캐시할 QStaticText 최대 개수
+
+    OVERDUE_ROW_COLOR = QColor("#fdecea") # 만기 경과 행 배경
+    NEAR_ROW_COLOR = QColor("#fff8e1") # 만기 임박 행 배경
+    OVERDUE_BADGE_COLOR = QColor("#dc3545") # Red
+    TODAY_BADGE_COLOR = QColor("#ffc107") # Orange
+    NEAR_BADGE_COLOR = QColor("#fd7e14")
+    FUTURE_BADGE_COLOR = QColor("#28a745") # Green
+
+    def __init__(self, parent=None, amount_column=AMOUNT_COLUMN, d_day_column=D_DAY_COLUMN):
+        super().__init__(parent)
+        self.amount_column = amount_column
+        self.d_day_column = d_day_column
+        self._static_texts = {} # (폰트 키, 표시 문자열) -> QStaticText
+        self._amount_texts = {} # (금액, 통화) -> 표시 문자열
+        self._metrics_font_key = None
+        self._metrics = None
+        self._today_ordinal = date.today().toordinal()
+
+    def set_today(self, today_ordinal):
+        """D-Day 계산 기준일(날짜 서수)을 설정합니다. 자정이 지나면 호출하여 다시 그리도록 합니다."""
+        self._today_ordinal = today_ordinal
+
+    def _font_metrics(self, font):
+        """폰트별 QFontMetrics를 캐시합니다."""
+        font_key = font.key()
+        if font_key != self._metrics_font_key:
+            self._metrics_font_key = font_key
+            self._metrics = QFontMetrics(font)
+        return self._metrics
+
+    def _static_text(self, text, font):
+        """표시 문자열별로 레이아웃이 완료된 QStaticText를 반환합니다."""
+        cache_key = (font.key(), text)
+        static_text = self._static_texts.get(cache_key)
+        if static_text is None:
+            if len(self._static_texts) >= self.MAX_CACHED_TEXTS:
+                self._static_texts.clear()
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(QTransform(), font)
+            self._static_texts[cache_key] = static_text
+        return static_text
+
+    def _amount_text(self, amount, currency):
+        cache_key = (amount, currency)
+        text = self._amount_texts.get(cache_key)
+        if text is None:
+            if len(self._amount_texts) >= self.MAX_CACHED_TEXTS:
+                self._amount_texts.clear()
+            text = format_currency(amount, currency)
+            self._amount_texts[cache_key] = text
+        return text
+
+    def _days_left(self, due_ordinal):
+        if due_ordinal is None or due_ordinal == INVALID_DATE:
+            return None
+        return due_ordinal - self._today_ordinal
+
+    def paint(self, painter, option, index):
+        days_left = self._days_left(index.data(DUE_ORDINAL_ROLE))
+        selected = bool(option.state & QStyle.State_Selected)
+
+        # 만기 경과/임박 행 배경 (선택된 행은 선택 색상 유지)
+        if days_left is not None and not selected:
+            if days_left < 0:
+                painter.fillRect(option.rect, self.OVERDUE_ROW_COLOR)
+            elif days_left <= self.NEAR_MATURITY_DAYS:
+                painter.fillRect(option.rect, self.NEAR_ROW_COLOR)
+
+        column = index.column()
+        if column == self.amount_column:
+            self._paint_panel(painter, option, index)
+            amount = index.data(AMOUNT_ROLE)
+            text = self._amount_text(amount, index.data(CURRENCY_ROLE)) if amount is not None else index.data(Qt.DisplayRole)
+            self._paint_text(painter, option, text, Qt.AlignRight, selected)
+        elif column == self.d_day_column:
+            self._paint_panel(painter, option, index)
+            self._paint_d_day_badge(painter, option, index.data(DUE_ORDINAL_ROLE), days_left)
+        else:
+            super().paint(painter, option, index)
+
+    def _paint_panel(self, painter, option, index):
+        """
+        텍스트 없이 셀 배경(선택/포커스 표시)만 스타일로 그립니다.
+        initStyleOption은 DisplayRole을 조회하여 모델이 셀마다 문자열을 포맷하게 하므로 호출하지 않고,
+        뷰가 넘겨준 상태(선택/포커스/교차 행 색상)만 그대로 사용합니다.
+        """
+        panel_option = type(option)(option)
+        panel_option.index = index
+        panel_option.text = ""
+        style = panel_option.widget.style() if panel_option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, panel_option, painter, panel_option.widget)
+
+    def _paint_text(self, painter, option, text, horizontal_alignment, selected, color=None):
+        if not text:
+            return
+        static_text = self._static_text(text, option.font)
+        metrics = self._font_metrics(option.font)
+        rect = option.rect.adjusted(6, 0, -6, 0)
+        text_width = static_text.size().width()
+        if horizontal_alignment == Qt.AlignRight:
+            x = rect.right() - text_width
+        else:
+            x = rect.left() + (rect.width() - text_width) / 2
+        y = rect.top() + (rect.height() - metrics.height()) / 2
+
+        painter.save()
+        painter.setFont(option.font)
+        if color is not None:
+            painter.setPen(color)
+        else:
+            painter.setPen(option.palette.color(QPalette.HighlightedText if selected else QPalette.Text))
+        painter.drawStaticText(QPointF(x, y), static_text)
+        painter.restore()
+
+    def _paint_d_day_badge(self, painter, option, due_ordinal, days_left):
+        """D-Day를 색상 배지로 그립니다. (경과: 빨강, 당일: 주황, 임박: 진한 주황, 여유: 초록)"""
+        if due_ordinal is None:
+            return # 만기일 없음
+        if days_left is None:
+            self._paint_text(painter, option, "날짜 오류", Qt.AlignCenter, bool(option.state & QStyle.State_Selected))
+            return
+
+        if days_left < 0:
+            text, badge_color = f"D+{abs(days_left)}", self.OVERDUE_BADGE_COLOR
+        elif days_left == 0:
+            text, badge_color = "D-0", self.TODAY_BADGE_COLOR
+        elif days_left <= self.NEAR_MATURITY_DAYS:
+            text, badge_color = f"D-{days_left}", self.NEAR_BADGE_COLOR
+        else:
+            text, badge_color = f"D-{days_left}", self.FUTURE_BADGE_COLOR
+
+        static_text = self._static_text(text, option.font)
+        metrics = self._font_metrics(option.font)
+        badge_width = static_text.size().width() + 12
+        badge_height = metrics.height() + 4
+        badge_rect = QRectF(option.rect.center().x() - badge_width / 2,
+                            option.rect.center().y() - badge_height / 2,
+                            badge_width, badge_height)
+
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(badge_color)
+        painter.drawRoundedRect(badge_rect, badge_height / 2, badge_height / 2)
+        painter.setPen(QColor("#ffffff"))
+        painter.setFont(option.font)
+        painter.drawStaticText(QPointF(badge_rect.left() + 6, badge_rect.top() + 2), static_text)
+        painter.restore()
@@ -0,0 +1,165 @@
+import json
+import os
+
+from asset_index import AssetIndex
+from content_hash import tab_digest
+
+class ShardedAssetStore(AssetIndex):
+    """
+    자산 데이터를 탭별 파일(샤드)로 나누어 저장하는 저장소입니다.
+      manifest.json   : 탭 순서와 탭 이름 -> 샤드 파일 이름
+      tab_0001.json...: 탭 하나의 {"hash": 내용 해시, "assets": 자산 리스트} (파일 이름은 탭 이름과 무관한 고정 번호)
+    AssetIndex로 등록되어 변경된 탭을 기록하므로 save()는 바뀐 탭의 샤드만 다시 쓰고,
+    탭 추가/삭제/이름 변경/순서 변경 시에만 manifest를 다시 씁니다. (이름 변경은 manifest만 씀)
+    변경된 탭이라도 내용 해시가 마지막으로 저장한 해시와 같으면 쓰지 않습니다.
+    """
+    MANIFEST_FILENAME = "manifest.json"
+
+    def __init__(self, directory="asset_data"):
+        self.directory = directory
+        self._shards = {} # 탭 이름 -> 샤드 파일 이름
+        self._next_shard_id = 1
+        self._saved_order = [] # manifest에 저장된 탭 순서
+        self._dirty_tabs = set() # 샤드를 다시 써야 하는 탭
+        self._saved_hashes = {} # 탭 이름 -> 샤드에 저장된 내용 해시 (해시 없는 이전 형식 샤드는 없음)
+        self._manifest_dirty = False
+        self._orphan_shards = set() # 삭제된 탭의 샤드 (manifest 저장 후 삭제)
+
+    def _path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def _write_json(self, filename, data, indent=None):
+        """
+        임시 파일에 쓴 뒤 교체하여 저장 도중 오류가 나도 기존 파일이 깨지지 않게 합니다.
+        샤드는 들여쓰기 없이 json.dumps(C 인코더)로 직렬화합니다. (json.dump나 들여쓰기는 순수 파이썬 인코더 사용)
+        """
+        temp_path = self._path(filename + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=indent, ensure_ascii=False))
+        os.replace(temp_path, self._path(filename))
+
+    def _allocate_shard(self, tab_name):
+        self._shards[tab_name] = f"tab_{self._next_shard_id:04d}.json"
+        self._next_shard_id += 1
+        self._manifest_dirty = True
+
+    def exists(self):
+        """manifest 파일이 있으면 True를 반환합니다."""
+        return os.path.exists(self._path(self.MANIFEST_FILENAME))
+
+    def load(self):
+        """manifest와 샤드를 읽어 {탭 이름: [자산, ...]}(manifest의 탭 순서)을 반환합니다."""
+        with open(self._path(self.MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self._next_shard_id = manifest.get('next_shard_id', 1)
+        self._shards = {}
+        self._saved_hashes = {}
+        assets_by_tab = {}
+        for tab in manifest.get('tabs', []):
+            tab_name, shard = tab['name'], tab['shard']
+            self._shards[tab_name] = shard
+            try:
+                with open(self._path(shard), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, list): # 해시 없는 샤드
+                    assets_by_tab[tab_name] = data
+                else:
+                    assets_by_tab[tab_name] = data['assets']
+                    self._saved_hashes[tab_name] = int(data['hash'], 16)
+            except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                print(f"탭 '{tab_name}' 데이터 파일 '{shard}'을(를) 읽을 수 없습니다: {e}. 빈 탭으로 시작합니다.")
+                assets_by_tab[tab_name] = []
+        self._saved_order = list(assets_by_tab)
+        self._dirty_tabs.clear()
+        self._manifest_dirty = False
+        return assets_by_tab
+
+    def saved_hash(self, tab_name):
+        """탭 샤드에 저장된 내용 해시 (해시가 없으면 None)"""
+        return self._saved_hashes.get(tab_name)
+
+    def migrate(self, assets_by_tab):
+        """단일 파일 형식에서 읽은 전체 데이터를 샤드 형식으로 모두 저장합니다."""
+        for tab_name in assets_by_tab:
+            if tab_name not in self._shards:
+                self._allocate_shard(tab_name)
+        self._dirty_tabs.update(assets_by_tab)
+        self.save(assets_by_tab, lambda tab_name: tab_digest(assets_by_tab[tab_name]))
+
+    def save(self, assets_by_tab, tab_hash):
+        """
+        변경된 탭의 샤드와 (필요하면) manifest만 저장하고, 쓴 파일 수를 반환합니다.
+        tab_hash: 탭 이름 -> 현재 내용 해시 (ContentHashIndex.tab_hash)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        written = 0
+        for tab_name in self._dirty_tabs:
+            if tab_name not in assets_by_tab:
+                continue
+            content_hash = tab_hash(tab_name)
+            if self._saved_hashes.get(tab_name) == content_hash:
+                continue # 변경 후 원래 내용으로 돌아온 탭
+            self._write_json(self._shards[tab_name], {'hash': f"{content_hash:016x}", 'assets': assets_by_tab[tab_name]})
+            self._saved_hashes[tab_name] = content_hash
+            written += 1
+
+        tab_order = list(assets_by_tab)
+        if self._manifest_dirty or tab_order != self._saved_order:
+            # 샤드를 모두 쓴 뒤 manifest를 교체하므로 manifest는 항상 존재하는 샤드만 가리킴
+            self._write_json(self.MANIFEST_FILENAME, {
+                'version': 1,
+                'next_shard_id': self._next_shard_id,
+                'tabs': [{'name': tab_name, 'shard': self._shards[tab_name]} for tab_name in tab_order],
+            }, indent=4)
+            written += 1
+            self._saved_order = tab_order
+            for shard in self._orphan_shards:
+                try:
+                    os.remove(self._path(shard))
+                except OSError:
+                    pass
+            self._orphan_shards.clear()
+
+        self._dirty_tabs.clear()
+        self._manifest_dirty = False
+        return written
+
+    # --- AssetIndex 구현 (변경된 탭 기록) ---
+    def rebuild(self, assets_by_tab):
+        # 등록 시점의 데이터는 이미 저장되어 있으므로 샤드가 없는 탭만 할당
+        for tab_name in assets_by_tab:
+            if tab_name not in self._shards:
+                self._allocate_shard(tab_name)
+                self._dirty_tabs.add(tab_name)
+
+    def clear(self):
+        self._shards.clear()
+        self._dirty_tabs.clear()
+        self._saved_hashes.clear()
+
+    def assets_added(self, tab_name, assets):
+        if tab_name not in self._shards:
+            self._allocate_shard(tab_name) # 새 탭 (또는 실행 취소로 복원된 탭)
+        self._dirty_tabs.add(tab_name)
+
+    def assets_removed(self, tab_name, assets):
+        self._dirty_tabs.add(tab_name)
+
+    def assets_updated(self, tab_name, changes):
+        self._dirty_tabs.add(tab_name)
+
+    def tab_removed(self, tab_name, assets):
+        self._orphan_shards.add(self._shards.pop(tab_name))
+        self._dirty_tabs.discard(tab_name)
+        self._saved_hashes.pop(tab_name, None)
+        self._manifest_dirty = True
+
+    def tab_renamed(self, old_name, new_name):
+        # 샤드 파일 이름은 그대로 두고 manifest의 이름만 바꿈
+        self._shards[new_name] = self._shards.pop(old_name)
+        if old_name in self._saved_hashes:
+            self._saved_hashes[new_name] = self._saved_hashes.pop(old_name)
+        if old_name in self._dirty_tabs:
+            self._dirty_tabs.discard(old_name)
+            self._dirty_tabs.add(new_name)
+        self._manifest_dirty = True
@@ -0,0 +1,141 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from utils import calculate_d_day, format_currency, asset_currency
+from sort_index import amount_sort_key, due_date_sort_key
+
+# "No." 셀은 UI에서 제거되었으나, 내부 데이터 모델에는 'no' 필드가 유지되어 고유 식별자로 사용됩니다.
+COLUMN_HEADERS = ["자산 종류", "세부 분류", "자산 명", "금액", "만기일", "D-Day", "알림", "비고"]
+AMOUNT_COLUMN = 3
+D_DAY_COLUMN = 5
+
+# 델리게이트가 그릴 때 포맷할 수 있도록 원시 값을 제공하는 사용자 정의 역할
+AMOUNT_ROLE = Qt.UserRole + 1 # 금액 정수 (숫자가 아니면 None)
+DUE_ORDINAL_ROLE = Qt.UserRole + 2 # 만기일 날짜 서수 (만기일이 없으면 None, 잘못된 날짜면 INVALID_DATE)
+INVALID_DATE = -1
+CURRENCY_ROLE = Qt.UserRole + 3 # 금액의 통화 코드
+
+def format_d_day(due_date_str):
+    """만기일 문자열을 'D-3' / 'D+10' 형식으로 변환합니다. 만기일이 없으면 빈 문자열입니다."""
+    if not due_date_str:
+        return ""
+    d_day = calculate_d_day(due_date_str)
+    if d_day is None:
+        return "날짜 오류"
+    return f"D-{d_day}" if d_day >= 0 else f"D+{abs(d_day)}"
+
+def format_cell(asset, column):
+    """자산 한 건의 특정 컬럼 표시 문자열을 반환합니다."""
+    if column == AMOUNT_COLUMN:
+        return format_currency(asset.get('금액', 0), asset_currency(asset))
+    if column == D_DAY_COLUMN:
+        return format_d_day(asset.get('만기일', ''))
+    return str(asset.get(COLUMN_HEADERS[column], ''))
+
+
+class AssetTableModel(QAbstractTableModel):
+    """
+    탭 하나의 자산 목록을 보여주는 테이블 모델입니다.
+    행은 자산 'no'의 순서 목록으로만 관리하며, 자산 데이터는 표시할 때 AssetDataManager에서 조회합니다.
+    canFetchMore/fetchMore로 FETCH_BATCH_SIZE 행씩 점진적으로 노출하므로
+    수십만 건의 탭도 처음에는 화면에 필요한 만큼만 뷰에 전달됩니다.
+    """
+    FETCH_BATCH_SIZE = 500
+
+    def __init__(self, asset_manager, tab_name, parent=None):
+        super().__init__(parent)
+        self.asset_manager = asset_manager
+        self.tab_name = tab_name
+        self._nos = [] # 정렬/필터가 적용된 전체 행의 자산 'no' 목록
+        self._loaded_count = 0 # 뷰에 노출된 행 수 (fetchMore로 증가)
+        self._row_by_no = None # 'no' -> 행 (필요할 때만 구축)
+
+    def set_rows(self, nos):
+        """표시할 자산 'no' 목록을 교체합니다. 첫 배치만 노출되고 나머지는 스크롤 시 fetchMore로 불러옵니다."""
+        self.beginResetModel()
+        self._nos = nos
+        self._loaded_count = min(len(nos), self.FETCH_BATCH_SIZE)
+        self._row_by_no = None
+        self.endResetModel()
+
+    def total_row_count(self):
+        """필터가 적용된 전체 행 수 (아직 불러오지 않은 행 포함)."""
+        return len(self._nos)
+
+    def no_at(self, row):
+        return self._nos[row]
+
+    def asset_at(self, row):
+        """행에 해당하는 자산 딕셔너리를 반환합니다."""
+        return self.asset_manager.get_asset_by_no(self.tab_name, self._nos[row])
+
+    def row_of_no(self, no):
+        """자산 'no'의 행 번호를 반환합니다. 아직 불러오지 않은 행이면 필요한 만큼 불러옵니다. 없으면 -1."""
+        if self._row_by_no is None:
+            self._row_by_no = {no: row for row, no in enumerate(self._nos)}
+        row = self._row_by_no.get(no, -1)
+        if row >= self._loaded_count:
+            self.beginInsertRows(QModelIndex(), self._loaded_count, row)
+            self._loaded_count = row + 1
+            self.endInsertRows()
+        return row
+
+    # --- QAbstractTableModel 구현 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded_count < len(self._nos)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH_SIZE, len(self._nos) - self._loaded_count)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_count, self._loaded_count + count - 1)
+        self._loaded_count += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded_count:
+            return None
+        if role == Qt.DisplayRole:
+            asset = self.asset_at(index.row())
+            return format_cell(asset, index.column()) if asset else ""
+        if role == Qt.TextAlignmentRole:
+            if index.column() == AMOUNT_COLUMN:
+                return int(Qt.AlignRight | Qt.AlignVCenter) # 금액 오른쪽 정렬
+            return int(Qt.AlignCenter | Qt.AlignVCenter)
+        if role == Qt.UserRole:
+            return self.asset_at(index.row()) # 전체 자산 딕셔너리 (no 포함)
+        if role == AMOUNT_ROLE:
+            asset = self.asset_at(index.row())
+            if not asset:
+                return None
+            missing, amount = amount_sort_key(asset)
+            return None if missing else amount
+        if role == CURRENCY_ROLE:
+            asset = self.asset_at(index.row())
+            return asset_currency(asset) if asset else None
+        if role == DUE_ORDINAL_ROLE:
+            # 행 단위 색상 표시에 쓰이므로 모든 컬럼에서 같은 값을 반환
+            asset = self.asset_at(index.row())
+            if not asset or not asset.get('만기일'):
+                return None
+            missing, due_ordinal = due_date_sort_key(asset)
+            return INVALID_DATE if missing else due_ordinal
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMN_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        # 모든 셀을 편집 불가능하게 설정 (더블 클릭 시 편집 다이얼로그로만 편집)
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
@@ -1,40 +1,50 @@
 from PyQt5.QtWidgets import (
-    QTreeWidget, QTreeWidgetItem, QHeaderView, QMenu, QMessageBox, QAbstractItemView
+    QTreeView, QHeaderView, QMenu, QMessageBox, QAbstractItemView
 )
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtGui import QFont
 
-from utils import calculate_d_day, format_currency
+from holdings_model import HoldingsModel
+from price_feed import AsyncPriceSource, apply_prices
+from quote_fetcher import QuoteFetchWorker
+from utils import DEFAULT_CURRENCY, asset_currency
 
-class AssetTreeView(QTreeWidget):
+class AssetTreeView(QTreeView):
     # 자산 추가/편집/삭제 요청 시그널
     add_asset_requested = pyqtSignal()
     edit_asset_requested = pyqtSignal()
     delete_asset_requested = pyqtSignal()
+    # 가격 일괄 적용 완료 시그널 (일치한 행 수, 다시 계산된 행 수)
+    prices_updated = pyqtSignal(int, int)
+    # 시세 조회 지연 시간 통계 (quote_fetcher.FetchMetrics.summary())
+    fetch_metrics_reported = pyqtSignal(dict)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection) # 다중 선택 가능
         self.setSelectionBehavior(QAbstractItemView.SelectRows) # 행 단위 선택
+        self.setRootIsDecorated(False) # 하위 항목이 없는 평면 목록
+        self.setUniformRowHeights(True) # 행마다 높이를 측정하지 않음
+
+        # 평가 금액/손익/수익률은 모델(ValuationEngine)이 계산하며, 가격 변경 시 바뀐 행만 다시 그림
+        self.holdings_model = HoldingsModel(self)
+        self.setModel(self.holdings_model)
+        self.asset_manager = None # 연결된 AssetDataManager (set_data_source 참고)
+        self.tab_name = None
 
         self._init_ui()
         self._connect_signals()
 
     def _init_ui(self):
-        self.setHeaderLabels([
-            "No.", "자산 이름", "수량", "매입 단가", "현재 단가",
-            "평가 금액", "수익률", "평가 손익", "매입일", "만기일", "D-Day", "메모"
-        ])
-        
-        # 헤더 설정
+        # 헤더 설정 (ResizeToContents는 가격 갱신 때마다 전체 행을 측정하므로 사용하지 않음)
         header = self.header()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents) # 내용에 맞게 크기 자동 조절
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setStretchLastSection(True) # 마지막 컬럼이 남은 공간 채우기
         header.setFont(QFont("맑은 고딕", 10, QFont.Bold)) # 헤더 폰트 설정
 
         # 특정 컬럼 너비 고정 (예시)
         header.setSectionResizeMode(0, QHeaderView.Fixed) # No. 컬럼 고정
-        header.setFixedWidth(50) 
+        header.resizeSection(0, 50)
         header.setSectionResizeMode(1, QHeaderView.Stretch) # 자산 이름 늘이기
 
         # TreeWidget 스타일링 (QSS에서 대부분 처리)
@@ -42,7 +52,7 @@ class AssetTreeView(QTreeWidget):
         self.setMouseTracking(True) # 마우스 오버 시 하이라이트 등 (QSS와 함께)
 
     def _connect_signals(self):
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.doubleClicked.connect(self._on_item_double_clicked)
         self.customContextMenuRequested.connect(self._show_context_menu)
         self.setContextMenuPolicy(Qt.CustomContextMenu) # 컨텍스트 메뉴 정책 설정
         # Enter 키 눌렀을 때 편집 다이얼로그 띄우기
@@ -57,7 +67,7 @@ class AssetTreeView(QTreeWidget):
         else:
             super().keyPressEvent(event) # 기본 동작 유지
 
-    def _on_item_double_clicked(self, item, column):
+    def _on_item_double_clicked(self, index):
         """항목 더블 클릭 시 편집 다이얼로그를 띄웁니다."""
         self.edit_asset_requested.emit()
 
@@ -70,7 +80,7 @@ class AssetTreeView(QTreeWidget):
         delete_action = menu.addAction("자산 삭제")
         
         # 선택된 항목이 없으면 편집/삭제 비활성화
-        if not self.selectedItems():
+        if not self.selectionModel().hasSelection():
             edit_action.setEnabled(False)
             delete_action.setEnabled(False)
 
@@ -87,94 +97,82 @@ class AssetTreeView(QTreeWidget):
         """
         주어진 자산 데이터를 TreeView에 로드하고 표시합니다.
         assets_data: 리스트 of 딕셔너리 (각 딕셔너리는 하나의 자산 데이터)
+        필수 필드가 없거나 숫자가 아닌 자산은 건너뛰며, 평가 값은 모델이 컬럼 단위로 한 번에 계산합니다.
+        """
+        self.holdings_model.set_holdings(assets_data)
+
+    def set_data_source(self, asset_manager, tab_name):
+        """
+        AssetDataManager의 tab_name 탭을 표시합니다. 가격 적용은 데이터 관리자를 통해 저장/실행 취소되며,
+        data_changed를 받으면 바뀐 행만 다시 반영합니다.
+        """
+        if self.asset_manager is not None:
+            self.asset_manager.data_changed.disconnect(self._on_data_changed)
+        self.asset_manager = asset_manager
+        self.tab_name = tab_name
+        asset_manager.data_changed.connect(self._on_data_changed)
+        self.load_assets(asset_manager.get_assets_by_tab(tab_name))
+
+    def _on_data_changed(self, tab_name):
+        if tab_name == self.tab_name:
+            self.holdings_model.refresh_holdings(self.asset_manager.get_assets_by_tab(tab_name))
+
+    def update_current_prices(self, row_prices):
+        """{행 번호: 현재 단가}를 한 번에 적용합니다. 값이 바뀐 행만 다시 계산/표시됩니다."""
+        return self.holdings_model.update_current_prices(row_prices)
+
+    def apply_price_source(self, price_source):
+        """
+        가격 공급원(price_feed.PriceSource)에서 가격을 받아 한 번에 적용합니다.
+        키 필드로 결합된 행 중 가격이 바뀐 행만 다시 계산/표시됩니다.
+        비동기 공급원(AsyncPriceSource)은 GUI 스레드를 막지 않도록 start_price_fetch로 작업 스레드에서 조회하고
+        작업 스레드(QuoteFetchWorker)를 반환합니다. 그 외에는 (일치한 행 수, 바뀐 행 수)를 반환합니다.
+        """
+        if isinstance(price_source, AsyncPriceSource):
+            return self.start_price_fetch(price_source)
+        keys = list(self.holdings_model.rows_by_key(price_source.key_field))
+        prices = price_source.fetch(keys)
+        return self._apply_fetched_prices(prices, price_source.key_field)
+
+    def start_price_fetch(self, fetcher):
+        """
+        작업 스레드에서 fetcher(price_feed.AsyncPriceSource, 예: quote_fetcher.QuoteFetcher)로 보유 자산 시세를 조회하고,
+        결과가 도착하면 GUI 스레드에서 한 번에 적용합니다. 조회 중에도 화면은 멈추지 않습니다.
+        데이터 관리자와 연결되어 있으면 보유 자산의 외화 통화 환율도 함께 조회하여
+        asset_manager.fx_rates(원화 환산/format_currency에 사용)에 반영합니다.
+        조회가 끝나면 지연 시간 통계를 로그로 남기고 fetch_metrics_reported로 알립니다.
         """
-        self.clear() # 기존 항목 모두 제거
-        if not assets_data:
-            return
-
-        for idx, asset in enumerate(assets_data):
-            # 필요한 필드가 모두 있는지 확인
-            required_fields = ["자산 이름", "수량", "매입 단가", "현재 단가", "매입일", "만기일", "메모"]
-            if not all(field in asset for field in required_fields):
-                print(f"경고: 필수 필드가 누락된 자산 데이터: {asset}")
-                continue # 누락된 필드가 있으면 건너뛰기
-
-            # 숫자 필드는 float으로 변환 시도
-            try:
-                quantity = float(asset.get("수량", 0))
-                purchase_price = float(asset.get("매입 단가", 0))
-                current_price = float(asset.get("현재 단가", 0))
-            except ValueError:
-                print(f"경고: 유효하지 않은 숫자 값: {asset}")
-                continue
-
-            # 계산된 필드
-            evaluation_amount = quantity * current_price
-            
-            # 매입 단가가 0이 아니고 음수가 아닌 경우에만 수익률 계산
-            if purchase_price > 0:
-                profit_loss = evaluation_amount - (quantity * purchase_price)
-                if quantity * purchase_price != 0:
-                    profit_rate = (profit_loss / (quantity * purchase_price)) * 100
-                else:
-                    profit_rate = 0.0 # 매입 총액이 0이면 수익률 0
-            else:
-                profit_loss = evaluation_amount # 매입 단가가 없거나 0이면 평가 금액 자체가 손익
-                profit_rate = float('inf') if quantity * current_price > 0 else 0.0 # 무한대 또는 0
-
-            d_day = calculate_d_day(asset.get("만기일", ""))
-
-            item = QTreeWidgetItem(self)
-            item.setText(0, str(idx + 1)) # No. (0부터 시작하는 인덱스에 1 더함)
-            item.setText(1, asset.get("자산 이름", ""))
-            item.setText(2, format_currency(quantity))
-            item.setText(3, format_currency(purchase_price))
-            item.setText(4, format_currency(current_price))
-            item.setText(5, format_currency(evaluation_amount))
-            item.setText(6, f"{profit_rate:.2f}%" if profit_rate != float('inf') else "N/A") # 수익률
-            item.setText(7, format_currency(profit_loss))
-            item.setText(8, asset.get("매입일", ""))
-            item.setText(9, asset.get("만기일", ""))
-            item.setText(10, d_day)
-            item.setText(11, asset.get("메모", ""))
-
-            # 숫자형 데이터 정렬을 위해 UserRole에 원본 숫자 값을 저장
-            item.setData(2, Qt.UserRole, quantity)
-            item.setData(3, Qt.UserRole, purchase_price)
-            item.setData(4, Qt.UserRole, current_price)
-            item.setData(5, Qt.UserRole, evaluation_amount)
-            item.setData(6, Qt.UserRole, profit_rate)
-            item.setData(7, Qt.UserRole, profit_loss)
-
-            # 만기일 D-Day 색상 변경 (D-Day는 초록, D+는 빨강)
-            if d_day.startswith("D-") and d_day != "D-Day":
-                item.setForeground(10, QColor("#28a745")) # Green
-            elif d_day.startswith("D+"):
-                item.setForeground(10, QColor("#dc3545")) # Red
-            elif d_day == "D-Day":
-                item.setForeground(10, QColor("#ffc107")) # Orange
-
-            # 수익률에 따른 색상 변경
-            if profit_rate > 0:
-                item.setForeground(6, QColor("#28a745")) # Green
-                item.setForeground(7, QColor("#28a745")) # Green
-            elif profit_rate < 0:
-                item.setForeground(6, QColor("#dc3545")) # Red
-                item.setForeground(7, QColor("#dc3545")) # Red
-            else:
-                item.setForeground(6, QColor("#6c757d")) # Gray
-                item.setForeground(7, QColor("#6c757d")) # Gray
-
-            # 원본 데이터(idx 포함)를 Qt.UserRole에 저장하여 편집/삭제 시 사용
-            # self.get_data_from_item()에서 이 데이터를 사용함
-            # 실제 AssetDataManager와 통신할 때는 'idx'를 제거하고 보내야 함
-            asset_with_idx = asset.copy()
-            asset_with_idx['idx'] = idx # UI에서 사용하기 위한 임시 인덱스
-            item.setData(0, Qt.UserRole, asset_with_idx) 
-
-        self.sortItems(0, Qt.AscendingOrder) # No.를 기준으로 오름차순 정렬 (초기)
-
-    def get_data_from_item(self, item):
-        """QTreeWidgetItem에서 원본 자산 데이터를 추출합니다."""
-        # load_assets에서 Qt.UserRole에 저장된 원본 딕셔너리를 반환
-        return item.data(0, Qt.UserRole)
\ No newline at end of file
+        keys = list(self.holdings_model.rows_by_key(fetcher.key_field))
+        currencies = []
+        if self.asset_manager is not None:
+            currencies = sorted({asset_currency(self.holdings_model.source_asset_at(row))
+                                 for row in range(self.holdings_model.rowCount())} - {DEFAULT_CURRENCY})
+        worker = QuoteFetchWorker(fetcher, keys=keys, currencies=currencies, parent=self)
+        worker.prices_fetched.connect(lambda prices: self._apply_fetched_prices(prices, fetcher.key_field))
+        if currencies:
+            worker.fx_rates_fetched.connect(lambda rates: self.asset_manager.fx_rates.set_rates(rates) if rates else None)
+        worker.metrics_reported.connect(self._report_fetch_metrics)
+        worker.fetch_failed.connect(lambda message: print(f"시세 조회 실패: {message}"))
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+        return worker
+
+    def _report_fetch_metrics(self, metrics):
+        print(f"시세 조회: 요청 {metrics['requests']}건 (재시도 {metrics['retries']}, 오류 {metrics['errors']}, "
+              f"캐시 {metrics['cache_hits']}, 304 {metrics['not_modified']}), "
+              f"지연 p50 {metrics['p50_ms']}ms / p95 {metrics['p95_ms']}ms / 최대 {metrics['max_ms']}ms")
+        self.fetch_metrics_reported.emit(metrics)
+
+    def _apply_fetched_prices(self, prices, key_field):
+        matched_count, changed_count = apply_prices(self.holdings_model, prices, key_field,
+                                                    self.asset_manager, self.tab_name)
+        self.prices_updated.emit(matched_count, changed_count)
+        return matched_count, changed_count
+
+    def get_data_from_item(self, index):
+        """행의 QModelIndex에서 원본 자산 데이터('idx' 포함)를 추출합니다."""
+        return self.holdings_model.asset_at(index.row())
+
+    def selected_assets(self):
+        """선택된 행들의 원본 자산 데이터('idx' 포함) 리스트를 반환합니다."""
+        return [self.holdings_model.asset_at(index.row()) for index in self.selectionModel().selectedRows()]
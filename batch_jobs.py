@@ -0,0 +1,360 @@
+import multiprocessing
+import os
+import re
+import threading
+from array import array
+from collections import Counter, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from sort_index import due_date_sort_key
+from utils import DEFAULT_CURRENCY
+
+# --- 열 단위 전송 형식 ---
+# 작업 프로세스로는 자산 딕셔너리 리스트 대신 필요한 필드만 열 단위로 담아 보냅니다.
+# (딕셔너리마다 반복되는 키 문자열을 피클링하지 않음)
+#   nos    : 'no' 값의 array('q') (피클 시 바이트열 하나)
+#   columns: {필드: 인코딩된 열}
+# 인코딩된 열은 ("plain", 값 리스트) 또는 종류가 적은 열(자산 종류, 통화 등)의 ("dict", 고유 값 리스트, 코드 array)입니다.
+ColumnarChunk = namedtuple("ColumnarChunk", ["tab_name", "nos", "columns"])
+
+DICTIONARY_RATIO = 4 # 고유 값 수가 행 수의 1/4 이하이면 사전 인코딩
+
+def encode_column(values):
+    """문자열 값 리스트를 전송용 열로 인코딩합니다."""
+    uniques = dict.fromkeys(values)
+    if len(uniques) * DICTIONARY_RATIO > len(values):
+        return ("plain", values)
+    codes_by_value = {value: code for code, value in enumerate(uniques)}
+    return ("dict", list(uniques), array('I', [codes_by_value[value] for value in values]))
+
+def decode_column(column):
+    """encode_column으로 인코딩된 열을 값 리스트로 되돌립니다."""
+    if column[0] == "plain":
+        return column[1]
+    uniques = column[1]
+    return [uniques[code] for code in column[2]]
+
+def _encode_field(assets, field):
+    values = [asset.get(field, "") for asset in assets]
+    if not all(type(value) is str for value in values): # 대부분 문자열이므로 필요할 때만 변환
+        values = [value if type(value) is str else "" if value is None else str(value) for value in values]
+    return encode_column(values)
+
+def _encode_nos(assets):
+    return array('q', [asset.get('no', 0) for asset in assets])
+
+def make_chunk(tab_name, assets, fields):
+    """자산 시퀀스에서 fields 필드만 열 단위로 담은 ColumnarChunk를 만듭니다. (값은 문자열, 없으면 빈 문자열)"""
+    return ColumnarChunk(tab_name, _encode_nos(assets), {field: _encode_field(assets, field) for field in fields})
+
+def chunk_columns(chunk):
+    """ColumnarChunk의 열들을 {필드: 값 리스트}로 풀어 반환합니다. (작업 함수용)"""
+    return {field: decode_column(column) for field, column in chunk.columns.items()}
+
+class _ColumnCache:
+    """
+    스냅샷 버전별로 인코딩한 열을 보관합니다. 스냅샷은 바뀌지 않으므로 같은 버전의 열은 다시 인코딩하지 않으며,
+    다음 작업에서는 그 사이 변경된 탭(새 버전)의 열만 인코딩합니다.
+    (열 값 리스트는 자산의 문자열 객체를 그대로 참조하므로 추가 메모리는 행당 참조 하나 정도)
+    """
+
+    def __init__(self):
+        self._columns = {} # (스냅샷 버전, 시작 행, 청크 크기, 필드) -> 인코딩된 열 (필드 'no'는 번호 array)
+        self._lock = threading.Lock() # 여러 작업 스레드에서 동시에 사용
+
+    def get(self, key, build):
+        with self._lock:
+            column = self._columns.get(key)
+        if column is None:
+            column = build()
+            with self._lock:
+                self._columns[key] = column
+        return column
+
+    def retain(self, versions):
+        """versions에 없는 (이전) 스냅샷 버전의 열을 버립니다."""
+        with self._lock:
+            self._columns = {key: column for key, column in self._columns.items() if key[0] in versions}
+
+_column_cache = _ColumnCache()
+
+def partition_snapshots(snapshots, fields, chunk_size):
+    """
+    탭 스냅샷들({탭 이름: TabSnapshot})을 탭 단위로, 큰 탭은 chunk_size행 단위로 나누어
+    ColumnarChunk를 하나씩 만들어 내보내는 제너레이터입니다. (탭 순서, 탭 안의 자산 순서 유지)
+    인코딩한 열은 스냅샷 버전별로 캐시하므로 바뀌지 않은 탭은 다시 인코딩하지 않습니다.
+    """
+    _column_cache.retain({snapshot.version for snapshot in snapshots.values()})
+    for tab_name, snapshot in snapshots.items():
+        assets = snapshot.assets
+        for start in range(0, len(assets), chunk_size):
+            rows = assets[start:start + chunk_size]
+            key = (snapshot.version, start, chunk_size)
+            nos = _column_cache.get(key + ('no',), lambda: _encode_nos(rows))
+            columns = {field: _column_cache.get(key + (field,), lambda field=field: _encode_field(rows, field))
+                       for field in fields}
+            yield ColumnarChunk(tab_name, nos, columns)
+
+
+# --- 작업 함수 (작업 프로세스에서 실행되므로 모듈 최상위 함수여야 함) ---
+ValidationIssue = namedtuple("ValidationIssue", ["tab_name", "no", "field", "value", "message"])
+
+_CURRENCY_PATTERN = re.compile(r"[A-Z]{3}")
+_ALERT_PATTERN = re.compile(r"\d+일 전")
+
+def validate_chunk(chunk):
+    """
+    청크의 자산 값을 검사하여 ValidationIssue 리스트를 반환합니다.
+    금액(정수), 통화(세 글자 대문자 코드), 만기일(YYYY-MM-DD), 알림('없음' 또는 'N일 전')을 확인합니다.
+    """
+    columns = chunk_columns(chunk)
+    issues = []
+    tab_name = chunk.tab_name
+    for no, amount, currency, due_date, alert in zip(
+            chunk.nos, columns["금액"], columns["통화"], columns["만기일"], columns["알림"]):
+        try:
+            int(amount.replace(',', '').strip())
+        except ValueError:
+            issues.append(ValidationIssue(tab_name, no, "금액", amount, "숫자가 아닌 금액"))
+        if currency and not _CURRENCY_PATTERN.fullmatch(currency):
+            issues.append(ValidationIssue(tab_name, no, "통화", currency, "알 수 없는 통화 코드"))
+        if due_date and due_date_sort_key({"만기일": due_date})[0]:
+            issues.append(ValidationIssue(tab_name, no, "만기일", due_date, "날짜 형식(YYYY-MM-DD)이 아닌 만기일"))
+        if alert and alert != "없음" and not _ALERT_PATTERN.fullmatch(alert):
+            issues.append(ValidationIssue(tab_name, no, "알림", alert, "알 수 없는 알림 설정"))
+    return issues
+
+def aggregate_chunk(chunk):
+    """청크의 (탭, 자산 종류, 통화)별 [건수, 원래 통화 기준 금액 합계]를 반환합니다. (잘못된 금액은 건수만 포함)"""
+    columns = chunk_columns(chunk)
+    groups = {}
+    tab_name = chunk.tab_name
+    for category, currency, amount in zip(columns["자산 종류"], columns["통화"], columns["금액"]):
+        key = (tab_name, category, currency or DEFAULT_CURRENCY)
+        entry = groups.get(key)
+        if entry is None:
+            entry = groups[key] = [0, 0]
+        entry[0] += 1
+        try:
+            entry[1] += int(amount.replace(',', '').strip())
+        except ValueError:
+            pass
+    return groups
+
+def count_terms_chunk(chunk, field):
+    """청크의 field 값별 사용 횟수(Counter)를 반환합니다. (빈 값 제외, 자동 완성 인덱스 재구축용)"""
+    return Counter(value.strip() for value in chunk_columns(chunk)[field] if value.strip())
+
+def rebuild_chunk(chunk, term_fields):
+    """aggregate_chunk와 term_fields 각각의 count_terms_chunk 결과를 한 번에 반환합니다. (색인/집계 재계산)"""
+    return aggregate_chunk(chunk), {field: count_terms_chunk(chunk, field) for field in term_fields}
+
+
+# --- 작업 정의 ---
+class BatchJob:
+    """
+    청크 단위로 나누어 실행할 일괄 작업의 기본 클래스입니다.
+      fields     : 작업 함수에 보낼 필드 목록
+      worker     : 작업 함수 (ColumnarChunk, *worker_args) -> 부분 결과. 모듈 최상위 함수여야 함
+      worker_args: 작업 함수에 함께 넘길 인자
+      merge()    : 청크 순서대로 정렬된 부분 결과 리스트를 최종 결과로 합침
+    """
+    name = ""
+    fields = ()
+    worker = None
+    worker_args = ()
+
+    def merge(self, results):
+        raise NotImplementedError
+
+
+class ValidationJob(BatchJob):
+    """모든 탭의 자산 값 검사. 결과는 탭/자산 순서의 ValidationIssue 리스트입니다."""
+    name = "데이터 검증"
+    fields = ("금액", "통화", "만기일", "알림")
+    worker = staticmethod(validate_chunk)
+
+    def merge(self, results):
+        return [issue for issues in results for issue in issues]
+
+
+class AggregationJob(BatchJob):
+    """전체 집계 재계산. 결과는 {(탭, 자산 종류, 통화): [건수, 합계]}입니다."""
+    name = "집계 재계산"
+    fields = ("자산 종류", "통화", "금액")
+    worker = staticmethod(aggregate_chunk)
+
+    def merge(self, results):
+        merged = {}
+        for groups in results:
+            for key, (count, total) in groups.items():
+                entry = merged.get(key)
+                if entry is None:
+                    merged[key] = [count, total]
+                else:
+                    entry[0] += count
+                    entry[1] += total
+        return merged
+
+
+class TermCountJob(BatchJob):
+    """field 값별 사용 횟수 재계산. 결과는 Counter이며 CompletionIndex.add_value(값, 횟수)로 채울 수 있습니다."""
+    name = "검색어 색인"
+    worker = staticmethod(count_terms_chunk)
+
+    def __init__(self, field):
+        self.fields = (field,)
+        self.worker_args = (field,)
+
+    def merge(self, results):
+        merged = Counter()
+        for counts in results:
+            merged.update(counts)
+        return merged
+
+
+class IndexRebuildJob(BatchJob):
+    """
+    집계와 자동 완성 색인을 청크를 한 번씩만 보내 함께 다시 계산합니다.
+    결과는 (AggregationJob 결과, {필드: TermCountJob 결과})이며 AssetDataManager.apply_index_rebuild로 반영합니다.
+    """
+    name = "색인/집계 재계산"
+    worker = staticmethod(rebuild_chunk)
+
+    def __init__(self, term_fields):
+        term_fields = tuple(term_fields)
+        self.fields = tuple(dict.fromkeys(AggregationJob.fields + term_fields))
+        self.worker_args = (term_fields,)
+
+    def merge(self, results):
+        term_counts = {}
+        for _, counts_by_field in results:
+            for field, counts in counts_by_field.items():
+                term_counts.setdefault(field, Counter()).update(counts)
+        return AggregationJob().merge([groups for groups, _ in results]), term_counts
+
+
+# --- 실행 ---
+DEFAULT_CHUNK_SIZE = 20000 # 청크 하나의 행 수 (취소 반응 시간과 전송 횟수의 균형)
+MIN_PARALLEL_ROWS = 50000 # 이보다 적은 행은 프로세스 풀 없이 현재 프로세스에서 처리
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+def _get_executor(max_workers):
+    """
+    작업에 공유하는 프로세스 풀을 반환합니다. (처음 사용할 때 생성하고 이후 재사용)
+    Qt 스레드가 있는 프로세스를 fork하지 않도록 spawn 방식으로 작업 프로세스를 시작합니다.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"))
+            _executor_workers = max_workers
+        return _executor
+
+def shutdown_executor():
+    """공유 프로세스 풀을 종료합니다. (프로그램 종료 시 호출)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+def run_job(job, snapshots, max_workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+            progress=None, cancel_event=None):
+    """
+    탭 스냅샷들({탭 이름: TabSnapshot})에 job을 실행하고 합친 결과를 반환합니다. 취소되면 None을 반환합니다.
+    청크를 프로세스 풀의 max_workers개(기본 CPU 코어 수) 프로세스에 나누어 보내며,
+    행 수가 MIN_PARALLEL_ROWS보다 적거나 max_workers가 1이면 현재 프로세스에서 차례로 처리합니다.
+    progress(처리한 행 수, 전체 행 수)는 청크가 끝날 때마다 호출되고,
+    cancel_event(threading.Event)가 설정되면 아직 시작하지 않은 청크를 취소합니다.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    total_rows = sum(len(snapshot.assets) for snapshot in snapshots.values())
+    chunks = partition_snapshots(snapshots, job.fields, chunk_size)
+    done_rows = 0
+
+    if max_workers == 1 or total_rows < MIN_PARALLEL_ROWS:
+        results = []
+        for chunk in chunks:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            results.append(job.worker(chunk, *job.worker_args))
+            done_rows += len(chunk.nos)
+            if progress:
+                progress(done_rows, total_rows)
+        return job.merge(results)
+
+    executor = _get_executor(max_workers)
+    pending = {} # future -> (청크 위치, 행 수)
+    try:
+        # 청크를 만드는 대로 보내므로 앞 청크의 처리와 뒤 청크의 인코딩이 겹침
+        for position, chunk in enumerate(chunks):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            pending[executor.submit(job.worker, chunk, *job.worker_args)] = (position, len(chunk.nos))
+        results = [None] * len(pending)
+        while pending:
+            # 취소 요청을 주기적으로 확인하기 위해 시간 제한을 두고 대기
+            finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            for future in finished:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                position, row_count = pending.pop(future)
+                try:
+                    results[position] = future.result()
+                except BrokenProcessPool:
+                    shutdown_executor() # 작업 프로세스가 비정상 종료된 풀은 다음 작업에서 새로 만듦
+                    raise
+                done_rows += row_count
+                if progress:
+                    progress(done_rows, total_rows)
+    finally:
+        for future in pending:
+            future.cancel() # 취소/오류 시 아직 시작하지 않은 청크 (실행 중인 청크의 결과는 버림)
+    return job.merge(results) # 청크 순서대로 합치므로 결과 순서는 작업자 수와 무관
+
+
+class BatchJobRunner(QThread):
+    """
+    작업 스레드에서 run_job을 실행하여 GUI 스레드를 막지 않습니다.
+    데이터는 AssetDataManager.get_all_tab_snapshots()의 불변 스냅샷을 읽으므로 실행 중에도 편집할 수 있으며,
+    결과는 실행을 시작한 시점의 데이터 기준입니다. 진행률과 결과는 시그널로 전달됩니다. (Qt가 GUI 스레드로 전달)
+    """
+    progress_changed = pyqtSignal(int, int) # (처리한 행 수, 전체 행 수)
+    job_finished = pyqtSignal(object) # job.merge() 결과
+    job_cancelled = pyqtSignal()
+    job_failed = pyqtSignal(str)
+
+    def __init__(self, job, snapshots, max_workers=None, chunk_size=DEFAULT_CHUNK_SIZE, parent=None):
+        super().__init__(parent)
+        self.job = job
+        self.snapshots = snapshots
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """작업 취소를 요청합니다. (실행 중인 청크가 끝나기를 기다리지 않고 job_cancelled 발생)"""
+        self._cancel_event.set()
+
+    def run(self):
+        try:
+            result = run_job(self.job, self.snapshots, self.max_workers, self.chunk_size,
+                             self.progress_changed.emit, self._cancel_event)
+        except Exception as e:
+            self.job_failed.emit(str(e))
+            return
+        if result is None:
+            self.job_cancelled.emit()
+        else:
+            self.job_finished.emit(result)
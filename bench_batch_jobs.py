@@ -0,0 +1,50 @@
+"""
+일괄 작업(batch_jobs)의 작업 프로세스 수별 처리 시간 측정 스크립트입니다.
+사용법: python bench_batch_jobs.py [행 수] [탭 수]  (기본 400000행, 8탭)
+작업자 1개(현재 프로세스)와 2, 4, ... CPU 코어 수까지의 프로세스 풀로 같은 작업을 실행하여 속도 향상을 비교합니다.
+작업자 수마다 첫 실행(프로세스 풀 시작, 열 인코딩 포함)과 다시 실행(인코딩된 열 캐시 사용) 시간을 측정합니다.
+"""
+import os
+import pickle
+import sys
+import time
+
+from batch_jobs import AggregationJob, TermCountJob, ValidationJob, make_chunk, run_job, shutdown_executor, _column_cache
+from bench_import_formats import make_assets
+from tab_snapshots import TabSnapshot
+
+def make_snapshots(count, tab_count):
+    assets = make_assets(count)
+    per_tab = (count + tab_count - 1) // tab_count
+    return {f"탭 {i}": TabSnapshot(f"탭 {i}", i + 1, tuple(assets[i * per_tab:(i + 1) * per_tab])) for i in range(tab_count)}
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400000
+    tab_count = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    snapshots = make_snapshots(count, tab_count)
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, cpu_count} | {n for n in (2, 4, 8) if n < cpu_count})
+
+    sample = next(iter(snapshots.values())).assets[:10000]
+    dict_size = len(pickle.dumps(list(sample)))
+    chunk_size = len(pickle.dumps(make_chunk("탭", sample, ValidationJob.fields)))
+    print(f"{count:,}행, {tab_count}탭, CPU {cpu_count}개")
+    print(f"전송 크기 (10,000행): 딕셔너리 {dict_size / 1024:,.0f}KB, 열 단위 {chunk_size / 1024:,.0f}KB")
+
+    for job in (ValidationJob(), AggregationJob(), TermCountJob("자산 명")):
+        baseline = None
+        print(f"\n[{job.name}]")
+        for workers in worker_counts:
+            _column_cache.retain(set()) # 첫 실행은 열 인코딩부터
+            started = time.perf_counter()
+            run_job(job, snapshots, workers)
+            first_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            run_job(job, snapshots, workers)
+            seconds = time.perf_counter() - started
+            baseline = baseline or seconds
+            print(f"  작업자 {workers:>2}개: 첫 실행 {first_seconds:6.2f}s, 다시 실행 {seconds:6.2f}s  (x{baseline / seconds:.2f})")
+    shutdown_executor()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+가져오기/내보내기 형식별 처리량 측정 스크립트입니다.
+사용법: python bench_import_formats.py [행 수]  (기본 100000)
+각 형식으로 같은 자산 데이터를 임시 파일에 내보낸 뒤, 읽기+정규화(read_assets) 속도를 측정합니다.
+선택 패키지(openpyxl, pyarrow)가 없는 형식은 건너뜁니다.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from asset_formats import available_formats, read_assets, write_assets, _FORMATS
+
+def make_assets(count):
+    return [{
+        "no": i + 1,
+        "자산 종류": ("예금", "주식", "채권", "펀드")[i % 4],
+        "세부 분류": f"분류 {i % 37}",
+        "자산 명": f"자산 {i}",
+        "금액": (i * 7919) % 100000000,
+        "통화": ("KRW", "USD", "JPY")[i % 3],
+        "만기일": f"20{25 + i % 10}-{1 + i % 12:02d}-{1 + i % 28:02d}" if i % 3 else "",
+        "알림": "없음",
+        "비고": "",
+    } for i in range(count)]
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    assets = make_assets(count)
+    print(f"{count:,}행 기준")
+    print(f"{'형식':<16}{'파일 크기':>12}{'내보내기':>12}{'가져오기':>12}{'가져오기 행/초':>16}")
+    skipped = [file_format.name for file_format in _FORMATS if file_format not in available_formats()]
+    with tempfile.TemporaryDirectory() as directory:
+        for file_format in available_formats():
+            file_path = os.path.join(directory, "bench" + file_format.extensions[0])
+            started = time.perf_counter()
+            write_assets(file_path, assets)
+            write_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            read_count = sum(len(batch) for batch in read_assets(file_path))
+            read_seconds = time.perf_counter() - started
+            assert read_count == count, (file_format.name, read_count)
+
+            size_mb = os.path.getsize(file_path) / (1024 * 1024)
+            print(f"{file_format.name:<16}{size_mb:>10.1f}MB{write_seconds:>11.2f}s{read_seconds:>11.2f}s{count / read_seconds:>16,.0f}")
+    if skipped:
+        print(f"건너뜀 (선택 패키지 없음): {', '.join(skipped)}")
+
+if __name__ == "__main__":
+    main()
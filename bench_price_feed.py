@@ -0,0 +1,88 @@
+"""
+가격 적용(price_feed) 처리 시간 측정 스크립트입니다.
+사용법: python bench_price_feed.py [보유 자산 수]  (기본 50000)
+같은 보유 자산에 대해 가격 파일 읽기, 키 결합(join_prices), 모델에만 적용, AssetDataManager를 통한 적용
+(실행 취소 기록과 AssetIndex 관찰자 갱신 포함)과 실행 취소 시간을 측정합니다. 가격은 절반의 행만 바뀌도록 만듭니다.
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from PyQt5.QtWidgets import QApplication
+
+from holdings_model import HoldingsModel
+from price_feed import apply_prices, join_prices, load_price_file
+
+def make_holdings(count):
+    return [{
+        "자산 종류": "주식",
+        "세부 분류": f"분류 {i % 37}",
+        "자산 명": f"종목 {i}",
+        "금액": 100000,
+        "통화": "KRW",
+        "알림": "없음",
+        "비고": "",
+        "자산 이름": f"종목 {i}",
+        "수량": 1 + i % 100,
+        "매입 단가": 1000 + i % 5000,
+        "현재 단가": 1000 + i % 5000,
+        "매입일": "2024-01-02",
+        "만기일": f"20{30 + i % 10}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        "메모": "",
+    } for i in range(count)]
+
+def make_prices(holdings):
+    # 짝수 행만 가격이 바뀜
+    return {holding["자산 이름"]: holding["현재 단가"] + (i % 2 == 0) for i, holding in enumerate(holdings)}
+
+def timed(label, function):
+    started = time.perf_counter()
+    result = function()
+    print(f"{label:<28}{time.perf_counter() - started:>9.3f}s")
+    return result
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    app = QApplication.instance() or QApplication(["bench"])
+    holdings = make_holdings(count)
+    prices = make_prices(holdings)
+    print(f"보유 자산 {count:,}건, 가격 {len(prices):,}건 기준")
+
+    with tempfile.TemporaryDirectory() as directory:
+        price_path = os.path.join(directory, "prices.csv")
+        with open(price_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["자산 이름", "현재 단가"])
+            writer.writerows(prices.items())
+        loaded = timed("가격 파일 읽기 (CSV)", lambda: load_price_file(price_path))
+        assert len(loaded) == count
+
+        model = HoldingsModel()
+        timed("보유 자산 적재", lambda: model.set_holdings(holdings))
+        timed("키 결합 (인덱스 구축 포함)", lambda: join_prices(model, prices))
+        timed("키 결합 (인덱스 재사용)", lambda: join_prices(model, prices))
+        matched, changed = timed("모델에만 적용", lambda: apply_prices(model, prices))
+        assert (matched, changed) == (count, (count + 1) // 2), (matched, changed)
+
+        # 데이터 관리자는 작업 디렉터리에 저장하므로 임시 디렉터리에서 실행
+        current_directory = os.getcwd()
+        os.chdir(directory)
+        try:
+            from asset_data_manager import AssetDataManager
+            manager = AssetDataManager()
+            manager.add_tab_data("보유")
+            manager.add_assets("보유", holdings)
+            model = HoldingsModel()
+            model.set_holdings(manager.get_assets_by_tab("보유"))
+            matched, changed = timed("데이터 관리자를 통해 적용",
+                                     lambda: apply_prices(model, prices, asset_manager=manager, tab_name="보유"))
+            assert (matched, changed) == (count, (count + 1) // 2), (matched, changed)
+            timed("실행 취소", manager.undo)
+        finally:
+            os.chdir(current_directory)
+    app.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import bisect
+import random
+
+from PyQt5.QtWidgets import QHeaderView
+
+from asset_index import AssetIndex
+from asset_table_model import COLUMN_HEADERS, D_DAY_COLUMN, format_cell
+
+class ColumnLengthIndex(AssetIndex):
+    """
+    탭/컬럼별로 표시 문자열 길이 -> 자산을 보관하여 가장 긴 값을 가진 자산을 빠르게 찾는 인덱스입니다.
+    길이 목록은 정렬 상태로 유지되므로 추가/삭제 시 해당 길이 버킷만 갱신됩니다.
+    삭제는 추가 시 기록한 길이로 처리하므로 D-Day처럼 날짜에 따라 표시 문자열이 바뀌는 컬럼도 안전합니다.
+    """
+
+    def __init__(self):
+        self._tabs = {} # 탭 이름 -> _TabLengths
+
+    def clear(self):
+        self._tabs = {}
+
+    def longest_assets(self, tab_name, column, limit):
+        """column의 표시 문자열이 가장 긴 자산을 최대 limit개 반환합니다."""
+        tab_lengths = self._tabs.get(tab_name)
+        if tab_lengths is None:
+            return []
+        lengths, buckets = tab_lengths.columns[column]
+        result = []
+        for length in reversed(lengths):
+            for asset in buckets[length].values():
+                result.append(asset)
+                if len(result) >= limit:
+                    return result
+        return result
+
+    def assets_added(self, tab_name, assets):
+        tab_lengths = self._tabs.get(tab_name)
+        if tab_lengths is None:
+            tab_lengths = self._tabs[tab_name] = _TabLengths()
+        for asset in assets:
+            no = asset.get('no', 0)
+            recorded = []
+            for column, (lengths, buckets) in enumerate(tab_lengths.columns):
+                length = len(format_cell(asset, column))
+                bucket = buckets.get(length)
+                if bucket is None:
+                    bucket = buckets[length] = {}
+                    bisect.insort(lengths, length)
+                bucket[no] = asset
+                recorded.append(length)
+            tab_lengths.recorded[no] = recorded
+
+    def assets_removed(self, tab_name, assets):
+        tab_lengths = self._tabs.get(tab_name)
+        if tab_lengths is None:
+            return
+        for asset in assets:
+            no = asset.get('no', 0)
+            recorded = tab_lengths.recorded.pop(no, None)
+            if recorded is None:
+                continue
+            for (lengths, buckets), length in zip(tab_lengths.columns, recorded):
+                bucket = buckets[length]
+                del bucket[no]
+                if not bucket:
+                    del buckets[length]
+                    del lengths[bisect.bisect_left(lengths, length)]
+
+    def tab_removed(self, tab_name, assets):
+        self._tabs.pop(tab_name, None)
+
+    def tab_renamed(self, old_name, new_name):
+        if old_name in self._tabs:
+            self._tabs[new_name] = self._tabs.pop(old_name)
+
+
+class _TabLengths:
+    """탭 하나의 컬럼별 (정렬된 길이 리스트, {길이: {no: 자산}})와 자산별로 기록된 길이."""
+
+    def __init__(self):
+        self.columns = [([], {}) for _ in COLUMN_HEADERS]
+        self.recorded = {} # no -> [컬럼별 길이]
+
+
+class ColumnSizer:
+    """
+    표본 행만 측정하여 컬럼 너비를 추정합니다.
+    표본은 화면에 보이는 행, 임의로 고른 행, 컬럼별로 가장 긴 값을 가진 자산(ColumnLengthIndex)으로 구성되므로
+    탭의 행 수와 관계없이 비용이 표본 크기에 비례합니다.
+    """
+    RANDOM_SAMPLE_SIZE = 50 # 임의 표본 행 수
+    LONGEST_CANDIDATES = 3 # 컬럼별로 측정할 가장 긴 값의 후보 수
+    FALLBACK_VISIBLE_ROWS = 40 # 뷰가 아직 표시되지 않았을 때 측정할 앞쪽 행 수
+    CELL_PADDING = 20
+    D_DAY_BADGE_PADDING = 12 # AssetItemDelegate의 배지 좌우 여백
+    MIN_WIDTH = 60
+    MAX_WIDTH = 360
+
+    def __init__(self, asset_manager):
+        self.asset_manager = asset_manager
+
+    def _sample_assets(self, table_view):
+        """화면에 보이는 행과 임의의 행에 해당하는 자산 표본을 반환합니다."""
+        model = table_view.model()
+        loaded_rows = model.rowCount()
+        first_row = table_view.rowAt(0)
+        if first_row == -1:
+            rows = set(range(min(loaded_rows, self.FALLBACK_VISIBLE_ROWS)))
+        else:
+            last_row = table_view.rowAt(table_view.viewport().height() - 1)
+            if last_row == -1:
+                last_row = loaded_rows - 1
+            rows = set(range(first_row, last_row + 1))
+
+        total_rows = model.total_row_count()
+        if total_rows > len(rows):
+            rows.update(random.sample(range(total_rows), min(self.RANDOM_SAMPLE_SIZE, total_rows)))
+
+        assets = []
+        for row in rows:
+            asset = self.asset_manager.get_asset_by_no(model.tab_name, model.no_at(row))
+            if asset:
+                assets.append(asset)
+        return assets
+
+    def estimate_widths(self, table_view):
+        """컬럼별 추정 너비(픽셀) 리스트를 반환합니다."""
+        model = table_view.model()
+        sample = self._sample_assets(table_view)
+        cell_metrics = table_view.fontMetrics()
+        header_metrics = table_view.horizontalHeader().fontMetrics()
+
+        widths = []
+        for column, header_text in enumerate(COLUMN_HEADERS):
+            candidates = sample + self.asset_manager.get_longest_assets(model.tab_name, column, self.LONGEST_CANDIDATES)
+            text_width = max((cell_metrics.horizontalAdvance(format_cell(asset, column)) for asset in candidates), default=0)
+            if column == D_DAY_COLUMN:
+                text_width += self.D_DAY_BADGE_PADDING
+            width = max(text_width, header_metrics.horizontalAdvance(header_text)) + self.CELL_PADDING
+            widths.append(min(max(width, self.MIN_WIDTH), self.MAX_WIDTH))
+        return widths
+
+    def fit(self, table_view):
+        """추정 너비를 적용합니다. 마지막 컬럼(비고)은 남은 공간을 채웁니다."""
+        header = table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        for column, width in enumerate(self.estimate_widths(table_view)):
+            header.resizeSection(column, width)
@@ -0,0 +1,176 @@
+import bisect
+import heapq
+from PyQt5.QtWidgets import QCompleter
+from PyQt5.QtCore import Qt, QStringListModel
+
+from asset_index import AssetIndex
+
+# 접두어 범위 검색의 상한으로 사용하는 문자 (모든 유니코드 문자보다 큼)
+_PREFIX_END = '\U0010ffff'
+
+class CompletionIndex(AssetIndex):
+    """
+    특정 필드(예: '자산 명')에 저장된 값들의 정렬 인덱스입니다.
+    (대소문자 무시 키, 원본 값) 쌍을 정렬된 리스트로 유지하여 접두어 검색을 bisect로 처리하고,
+    각 값이 사용된 횟수(빈도)로 결과를 정렬합니다.
+    """
+    MAX_CACHED_PREFIXES = 256 # 접두어별 검색 결과 캐시 크기
+    TOP_K = 20 # 일치 항목이 많은 접두어에 대해 미리 유지하는 상위 후보 수 (IndexedCompleter.MAX_SUGGESTIONS)
+    WIDE_PREFIX_MATCHES = 512 # 일치 항목이 이보다 많은 접두어는 검색 때마다 훑지 않고 상위 후보를 유지
+
+    def __init__(self, field_name):
+        self.field_name = field_name
+        self._keys = [] # [(casefold 값, 원본 값), ...] 정렬 상태 유지
+        self._counts = {} # 원본 값 -> 사용 횟수
+        self._cache = {} # (casefold 접두어, limit) -> 결과 리스트
+        self._top = {} # casefold 접두어 -> [(-사용 횟수, casefold 값, 원본 값), ...] 상위 TOP_K개 (넓은 접두어만)
+
+    def clear(self):
+        self._keys = []
+        self._counts = {}
+        self._cache = {}
+        self._top = {}
+
+    def _field_value(self, asset):
+        value = asset.get(self.field_name, '')
+        return str(value).strip() if value is not None else ''
+
+    def add_value(self, value, count=1):
+        """값의 사용 횟수를 count만큼 늘립니다. 처음 등장한 값이면 정렬 위치에 삽입합니다."""
+        if not value:
+            return
+        previous = self._counts.get(value, 0)
+        self._counts[value] = previous + count
+        if previous == 0:
+            bisect.insort(self._keys, (value.casefold(), value))
+        self._update_top(value, increased=True)
+        self._cache.clear()
+
+    def discard_value(self, value, count=1):
+        """값의 사용 횟수를 count만큼 줄이고, 0이 되면 인덱스에서 제거합니다."""
+        previous = self._counts.get(value, 0)
+        if previous == 0:
+            return
+        if previous > count:
+            self._counts[value] = previous - count
+        else:
+            del self._counts[value]
+            key = (value.casefold(), value)
+            position = bisect.bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+        self._update_top(value, increased=False)
+        self._cache.clear()
+
+    def _update_top(self, value, increased):
+        """
+        value를 포함하는 접두어들의 상위 후보 목록을 갱신합니다.
+        횟수가 늘면 그 자리에서 순위를 고치고, 상위 후보의 횟수가 줄면 목록 밖의 값이 올라올 수 있으므로
+        해당 접두어 목록을 버려 다음 검색 때 다시 구합니다.
+        """
+        if not self._top:
+            return
+        folded = value.casefold()
+        count = self._counts.get(value, 0)
+        for end in range(len(folded) + 1):
+            prefix = folded[:end]
+            top = self._top.get(prefix)
+            if top is None:
+                continue
+            position = next((i for i, entry in enumerate(top) if entry[2] == value), None)
+            if not increased:
+                if position is not None:
+                    del self._top[prefix]
+                continue
+            if position is not None:
+                del top[position]
+            bisect.insort(top, (-count, folded, value))
+            del top[self.TOP_K:]
+
+    def assets_added(self, tab_name, assets):
+        for asset in assets:
+            self.add_value(self._field_value(asset))
+
+    def assets_removed(self, tab_name, assets):
+        for asset in assets:
+            self.discard_value(self._field_value(asset))
+
+    def count(self, value):
+        """값이 저장된 자산에서 사용된 횟수를 반환합니다."""
+        return self._counts.get(value, 0)
+
+    def complete(self, prefix, limit=20):
+        """
+        prefix로 시작하는 값들을 사용 빈도가 높은 순(같으면 가나다순)으로 최대 limit개 반환합니다.
+        같은 접두어에 대한 결과는 데이터가 바뀔 때까지 캐시됩니다.
+        """
+        folded = prefix.strip().casefold()
+        cache_key = (folded, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        lo = bisect.bisect_left(self._keys, (folded,))
+        hi = bisect.bisect_left(self._keys, (folded + _PREFIX_END,), lo)
+        counts = self._counts
+        if hi - lo > self.WIDE_PREFIX_MATCHES and limit <= self.TOP_K:
+            # 짧은 접두어는 거의 전체 목록과 일치하므로 한 번만 훑고 이후에는 상위 후보 목록을 갱신해 사용
+            top = self._top.get(folded)
+            if top is None:
+                keys = self._keys
+                top = heapq.nsmallest(self.TOP_K, ((-counts[keys[i][1]],) + keys[i] for i in range(lo, hi)))
+                self._top[folded] = top
+            result = [value for _, _, value in top[:limit]]
+        else:
+            result = [value for _, value in heapq.nsmallest(
+                limit, self._keys[lo:hi], key=lambda key: (-counts[key[1]], key))]
+
+        if len(self._cache) >= self.MAX_CACHED_PREFIXES:
+            self._cache.clear()
+        self._cache[cache_key] = result
+        return result
+
+
+class IndexedCompleter(QCompleter):
+    """
+    CompletionIndex(저장된 자산 값, 빈도순)와 VocabularyStore(사용자 목록)를 합쳐
+    현재 입력된 접두어에 맞는 후보만 모델에 채우는 QCompleter입니다.
+    전체 목록을 모델에 넣지 않으므로 목록이 커져도 자동 완성 속도가 일정합니다.
+    """
+    MAX_SUGGESTIONS = 20
+
+    def __init__(self, vocabulary, parent=None):
+        super().__init__(parent)
+        self.vocabulary = vocabulary
+        self.index = None # CompletionIndex (set_index로 연결)
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setMaxVisibleItems(self.MAX_SUGGESTIONS)
+
+    def set_index(self, index):
+        """자산 데이터에서 구축된 CompletionIndex를 연결합니다."""
+        self.index = index
+
+    def attach(self, line_edit):
+        """
+        line_edit의 textEdited 시그널에 후보 갱신을 연결합니다.
+        QLineEdit는 textEdited 시그널을 보낸 뒤 completer를 갱신하므로, 새 후보로 팝업이 표시됩니다.
+        """
+        line_edit.textEdited.connect(self.update_candidates)
+
+    def candidates(self, prefix):
+        """prefix에 대한 자동 완성 후보 목록을 반환합니다."""
+        limit = self.MAX_SUGGESTIONS
+        result = list(self.index.complete(prefix, limit)) if self.index is not None else []
+        if len(result) < limit:
+            seen = set(result)
+            for item in self.vocabulary.items_with_prefix(prefix.strip(), limit):
+                if item not in seen:
+                    result.append(item)
+                    if len(result) >= limit:
+                        break
+        return result
+
+    def update_candidates(self, text):
+        self._model.setStringList(self.candidates(text))
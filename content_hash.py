@@ -0,0 +1,46 @@
+import hashlib
+import json
+
+from asset_index import AssetIndex
+
+HASH_MASK = (1 << 64) - 1
+
+def asset_digest(asset):
+    """자산 딕셔너리 내용의 64비트 다이제스트 (필드 순서와 무관)"""
+    encoded = json.dumps(asset, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'big')
+
+def tab_digest(assets):
+    """자산 리스트 전체의 해시 (자산 다이제스트의 합 mod 2^64)"""
+    return sum(asset_digest(asset) for asset in assets) & HASH_MASK
+
+
+class ContentHashIndex(AssetIndex):
+    """
+    탭별 내용 해시를 증분으로 유지하는 인덱스입니다.
+    탭 해시는 자산 다이제스트의 합(mod 2^64)이므로 자산 하나가 추가/삭제/수정되면
+    그 자산의 다이제스트만 더하거나 빼서 O(1)로 갱신됩니다. (자산 순서와는 무관)
+    변경 전후 해시가 같으면 저장과 화면 갱신을 건너뛰는 데 사용하고,
+    저장된 해시와 비교하여 로드한 데이터의 무결성을 확인합니다.
+    """
+
+    def __init__(self):
+        self._tab_hashes = {} # 탭 이름 -> 해시
+
+    def tab_hash(self, tab_name):
+        return self._tab_hashes.get(tab_name, 0)
+
+    def clear(self):
+        self._tab_hashes.clear()
+
+    def assets_added(self, tab_name, assets):
+        self._tab_hashes[tab_name] = (self._tab_hashes.get(tab_name, 0) + tab_digest(assets)) & HASH_MASK
+
+    def assets_removed(self, tab_name, assets):
+        self._tab_hashes[tab_name] = (self._tab_hashes.get(tab_name, 0) - tab_digest(assets)) & HASH_MASK
+
+    def tab_removed(self, tab_name, assets):
+        self._tab_hashes.pop(tab_name, None)
+
+    def tab_renamed(self, old_name, new_name):
+        self._tab_hashes[new_name] = self._tab_hashes.pop(old_name, 0)
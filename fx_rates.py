@@ -0,0 +1,98 @@
+import bisect
+import json
+import os
+from collections import OrderedDict
+from datetime import date
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from utils import DEFAULT_CURRENCY
+
+class FxRateTable(QObject):
+    """
+    통화별 원화 환산 환율표입니다. (1 단위 통화 = rate 원)
+    환율은 날짜별로 보관되며, 조회한 날짜에 환율이 없으면 그 이전의 가장 최근 환율을 사용합니다.
+    (통화, 날짜) 조회 결과는 LRU 캐시에 보관되고, 환율이 바뀌면 rates_changed 시그널로 알립니다.
+    """
+    # 환율이 바뀐 통화 코드 목록
+    rates_changed = pyqtSignal(list)
+
+    CACHE_SIZE = 1024 # (통화, 날짜) 조회 캐시 크기
+
+    def __init__(self, filename="fx_rates.json"):
+        super().__init__()
+        self.filename = filename
+        self._rates = {} # 통화 -> {날짜 문자열: 환율}
+        self._dates = {} # 통화 -> 정렬된 날짜 문자열 리스트
+        self._cache = OrderedDict() # (통화, 날짜 문자열) -> 환율 또는 None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for currency, rates_by_date in data.items():
+                self._rates[currency] = {day: float(rate) for day, rate in rates_by_date.items()}
+                self._dates[currency] = sorted(self._rates[currency])
+        except (json.JSONDecodeError, ValueError, AttributeError) as e:
+            print(f"환율 파일을 읽는 중 오류 발생: {e}")
+
+    def _save(self):
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump(self._rates, f, ensure_ascii=False, indent=4)
+        except Exception as e:
+            print(f"Error saving FX rates to {self.filename}: {e}")
+
+    def currencies(self):
+        """환율이 등록된 통화 코드 목록."""
+        return sorted(self._rates)
+
+    def rate(self, currency, on_date=None):
+        """
+        on_date(datetime.date, 기본 오늘) 기준 currency의 원화 환산 환율을 반환합니다.
+        원화는 1.0이며, 해당 날짜 이전에 등록된 환율이 없으면 None입니다.
+        """
+        if currency == DEFAULT_CURRENCY:
+            return 1.0
+        day = (on_date or date.today()).isoformat()
+        key = (currency, day)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        rate = None
+        dates = self._dates.get(currency)
+        if dates:
+            position = bisect.bisect_right(dates, day) - 1
+            if position >= 0:
+                rate = self._rates[currency][dates[position]]
+
+        self._cache[key] = rate
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return rate
+
+    def set_rates(self, rates, on_date=None):
+        """{통화 코드: 환율}을 on_date(기본 오늘) 환율로 등록하고 저장합니다. (환율 조회 결과도 이 메서드로 반영)"""
+        day = (on_date or date.today()).isoformat()
+        changed = []
+        for currency, rate in rates.items():
+            if currency == DEFAULT_CURRENCY:
+                continue
+            rates_by_date = self._rates.setdefault(currency, {})
+            if rates_by_date.get(day) == float(rate):
+                continue
+            if day not in rates_by_date:
+                bisect.insort(self._dates.setdefault(currency, []), day)
+            rates_by_date[day] = float(rate)
+            changed.append(currency)
+        if not changed:
+            return
+        # 바뀐 통화의 캐시 항목만 무효화
+        for key in [key for key in self._cache if key[0] in changed]:
+            del self._cache[key]
+        self._save()
+        self.rates_changed.emit(changed)
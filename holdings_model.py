@@ -0,0 +1,228 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
+
+from asset_table_model import format_d_day
+from utils import format_currency
+from valuation_engine import ValuationEngine, parse_number
+
+HOLDING_HEADERS = [
+    "No.", "자산 이름", "수량", "매입 단가", "현재 단가",
+    "평가 금액", "수익률", "평가 손익", "매입일", "만기일", "D-Day", "메모"
+]
+REQUIRED_FIELDS = ["자산 이름", "수량", "매입 단가", "현재 단가", "매입일", "만기일", "메모"]
+CURRENT_PRICE_COLUMN = 4
+PROFIT_LOSS_COLUMN = 7 # 현재 단가 변경 시 CURRENT_PRICE_COLUMN ~ PROFIT_LOSS_COLUMN이 다시 그려짐
+D_DAY_COLUMN = 10
+
+POSITIVE_COLOR = QColor("#28a745") # Green
+NEGATIVE_COLOR = QColor("#dc3545") # Red
+NEUTRAL_COLOR = QColor("#6c757d") # Gray
+TODAY_COLOR = QColor("#ffc107") # Orange
+
+def format_quantity(quantity):
+    """수량을 고정 소수점으로 표시합니다. (천 단위 구분, 소수점 아래 최대 10자리, 끝의 0 제거)"""
+    text = f"{quantity:,.10f}".rstrip('0').rstrip('.')
+    return "0" if text in ("", "-0") else text
+
+class HoldingsModel(QAbstractTableModel):
+    """
+    보유 자산(수량/매입 단가/현재 단가) 목록을 보여주는 모델입니다.
+    평가 금액/손익/수익률은 ValuationEngine이 컬럼 단위로 계산하며,
+    현재 단가가 바뀌면 해당 행만 다시 계산하고 dataChanged로 그 행만 다시 그립니다.
+    """
+    COALESCE_CHANGED_ROWS = 1000 # 이보다 많은 행이 바뀌면 dataChanged를 한 번만 발생
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._assets = [] # 유효한 자산 딕셔너리 (원래 순서의 'idx' 포함)
+        self._sources = [] # 행별 원본 자산 딕셔너리 (AssetDataManager에 수정 요청 시 원본으로 사용)
+        self._rows_by_key = {} # 키 필드 -> {키 값: [행 번호, ...]} (가격 결합용, set_holdings 시 초기화)
+        self.engine = ValuationEngine()
+
+    @staticmethod
+    def _valid_holdings(assets_data):
+        """[(원래 위치, 자산, (수량, 매입 단가, 현재 단가)), ...] 필수 필드가 없거나 숫자가 아닌 자산은 제외됩니다."""
+        holdings = []
+        for idx, asset in enumerate(assets_data or []):
+            if not all(field in asset for field in REQUIRED_FIELDS):
+                print(f"경고: 필수 필드가 누락된 자산 데이터: {asset}")
+                continue
+            numbers = (parse_number(asset["수량"]), parse_number(asset["매입 단가"]), parse_number(asset["현재 단가"]))
+            if None in numbers:
+                print(f"경고: 유효하지 않은 숫자 값: {asset}")
+                continue
+            holdings.append((idx, asset, numbers))
+        return holdings
+
+    def set_holdings(self, assets_data):
+        """자산 목록을 설정합니다. 필수 필드가 없거나 숫자가 아닌 자산은 제외됩니다."""
+        holdings = self._valid_holdings(assets_data)
+        assets = []
+        for idx, asset, _ in holdings:
+            asset_with_idx = asset.copy()
+            asset_with_idx['idx'] = idx # UI에서 사용하기 위한 임시 인덱스
+            assets.append(asset_with_idx)
+
+        self.beginResetModel()
+        self._assets = assets
+        self._sources = [asset for _, asset, _ in holdings]
+        self._rows_by_key = {}
+        self.engine.load([numbers[0] for _, _, numbers in holdings],
+                         [numbers[1] for _, _, numbers in holdings],
+                         [numbers[2] for _, _, numbers in holdings])
+        self.endResetModel()
+
+    def refresh_holdings(self, assets_data):
+        """
+        데이터 변경 후 자산 목록을 다시 반영합니다. 행 구성이 같고 바뀐 자산(새 딕셔너리)이 현재 단가만 다르면
+        그 행만 다시 계산/표시하고, 그 외의 변경은 set_holdings로 전체를 다시 설정합니다.
+        """
+        holdings = self._valid_holdings(assets_data)
+        if len(holdings) != len(self._assets):
+            self.set_holdings(assets_data)
+            return
+        row_prices = {}
+        for row, (idx, asset, numbers) in enumerate(holdings):
+            source = self._sources[row]
+            if asset is source:
+                continue # 자산 딕셔너리는 제자리에서 수정되지 않으므로 같은 객체면 변경 없음
+            if idx != self._assets[row]['idx'] or \
+                    any(asset.get(key) != value for key, value in source.items() if key != "현재 단가") or \
+                    any(key not in source for key in asset):
+                self.set_holdings(assets_data)
+                return
+            self._sources[row] = asset
+            row_prices[row] = numbers[2]
+        if row_prices:
+            self.update_current_prices(row_prices)
+
+    def source_asset_at(self, row):
+        """행의 원본 자산 딕셔너리를 반환합니다. ('idx' 없음)"""
+        return self._sources[row]
+
+    def price_updates(self, row_prices):
+        """
+        {행 번호: 현재 단가} 중 가격이 바뀌는 행의 수정 목록 [(원본 자산, 수정된 자산 데이터), ...]을 반환합니다.
+        (AssetDataManager.update_assets에 전달)
+        """
+        updates = []
+        for row in sorted(row_prices):
+            if self.engine.current_prices[row] != row_prices[row]:
+                source = self._sources[row]
+                updates.append((source, dict(source, **{"현재 단가": row_prices[row]})))
+        return updates
+
+    def asset_at(self, row):
+        """행의 자산 딕셔너리('idx' 포함)를 반환합니다."""
+        return self._assets[row]
+
+    def rows_by_key(self, key_field):
+        """key_field(예: '자산 이름', '코드') 값 -> 행 번호 리스트 해시 인덱스를 반환합니다. (필드별로 한 번만 구축)"""
+        index = self._rows_by_key.get(key_field)
+        if index is None:
+            index = {}
+            for row, asset in enumerate(self._assets):
+                key = asset.get(key_field)
+                if key is not None:
+                    index.setdefault(str(key).strip(), []).append(row)
+            self._rows_by_key[key_field] = index
+        return index
+
+    def update_current_prices(self, row_prices):
+        """
+        {행 번호: 현재 단가}를 한 번에 적용합니다. 값이 바뀐 행만 다시 계산/표시하며 그 행 번호 리스트를 반환합니다.
+        """
+        changed_rows = self.engine.set_current_prices(row_prices)
+        for row in changed_rows:
+            asset = dict(self._assets[row]) # 자산 딕셔너리는 제자리에서 수정하지 않음
+            asset["현재 단가"] = row_prices[row]
+            self._assets[row] = asset
+
+        if len(changed_rows) > self.COALESCE_CHANGED_ROWS:
+            # 바뀐 행이 많으면 시그널 하나로 범위 전체를 알림 (뷰는 보이는 행만 다시 그림)
+            self.dataChanged.emit(self.index(changed_rows[0], CURRENT_PRICE_COLUMN),
+                                  self.index(changed_rows[-1], PROFIT_LOSS_COLUMN))
+            return changed_rows
+
+        # 연속된 행끼리 묶어 dataChanged 발생
+        start = 0
+        while start < len(changed_rows):
+            end = start
+            while end + 1 < len(changed_rows) and changed_rows[end + 1] == changed_rows[end] + 1:
+                end += 1
+            self.dataChanged.emit(self.index(changed_rows[start], CURRENT_PRICE_COLUMN),
+                                  self.index(changed_rows[end], PROFIT_LOSS_COLUMN))
+            start = end + 1
+        return changed_rows
+
+    # --- QAbstractTableModel 구현 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._assets)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HOLDING_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        asset = self._assets[row]
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return str(asset['idx'] + 1) # No. (0부터 시작하는 인덱스에 1 더함)
+            if column == 2:
+                return format_quantity(self.engine.quantities[row])
+            if column == 3:
+                return format_currency(self.engine.purchase_prices[row])
+            if column == 4:
+                return format_currency(self.engine.current_prices[row])
+            evaluation, profit_loss, profit_rate = self.engine.values(row)
+            if column == 5:
+                return format_currency(evaluation)
+            if column == 6:
+                return f"{profit_rate:.2f}%" if profit_rate is not None else "N/A"
+            if column == 7:
+                return format_currency(profit_loss)
+            if column == D_DAY_COLUMN:
+                return format_d_day(asset.get("만기일", ""))
+            return str(asset.get(HOLDING_HEADERS[column], ""))
+
+        if role == Qt.ForegroundRole:
+            if column in (6, 7):
+                # 수익률에 따른 색상 (수익률을 계산할 수 없으면 손익 부호 기준)
+                _, profit_loss, profit_rate = self.engine.values(row)
+                sign = profit_rate if profit_rate is not None else profit_loss
+                return POSITIVE_COLOR if sign > 0 else NEGATIVE_COLOR if sign < 0 else NEUTRAL_COLOR
+            if column == D_DAY_COLUMN:
+                # 만기일 D-Day 색상 (D-는 초록, D+는 빨강, 당일은 주황)
+                d_day_text = format_d_day(asset.get("만기일", ""))
+                if d_day_text == "D-0":
+                    return TODAY_COLOR
+                if d_day_text.startswith("D-"):
+                    return POSITIVE_COLOR
+                if d_day_text.startswith("D+"):
+                    return NEGATIVE_COLOR
+            return None
+
+        if role == Qt.UserRole:
+            # 숫자 컬럼은 원본 숫자 값, No. 컬럼은 원본 자산 딕셔너리 ('idx' 포함)
+            if column == 0:
+                return asset
+            if column in (2, 3, 4):
+                return float((self.engine.quantities, self.engine.purchase_prices, self.engine.current_prices)[column - 2][row])
+            if column in (5, 6, 7):
+                evaluation, profit_loss, profit_rate = self.engine.values(row)
+                return {5: evaluation, 6: profit_rate, 7: profit_loss}[column]
+            return None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HOLDING_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
@@ -0,0 +1,226 @@
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from operator import itemgetter
+
+from asset_formats import ASSET_FIELDS, cell_text
+from utils import DEFAULT_CURRENCY
+
+DEFAULT_PROFILE_NAME = "기본"
+OUTPUT_DATE_FORMAT = "%Y-%m-%d"
+
+class ImportProfile:
+    """
+    가져오기 파일의 열 구성을 자산 필드로 옮기는 규칙입니다.
+      columns         : {자산 필드: 파일 열 이름}
+      constants       : {자산 필드: 고정 값} (예: 은행 내보내기는 모두 '예금')
+      amount_remove   : 금액에서 지울 문자들 (예: ",원 ", 소수점 문자는 지우지 않음)
+      decimal_mark    : 소수점 문자 (예: ","이면 "."은 천 단위 구분 기호로 보고 지움)
+      date_formats    : 만기일 입력 형식 목록 (예: ["%Y.%m.%d", "%Y%m%d"])
+      skip_if_empty   : 값이 비어 있으면 건너뛸 자산 필드 목록
+      skip_if_contains: {자산 필드: [문자열, ...]} 값에 포함되면 건너뜀 (예: 합계 행)
+    금액은 정수 문자열로 반올림합니다. (금액 정렬/집계/검증은 정수 금액을 사용) 숫자가 아니면 원래 값을 둡니다.
+    compile(header)로 파일마다 한 번 열 위치와 파서를 정해 두므로 행마다 하는 일은 위치 접근과 파서 호출뿐입니다.
+    """
+
+    def __init__(self, name, columns, constants=None, amount_remove=",", decimal_mark=".",
+                 date_formats=None, skip_if_empty=None, skip_if_contains=None):
+        self.name = name
+        self.columns = dict(columns)
+        self.constants = dict(constants or {})
+        self.amount_remove = amount_remove
+        self.decimal_mark = decimal_mark
+        self.date_formats = list(date_formats or [])
+        self.skip_if_empty = list(skip_if_empty or [])
+        self.skip_if_contains = {field: list(words) for field, words in (skip_if_contains or {}).items()}
+
+    @classmethod
+    def default(cls):
+        """자산 필드 이름과 같은 열을 읽는 기본 프로필 (내보내기 파일 형식)"""
+        return cls(DEFAULT_PROFILE_NAME, {field: field for field in ASSET_FIELDS})
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'], data.get('columns', {}), data.get('constants'), data.get('amount_remove', ","),
+                   data.get('decimal_mark', "."), data.get('date_formats'), data.get('skip_if_empty'),
+                   data.get('skip_if_contains'))
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'columns': self.columns,
+            'constants': self.constants,
+            'amount_remove': self.amount_remove,
+            'decimal_mark': self.decimal_mark,
+            'date_formats': self.date_formats,
+            'skip_if_empty': self.skip_if_empty,
+            'skip_if_contains': self.skip_if_contains,
+        }
+
+    def matches(self, header_names):
+        """헤더 이름 집합에 이 프로필이 읽는 열이 모두 있으면 True를 반환합니다."""
+        return bool(self.columns) and all(source in header_names for source in self.columns.values())
+
+    # --- 파서 ---
+    def _amount_parser(self):
+        decimal_mark = self.decimal_mark
+        remove_chars = self.amount_remove + ("." if decimal_mark != "." else "")
+        remove_table = str.maketrans("", "", remove_chars.replace(decimal_mark, ""))
+
+        def to_integer_text(text):
+            if text.isdigit():
+                return text
+            try:
+                amount = Decimal(text)
+            except InvalidOperation:
+                return text # 숫자가 아니면 원래 값 (입력 검증에서 경고)
+            if not amount.is_finite():
+                return text
+            return str(int(amount.quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+
+        def parse_amount(value):
+            if isinstance(value, (int, float)):
+                return to_integer_text(cell_text(value))
+            text = str(value).translate(remove_table).strip()
+            if decimal_mark != ".":
+                text = text.replace(decimal_mark, ".")
+            return to_integer_text(text)
+
+        return parse_amount
+
+    def _date_parser(self):
+        if not self.date_formats:
+            return cell_text
+        date_formats = self.date_formats
+        cache = {} # 입력 문자열 -> 변환 결과 (같은 날짜가 반복되는 경우가 많음)
+
+        def parse_date(value):
+            if isinstance(value, (datetime, date)):
+                return value.strftime(OUTPUT_DATE_FORMAT)
+            text = cell_text(value)
+            result = cache.get(text)
+            if result is None:
+                result = text # 어느 형식에도 맞지 않으면 원래 값 (입력 검증에서 경고)
+                for date_format in date_formats:
+                    try:
+                        result = datetime.strptime(text, date_format).strftime(OUTPUT_DATE_FORMAT)
+                        break
+                    except ValueError:
+                        continue
+                cache[text] = result
+            return result
+
+        return parse_date
+
+    def _parser(self, field):
+        if field == "금액":
+            return self._amount_parser()
+        if field == "만기일":
+            return self._date_parser()
+        if field == "통화":
+            return lambda value: cell_text(value).upper() or DEFAULT_CURRENCY
+        return cell_text
+
+    def compile(self, header):
+        """
+        헤더(열 이름 리스트)에 맞춘 행 변환 함수를 만듭니다.
+        변환 함수는 행(튜플/리스트)을 자산 데이터 딕셔너리로 바꾸며, 건너뛸 행이면 None을 반환합니다.
+        """
+        positions = {}
+        for position, name in enumerate(header):
+            if name is not None:
+                positions.setdefault(cell_text(name), position)
+        fields = [field for field in ASSET_FIELDS if self.columns.get(field) in positions]
+        indices = [positions[self.columns[field]] for field in fields]
+        width = max(indices) + 1 if indices else 0
+        if len(indices) > 1:
+            get_values = itemgetter(*indices) # 한 번의 호출로 필요한 열만 튜플로 꺼냄
+        elif indices:
+            get_values = lambda row, index=indices[0]: (row[index],)
+        else:
+            get_values = lambda row: ()
+        steps = [(field, self._parser(field)) for field in fields]
+
+        template = {field: "" for field in ASSET_FIELDS}
+        template["금액"] = "0"
+        template["통화"] = DEFAULT_CURRENCY
+        template.update(self.constants)
+        skip_if_empty = self.skip_if_empty
+        skip_if_contains = [(field, tuple(words)) for field, words in self.skip_if_contains.items()]
+
+        def transform(row):
+            if len(row) < width:
+                row = list(row) + [None] * (width - len(row))
+            asset_data = template.copy()
+            for (field, parse), value in zip(steps, get_values(row)):
+                if value is not None:
+                    asset_data[field] = parse(value)
+            for field in skip_if_empty:
+                if not asset_data.get(field):
+                    return None
+            for field, words in skip_if_contains:
+                text = asset_data.get(field, "")
+                if any(word in text for word in words):
+                    return None
+            return asset_data
+
+        return transform
+
+
+class ImportProfileStore:
+    """
+    저장된 가져오기 프로필 목록 (import_profiles.json)입니다.
+    파일 헤더로 프로필을 자동 선택합니다. 읽는 열이 모두 헤더에 있는 프로필 중 열을 가장 많이 쓰는 것을 고르고,
+    맞는 프로필이 없으면 기본 프로필을 사용합니다.
+    """
+
+    def __init__(self, filename="import_profiles.json"):
+        self.filename = filename
+        self._profiles = self._load()
+        self.last_detected = None # 마지막으로 자동 선택된 프로필 이름
+
+    def _load(self):
+        if not os.path.exists(self.filename):
+            return []
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                return [ImportProfile.from_dict(data) for data in json.load(f)]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            print(f"가져오기 프로필 파일을 읽는 중 오류 발생: {e}")
+            return []
+
+    def _save(self):
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump([profile.to_dict() for profile in self._profiles], f, ensure_ascii=False, indent=4)
+        except Exception as e:
+            print(f"Error saving import profiles to {self.filename}: {e}")
+
+    def profiles(self):
+        """저장된 프로필 목록 (기본 프로필 제외)"""
+        return list(self._profiles)
+
+    def save_profile(self, profile):
+        """프로필을 추가하거나 같은 이름의 프로필을 교체하고 저장합니다."""
+        self._profiles = [existing for existing in self._profiles if existing.name != profile.name] + [profile]
+        self._save()
+
+    def delete_profile(self, name):
+        self._profiles = [profile for profile in self._profiles if profile.name != name]
+        self._save()
+
+    def detect(self, header):
+        """헤더에 맞는 프로필을 반환합니다."""
+        header_names = {cell_text(name) for name in header if name is not None}
+        best = None
+        for profile in self._profiles:
+            if profile.matches(header_names) and (best is None or len(profile.columns) > len(best.columns)):
+                best = profile
+        return best or ImportProfile.default()
+
+    def compile_for_header(self, header):
+        """헤더로 프로필을 고르고 그 헤더에 맞춘 행 변환 함수를 반환합니다. (asset_formats.read_assets용)"""
+        profile = self.detect(header)
+        self.last_detected = profile.name
+        return profile.compile(header)
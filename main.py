@@ -1,17 +1,17 @@
 import sys
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import defaultdict
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget,
     QAction, QMessageBox, QMenu, QToolBar, QSizePolicy, QSystemTrayIcon,
-    QPushButton, QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView,
-    QInputDialog, QLineEdit, QLabel, QFileDialog, QStyle, QStyleOptionTab
+    QPushButton, QHBoxLayout, QTableView, QAbstractItemView, QHeaderView,
+    QInputDialog, QLineEdit, QLabel, QFileDialog, QStyle, QStyleOptionTab, QDockWidget, QProgressDialog
 )
 from PyQt5.QtGui import QIcon, QFont, QDesktopServices, QPixmap
-from PyQt5.QtCore import Qt, QSize, QUrl, QDate, QObject, pyqtSignal, QRect
+from PyQt5.QtCore import Qt, QSize, QUrl, QObject, pyqtSignal, QRect, QTimer
 
 # Font Awesome 대신 QtAwesome 사용을 위해 임포트
 import qtawesome as qta
@@ -20,8 +20,25 @@ import qtawesome as qta
 from asset_data_manager import AssetDataManager
 from password_manager import PasswordManager
 from ui_dialogs import AssetInputDialog
+from asset_table_model import AssetTableModel, COLUMN_HEADERS, format_cell
+from asset_item_delegate import AssetItemDelegate
+from column_sizer import ColumnSizer
+from summary_pane import SummaryPane
+from maturity_alert_scheduler import MaturityAlertScheduler
+from maturity_view import MaturityView
+from net_worth_chart import NetWorthChartView
+from vocabulary_store import flush_all_vocabularies
 from app_ui_manager import AppUIManager
-from utils import calculate_d_day, format_currency, parse_date_string_to_qdate
+from asset_formats import file_dialog_filter
+from asset_tree_view import AssetTreeView
+from quote_fetcher import QuoteFetcher
+from batch_jobs import BatchJobRunner, IndexRebuildJob, ValidationJob, shutdown_executor
+from utils import calculate_d_day, format_currency, CURRENCY_UNITS, DEFAULT_CURRENCY
+
+# 테이블 컬럼 인덱스 -> 정렬 키로 사용할 자산 필드 (D-Day는 만기일 날짜로 정렬)
+TABLE_SORT_FIELDS = ["자산 종류", "세부 분류", "자산 명", "금액", "만기일", "만기일", "알림", "비고"]
+# 기본 정렬: 자산 종류 오름차순
+DEFAULT_SORT_SPEC = [(0, Qt.AscendingOrder)]
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -40,6 +57,9 @@ class MainWindow(QMainWindow):
         self.asset_manager.tab_list_changed.connect(self.update_tabs_from_data)
         self.asset_manager.data_changed.connect(self.update_current_tab_table_if_active)
         self.asset_manager.data_loaded.connect(self.handle_initial_data_load) # 초기 로드 완료 시그널 처리
+        self.asset_manager.undo_state_changed.connect(self.update_undo_actions)
+        # 환율이 바뀌면 환산 합계만 다시 표시 (집계는 통화별로 유지되므로 재집계 없음)
+        self.asset_manager.fx_rates.rates_changed.connect(lambda _: self.update_total_amount_display())
 
         # 앱의 다른 관리자들 (이들은 AssetDataManager와는 별개로 동작)
         self.password_manager = PasswordManager(self)
@@ -64,14 +84,97 @@ class MainWindow(QMainWindow):
         # 탭 위젯의 현재 탭 변경 시그널 연결 (탭 변경 시 테이블 새로고침 및 활성화 탭 관리 위함)
         self.tab_widget.currentChanged.connect(self.current_tab_changed)
         
-        # 각 탭의 QTableWidget 인스턴스를 저장할 딕셔너리
+        # 각 탭의 QTableView 인스턴스를 저장할 딕셔너리 (모델: AssetTableModel)
         self._tab_tables = {}
+        # 각 탭의 검색어 (테이블을 다시 로드해도 필터 유지)
+        self._tab_filters = {}
+        # 각 탭의 정렬 상태: [(컬럼 인덱스, Qt.SortOrder), ...] (앞의 항목이 우선)
+        self._tab_sort_specs = {}
+        # 모든 탭 테이블이 공유하는 셀 델리게이트 (금액/D-Day 포맷 캐시 공유)
+        self._asset_item_delegate = AssetItemDelegate(self)
+        # 표본 행으로 열 너비를 추정 (사용자가 직접 너비를 조절한 탭은 자동 맞춤에서 제외)
+        self.column_sizer = ColumnSizer(self.asset_manager)
+        self._user_sized_tabs = set()
+        self._fitting_columns = False
+
+        # 자산 입력 다이얼로그는 한 번만 생성하여 재사용합니다. (_get_asset_input_dialog 참고)
+        self._asset_input_dialog = None
+
+        # 그룹별 집계 요약 창 (보기 메뉴에서 표시/숨기기, 숨겨진 동안은 갱신하지 않음)
+        self.summary_pane = SummaryPane(self.asset_manager)
+        self.summary_dock = QDockWidget("요약", self)
+        self.summary_dock.setObjectName("summaryDock")
+        self.summary_dock.setWidget(self.summary_pane)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.summary_dock)
+        self.summary_dock.hide()
+        self.asset_manager.data_changed.connect(lambda _: self.summary_pane.refresh())
+        self.asset_manager.tab_list_changed.connect(self.summary_pane.refresh)
+        self.asset_manager.fx_rates.rates_changed.connect(lambda _: self.summary_pane.refresh())
+
+        # 모든 탭의 만기 임박 자산 화면 (만기일 인덱스 기간 조회)
+        self.maturity_view = MaturityView(self.asset_manager)
+        self.maturity_view.asset_activated.connect(self.focus_asset)
+        self.maturity_dock = QDockWidget("만기 임박", self)
+        self.maturity_dock.setObjectName("maturityDock")
+        self.maturity_dock.setWidget(self.maturity_view)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.maturity_dock)
+        self.maturity_dock.hide()
+        self.asset_manager.data_changed.connect(lambda _: self.maturity_view.refresh())
+        self.asset_manager.tab_list_changed.connect(self.maturity_view.refresh)
+
+        # 전체/탭별/자산 종류별 순자산 추이 차트 (스냅샷 합계 이력 + 오늘의 현재 합계)
+        self.net_worth_view = NetWorthChartView(self.asset_manager)
+        self.net_worth_dock = QDockWidget("자산 추이", self)
+        self.net_worth_dock.setObjectName("netWorthDock")
+        self.net_worth_dock.setWidget(self.net_worth_view)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.net_worth_dock)
+        self.net_worth_dock.hide()
+        self.asset_manager.data_changed.connect(self.net_worth_view.mark_live_dirty)
+        self.asset_manager.tab_list_changed.connect(self.net_worth_view.mark_live_dirty)
+        self.asset_manager.fx_rates.rates_changed.connect(self.net_worth_view.mark_live_dirty)
+
+        # 현재 탭의 보유 자산 평가 화면 (편집 메뉴의 '시세 조회'로 현재 탭과 연결하여 시세를 적용)
+        self.holdings_view = AssetTreeView()
+        self.holdings_view.prices_updated.connect(
+            lambda matched, changed: self.statusBar().showMessage(f"시세 적용: 일치 {matched:,}건, 변경 {changed:,}건", 5000))
+        self.holdings_dock = QDockWidget("보유 자산", self)
+        self.holdings_dock.setObjectName("holdingsDock")
+        self.holdings_dock.setWidget(self.holdings_view)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.holdings_dock)
+        self.holdings_dock.hide()
+        self._quote_base_url = "" # 마지막으로 입력한 시세 서버 주소
+        self._quote_worker = None # 실행 중인 시세 조회 (quote_fetcher.QuoteFetchWorker)
+
+        # 자정이 지나면 D-Day 표시를 새 날짜 기준으로 다시 그림
+        self._midnight_timer = QTimer(self)
+        self._midnight_timer.setSingleShot(True)
+        self._midnight_timer.timeout.connect(self.on_midnight)
+        self._schedule_midnight_refresh()
+        # 그날 처음 실행하면 전체 자산 스냅샷을 남김 (자정 이후에는 on_midnight에서)
+        self._snapshot_date = datetime.now().date()
+        self.asset_manager.take_daily_snapshot()
 
         self.create_actions()
         self.create_toolbar()
         self.create_menubar()
         self.create_status_bar()
         self.setup_tray_icon()
+        self.update_undo_actions()
+
+        # 만기 알림 스케줄러: 자산 변경 시 알림 힙만 갱신하고, 가장 이른 알림 시각에 트레이 알림 표시
+        self.alert_scheduler = MaturityAlertScheduler(self)
+        self.alert_scheduler.alerts_due.connect(self.show_maturity_alerts)
+        self.asset_manager.register_index(self.alert_scheduler)
+
+        # 콤보박스 목록(VocabularyStore)은 지연 저장되므로 종료 시 남은 변경 사항을 기록
+        QApplication.instance().aboutToQuit.connect(flush_all_vocabularies)
+        # 일괄 작업용 프로세스 풀 종료
+        QApplication.instance().aboutToQuit.connect(shutdown_executor)
+        # 종료 전에 오늘 스냅샷을 마지막 상태로 갱신
+        QApplication.instance().aboutToQuit.connect(lambda: self.asset_manager.refresh_snapshot(self._snapshot_date))
+        # 시세 조회 작업 스레드가 실행 중인 채로 삭제되지 않도록 끝날 때까지 대기
+        QApplication.instance().aboutToQuit.connect(lambda: self._quote_worker.wait() if self._quote_worker is not None else None)
+        self._batch_runner = None # 실행 중인 일괄 작업 (BatchJobRunner)
 
         # 총 금액 표시를 위한 상태바 라벨
         self.total_amount_label = QLabel("총 금액: 0 원")
@@ -153,7 +256,7 @@ class MainWindow(QMainWindow):
         print("DEBUG: 탭 업데이트 완료.") # Debug print
 
     def _create_asset_tab_content(self, tab_name):
-        """각 탭에 들어갈 QTableWidget과 버튼 레이아웃을 생성합니다."""
+        """각 탭에 들어갈 QTableView와 버튼 레이아웃을 생성합니다."""
         tab_content = QWidget()
         main_layout = QVBoxLayout(tab_content)
 
@@ -180,6 +283,7 @@ class MainWindow(QMainWindow):
         search_label = QLabel("검색:")
         search_input = QLineEdit()
         search_input.setPlaceholderText("자산 명, 종류, 분류 등 검색")
+        search_input.setText(self._tab_filters.get(tab_name, ""))
         search_input.textChanged.connect(lambda text, tn=tab_name: self.filter_assets(tn, text)) # 탭 이름 고정
         top_layout.addWidget(search_label)
         top_layout.addWidget(search_input)
@@ -187,24 +291,32 @@ class MainWindow(QMainWindow):
         top_layout.addStretch()
         main_layout.addLayout(top_layout)
 
-        # QTableWidget 설정
-        asset_table = QTableWidget()
+        # QTableView 설정: 행은 자산 'no' 목록으로 관리되고 스크롤 시 fetchMore로 점진적으로 노출됨
+        asset_table = QTableView()
+        asset_table.setModel(AssetTableModel(self.asset_manager, tab_name, asset_table))
+        asset_table.setSelectionBehavior(QAbstractItemView.SelectRows) # 행 단위 선택
+        asset_table.setSelectionMode(QAbstractItemView.ExtendedSelection) # 다중 선택 가능
+        asset_table.setItemDelegate(self._asset_item_delegate) # 금액/D-Day 배지 및 만기 행 색상 표시
         self._tab_tables[tab_name] = asset_table # 테이블 인스턴스 저장
         main_layout.addWidget(asset_table)
 
-        # "No." 셀은 UI에서 제거되었으나, 내부 데이터 모델에는 'no' 필드가 유지되어 고유 식별자로 사용됩니다.
-        column_headers = ["자산 종류", "세부 분류", "자산 명", "금액", "만기일", "D-Day", "알림", "비고"]
-        asset_table.setColumnCount(len(column_headers))
-        asset_table.setHorizontalHeaderLabels(column_headers)
+        # 모든 행 높이를 고정하여 뷰가 전체 행을 측정하지 않도록 함
+        asset_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        asset_table.verticalHeader().setDefaultSectionSize(28)
 
-        # 셀 크기를 동일하게 통일 (여기서는 Stretch 모드를 사용하여 균등하게 분배)
-        for i in range(len(column_headers)):
-            asset_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
+        # 열 너비는 표본 행으로 추정하여 맞춤 (load_assets_to_table -> fit_table_columns)
+        # 사용자가 마지막(비고) 컬럼 외의 너비를 조절하면 해당 탭은 자동 맞춤을 멈춤
+        asset_table.horizontalHeader().sectionResized.connect(
+            lambda col, old_size, new_size, tn=tab_name: self.on_table_section_resized(tn, col))
 
-        asset_table.setSortingEnabled(True)
+        # 정렬은 위젯의 표시 텍스트 정렬 대신 AssetDataManager의 타입별 정렬 키로 처리
+        # (헤더 클릭: 해당 컬럼 정렬 / Shift+클릭: 보조 정렬 컬럼 추가)
+        asset_table.setSortingEnabled(False)
+        asset_table.horizontalHeader().setSortIndicatorShown(True)
+        asset_table.horizontalHeader().sectionClicked.connect(lambda col, tn=tab_name: self.on_table_header_clicked(tn, col))
 
         # 셀 더블 클릭 시 수정 기능 연결
-        asset_table.itemDoubleClicked.connect(lambda item, tn=tab_name: self.edit_selected_asset(tn, item)) # 탭 이름 고정
+        asset_table.doubleClicked.connect(lambda index, tn=tab_name: self.edit_selected_asset(tn, index)) # 탭 이름 고정
 
         # 탭 생성 시 해당 탭의 데이터 로드
         self.load_assets_to_table(tab_name)
@@ -218,6 +330,9 @@ class MainWindow(QMainWindow):
             # 현재 탭이 바뀌었을 때 테이블 새로고침 (data_changed 시그널이 발생하지 않았더라도)
             self.load_assets_to_table(tab_name)
             self.update_total_amount_display() # 탭 변경 시 총 금액 업데이트
+            self.summary_pane.set_current_tab(tab_name)
+            if self.holdings_dock.isVisible() and self._quote_worker is None:
+                self.holdings_view.set_data_source(self.asset_manager, tab_name)
             
     def update_current_tab_table_if_active(self, changed_tab_name):
         """
@@ -234,36 +349,63 @@ class MainWindow(QMainWindow):
         else:
             print(f"경고: '{changed_tab_name}' 탭의 테이블 인스턴스를 찾을 수 없습니다. (아마 탭이 아직 생성되지 않았거나 삭제됨)")
 
+    def _get_asset_input_dialog(self, asset_data=None):
+        """
+        재사용되는 AssetInputDialog 인스턴스를 반환합니다.
+        최초 호출 시에만 다이얼로그를 생성하고, 이후에는 reset_for_asset으로 입력 상태만 교체합니다.
+        """
+        if self._asset_input_dialog is None:
+            self._asset_input_dialog = AssetInputDialog(self)
+            # 저장된 자산 값으로 구축된 자동 완성 인덱스 연결 (AssetDataManager가 증분 유지)
+            self._asset_input_dialog.set_completion_indexes({
+                field_name: self.asset_manager.get_completion_index(field_name)
+                for field_name in ("자산 종류", "세부 분류", "자산 명")
+            })
+        self._asset_input_dialog.reset_for_asset(asset_data)
+        return self._asset_input_dialog
+
     def add_new_asset(self, tab_name):
         """
         자산 추가 다이얼로그를 열고 사용자 입력을 처리합니다.
-        '추가입력' 또는 '확인' 버튼을 통해 AssetDataManager에 데이터를 추가합니다.
+        '추가입력'으로 기록된 자산과 '확인' 버튼으로 입력된 자산을 다이얼로그가 닫힐 때
+        AssetDataManager.add_assets로 한 번에 추가합니다. (저장 및 테이블 갱신 1회)
         """
-        dialog = AssetInputDialog(self)
-        
-        # 'asset_added_and_continue_signal'을 AssetDataManager의 add_asset 메서드에 연결
-        # 이 시그널은 '추가입력' 버튼이 눌렸을 때 발생합니다.
-        dialog.asset_added_and_continue_signal.connect(
-            lambda asset_data: self.asset_manager.add_asset(tab_name, asset_data)
-        )
+        dialog = self._get_asset_input_dialog()
         
         # 다이얼로그를 모달로 실행하고 결과를 기다립니다.
-        # '확인' 버튼을 눌렀을 때만 이 블록이 실행됩니다.
-        if dialog.exec_() == QInputDialog.Accepted:
+        result = dialog.exec_()
+        # '추가입력'으로 기록된 자산은 취소로 닫더라도 추가합니다.
+        assets_to_add = dialog.take_staged_assets()
+        final_asset_data = None
+        if result == QInputDialog.Accepted: # '확인' 버튼을 눌렀을 때
             final_asset_data = dialog.get_asset_data()
             if final_asset_data:
-                self.asset_manager.add_asset(tab_name, final_asset_data)
-                QMessageBox.information(self, "자산 추가", f"[{tab_name}] 탭에 새로운 자산이 성공적으로 추가되었습니다.")
+                assets_to_add.append(final_asset_data)
+
+        if assets_to_add:
+            self.asset_manager.add_assets(tab_name, assets_to_add)
+
+        if result == QInputDialog.Accepted:
+            if final_asset_data:
+                QMessageBox.information(self, "자산 추가", f"[{tab_name}] 탭에 새로운 자산 {len(assets_to_add)}건이 성공적으로 추가되었습니다.")
             else:
                 QMessageBox.warning(self, "자산 추가", "유효한 자산 데이터가 없습니다.")
 
 
+    def _selected_nos(self, tab_name):
+        """탭 테이블에서 선택된 행들의 자산 'no' 목록을 반환합니다. (행 번호가 아닌 자산 식별자 기준)"""
+        current_table = self._tab_tables.get(tab_name)
+        if not current_table:
+            return []
+        model = current_table.model()
+        return [model.no_at(index.row()) for index in current_table.selectionModel().selectedRows()]
+
     def delete_selected_asset(self, tab_name):
         current_table = self._tab_tables.get(tab_name)
         if not current_table: return # 해당 탭의 테이블이 없으면 리턴
 
-        selected_rows = current_table.selectionModel().selectedRows()
-        if not selected_rows:
+        selected_nos = self._selected_nos(tab_name)
+        if not selected_nos:
             QMessageBox.warning(self, "삭제 오류", "삭제할 자산을 선택해주세요.")
             return
 
@@ -271,32 +413,22 @@ class MainWindow(QMainWindow):
                                      "선택된 자산을 정말로 삭제하시겠습니까?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            assets_to_delete = []
-            # UI에서 선택된 행들을 역순으로 정렬하여 올바른 인덱스 삭제
-            for index in sorted(selected_rows, reverse=True):
-                row = index.row()
-                # 첫 번째 컬럼의 Qt.UserRole에서 전체 자산 데이터를 가져옴
-                original_asset_dict = current_table.item(row, 0).data(Qt.UserRole)
-                if original_asset_dict:
-                    assets_to_delete.append(original_asset_dict) # 전체 원본 딕셔너리를 전달
-
-            if self.asset_manager.delete_assets(tab_name, assets_to_delete):
+            if self.asset_manager.delete_assets_by_no(tab_name, selected_nos):
                 QMessageBox.information(self, "자산 삭제", "선택된 자산이 삭제되었습니다.")
             else:
                 QMessageBox.warning(self, "삭제 실패", "자산 삭제 중 오류가 발생했습니다. 일부 자산이 삭제되지 않았을 수 있습니다.")
 
-    def edit_selected_asset(self, tab_name, item):
+    def edit_selected_asset(self, tab_name, index):
         current_table = self._tab_tables.get(tab_name)
         if not current_table: return
 
-        row = item.row()
-        # 첫 번째 컬럼의 Qt.UserRole에서 전체 자산 데이터를 가져옴
-        original_asset_dict = current_table.item(row, 0).data(Qt.UserRole)
+        # 행의 자산 'no'로 전체 자산 데이터를 가져옴
+        original_asset_dict = current_table.model().asset_at(index.row())
         if not original_asset_dict:
             QMessageBox.warning(self, "수정 오류", "선택된 자산의 정보를 찾을 수 없습니다.")
             return
         
-        dialog = AssetInputDialog(self, original_asset_dict) # 기존 데이터로 다이얼로그 초기화
+        dialog = self._get_asset_input_dialog(original_asset_dict) # 기존 데이터로 다이얼로그 초기화
         if dialog.exec_() == QInputDialog.Accepted:
             updated_data = dialog.get_asset_data()
             if updated_data:
@@ -312,92 +444,132 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "자산 수정", "유효한 자산 데이터가 없습니다.")
 
 
+    def on_table_header_clicked(self, tab_name, column):
+        """
+        테이블 헤더 클릭 시 정렬 상태를 변경합니다.
+        같은 컬럼을 다시 누르면 방향을 바꾸고, Shift를 누른 채 클릭하면 보조 정렬 컬럼으로 추가합니다.
+        """
+        sort_spec = list(self._tab_sort_specs.get(tab_name, DEFAULT_SORT_SPEC))
+        columns = [col for col, _ in sort_spec]
+        shift_pressed = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+
+        if column in columns:
+            position = columns.index(column)
+            col, order = sort_spec[position]
+            toggled = Qt.DescendingOrder if order == Qt.AscendingOrder else Qt.AscendingOrder
+            if shift_pressed:
+                sort_spec[position] = (col, toggled)
+            else:
+                sort_spec = [(col, toggled)]
+        elif shift_pressed:
+            sort_spec.append((column, Qt.AscendingOrder))
+        else:
+            sort_spec = [(column, Qt.AscendingOrder)]
+
+        self._tab_sort_specs[tab_name] = sort_spec
+        self.load_assets_to_table(tab_name)
+
     def load_assets_to_table(self, tab_name):
-        """지정된 탭의 테이블에 자산 데이터를 로드합니다."""
+        """지정된 탭의 테이블 모델에 정렬/필터가 적용된 자산 'no' 목록을 로드합니다."""
         current_table = self._tab_tables.get(tab_name)
         if not current_table:
             # 탭이 아직 생성되지 않았거나, 현재 존재하지 않는 탭 이름일 경우
             print(f"오류: 탭 '{tab_name}'에 해당하는 테이블 인스턴스를 찾을 수 없습니다.")
             return
 
-        current_table.setSortingEnabled(False) # 데이터 로드 중 정렬 비활성화
-        current_table.setRowCount(0) # 기존 행 모두 제거
-
-        assets = self.asset_manager.get_assets_by_tab(tab_name)
-        
-        for row_idx, asset in enumerate(assets):
-            current_table.insertRow(row_idx)
-
-            # 첫 번째 컬럼(이제 자산 종류)의 item에 전체 asset 데이터를 저장하여 데이터 참조 유지
-            item_type = QTableWidgetItem(asset.get('자산 종류', ''))
-            item_type.setData(Qt.UserRole, asset) # 중요: 전체 asset 딕셔너리 저장 (no 포함)
-            item_type.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            current_table.setItem(row_idx, 0, item_type)
-
-            item_detail_type = QTableWidgetItem(asset.get('세부 분류', ''))
-            item_detail_type.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            current_table.setItem(row_idx, 1, item_detail_type)
-
-            item_name = QTableWidgetItem(asset.get('자산 명', ''))
-            item_name.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            current_table.setItem(row_idx, 2, item_name)
-
-            amount_raw = asset.get('금액', 0)
-            item_amount = QTableWidgetItem(format_currency(amount_raw))
-            item_amount.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter) # 금액 오른쪽 정렬
-            item_amount.setData(Qt.UserRole, amount_raw) # 정렬을 위한 숫자 데이터
-            current_table.setItem(row_idx, 3, item_amount)
-
-            due_date_str = asset.get('만기일', '')
-            item_due_date = QTableWidgetItem(due_date_str)
-            item_due_date.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            current_table.setItem(row_idx, 4, item_due_date)
-
-            d_day_str = ""
-            if due_date_str:
-                d_day = calculate_d_day(due_date_str)
-                if d_day is not None:
-                    d_day_str = f"D-{d_day}" if d_day >= 0 else f"D+{abs(d_day)}"
-                else:
-                    d_day_str = "날짜 오류"
-            item_d_day = QTableWidgetItem(d_day_str)
-            item_d_day.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            # QDate 객체를 UserRole에 저장하여 정렬 기준으로 사용 (없으면 QDate())
-            qdate_due = parse_date_string_to_qdate(due_date_str)
-            item_d_day.setData(Qt.UserRole, qdate_due if qdate_due else QDate()) 
-            current_table.setItem(row_idx, 5, item_d_day)
-
-            item_alert = QTableWidgetItem(asset.get('알림', ''))
-            item_alert.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            current_table.setItem(row_idx, 6, item_alert)
-
-            item_note = QTableWidgetItem(asset.get('비고', ''))
-            item_note.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            current_table.setItem(row_idx, 7, item_note)
-            
-            # 모든 셀을 편집 불가능하게 설정 (더블 클릭 시 편집 다이얼로그로만 편집)
-            for col in range(current_table.columnCount()):
-                item = current_table.item(row_idx, col)
-                if item: # item이 None이 아닐 경우에만 설정
-                    item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-
-        current_table.setSortingEnabled(True) # 데이터 로드 후 정렬 활성화
-        current_table.sortByColumn(0, Qt.AscendingOrder) # 자산 종류 기준으로 초기 정렬 (선택 사항)
+        # 캐시된 정렬 순열에서 자산 'no' 순서를 가져옴 (행 아이템을 만들지 않음)
+        sort_spec = self._tab_sort_specs.get(tab_name, DEFAULT_SORT_SPEC)
+        nos = self.asset_manager.get_sorted_nos(
+            tab_name, [(TABLE_SORT_FIELDS[col], order == Qt.AscendingOrder) for col, order in sort_spec])
+
+        search_text = self._tab_filters.get(tab_name, "").lower()
+        if search_text:
+            nos = [no for no in nos if self._asset_matches(self.asset_manager.get_asset_by_no(tab_name, no), search_text)]
+
+        # 선택 상태는 자산 'no' 기준으로 보존
+        selected_nos = self._selected_nos(tab_name)
+        model = current_table.model()
+        model.set_rows(nos)
+        selection_model = current_table.selectionModel()
+        for no in selected_nos:
+            row = model.row_of_no(no)
+            if row != -1:
+                selection_model.select(model.index(row, 0), selection_model.Select | selection_model.Rows)
+
+        # 헤더에는 우선 정렬 컬럼의 방향을 표시
+        primary_col, primary_order = sort_spec[0]
+        current_table.horizontalHeader().setSortIndicator(primary_col, primary_order)
+
+        self.fit_table_columns(tab_name)
+
+    def fit_table_columns(self, tab_name, force=False):
+        """표본 행을 측정하여 탭 테이블의 열 너비를 맞춥니다. force가 아니면 사용자가 조절한 탭은 건너뜁니다."""
+        table = self._tab_tables.get(tab_name)
+        if not table or (tab_name in self._user_sized_tabs and not force):
+            return
+        self._fitting_columns = True
+        try:
+            self.column_sizer.fit(table)
+        finally:
+            self._fitting_columns = False
+        self._user_sized_tabs.discard(tab_name)
 
+    def fit_current_table_columns(self):
+        """현재 탭의 열 너비를 다시 자동으로 맞춥니다. (보기 메뉴)"""
+        current_index = self.tab_widget.currentIndex()
+        if current_index != -1:
+            self.fit_table_columns(self.tab_widget.tabText(current_index), force=True)
+
+    def focus_asset(self, tab_name, no):
+        """tab_name 탭으로 이동하여 자산 'no'의 행을 선택합니다. (만기 임박 화면에서 더블 클릭 시)"""
+        for index in range(self.tab_widget.count()):
+            if self.tab_widget.tabText(index) == tab_name:
+                self.tab_widget.setCurrentIndex(index)
+                break
+        table = self._tab_tables.get(tab_name)
+        if not table:
+            return
+        row = table.model().row_of_no(no)
+        if row == -1: # 검색어로 걸러진 경우
+            self._tab_filters[tab_name] = ""
+            self.load_assets_to_table(tab_name)
+            row = table.model().row_of_no(no)
+        if row != -1:
+            table.selectRow(row)
+            table.scrollTo(table.model().index(row, 0))
+
+    def _schedule_midnight_refresh(self):
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        self._midnight_timer.start(int((next_midnight - now).total_seconds() * 1000) + 1000)
+
+    def on_midnight(self):
+        """날짜가 바뀌면 D-Day 기준일을 갱신하고 보이는 테이블만 다시 그립니다."""
+        today = datetime.now().date()
+        self._asset_item_delegate.set_today(today.toordinal())
+        for table in self._tab_tables.values():
+            table.viewport().update()
+        self.maturity_view.set_today(today)
+        # 전날 스냅샷을 그날의 마지막 상태로 갱신한 뒤 새 날짜 스냅샷을 남김
+        self.asset_manager.refresh_snapshot(self._snapshot_date)
+        self._snapshot_date = today
+        self.asset_manager.take_daily_snapshot()
+        self._schedule_midnight_refresh()
+
+    def on_table_section_resized(self, tab_name, column):
+        # 마지막 컬럼은 창 크기에 따라 늘어나므로 사용자 조절로 보지 않음
+        if not self._fitting_columns and column != len(COLUMN_HEADERS) - 1:
+            self._user_sized_tabs.add(tab_name)
+
+    @staticmethod
+    def _asset_matches(asset, search_text):
+        """자산의 표시 문자열 중 하나라도 search_text(소문자)를 포함하면 True를 반환합니다."""
+        return any(search_text in format_cell(asset, col).lower() for col in range(len(COLUMN_HEADERS)))
 
     def filter_assets(self, tab_name, text):
-        current_table = self._tab_tables.get(tab_name)
-        if not current_table: return # 해당 탭의 테이블이 없으면 리턴
-
-        search_text = text.lower()
-        for row in range(current_table.rowCount()):
-            row_visible = False
-            for col in range(current_table.columnCount()): # 모든 컬럼에서 검색
-                item = current_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    row_visible = True
-                    break
-            current_table.setRowHidden(row, not row_visible)
+        """검색어를 저장하고 해당 탭의 테이블을 검색 결과로 다시 로드합니다."""
+        self._tab_filters[tab_name] = text
+        self.load_assets_to_table(tab_name)
             
     # --- 메뉴 및 툴바 액션 정의 ---
 
@@ -408,23 +580,60 @@ class MainWindow(QMainWindow):
         self.exit_action.setStatusTip("프로그램 종료")
         self.exit_action.triggered.connect(self.close)
 
-        self.export_csv_action = QAction(qta.icon('mdi.file-export'), "CSV로 내보내기", self)
-        self.export_csv_action.setStatusTip("현재 탭의 자산 데이터를 CSV 파일로 내보냅니다.")
+        self.export_csv_action = QAction(qta.icon('mdi.file-export'), "파일로 내보내기", self)
+        self.export_csv_action.setStatusTip("현재 탭의 자산 데이터를 CSV/Excel/JSON Lines/Parquet 파일로 내보냅니다.")
         self.export_csv_action.triggered.connect(self.export_current_tab_to_csv)
 
-        self.import_csv_action = QAction(qta.icon('mdi.file-import'), "CSV에서 가져오기", self)
-        self.import_csv_action.setStatusTip("CSV 파일에서 자산 데이터를 현재 탭으로 가져옵니다.")
+        self.import_csv_action = QAction(qta.icon('mdi.file-import'), "파일에서 가져오기", self)
+        self.import_csv_action.setStatusTip("CSV/Excel/JSON Lines/Parquet 파일에서 자산 데이터를 현재 탭으로 가져옵니다.")
         self.import_csv_action.triggered.connect(self.import_csv_to_current_tab)
 
+        self.snapshot_action = QAction(qta.icon('mdi.camera'), "스냅샷 저장", self)
+        self.snapshot_action.setStatusTip("모든 탭의 현재 자산 상태를 오늘 날짜 스냅샷으로 저장합니다.")
+        self.snapshot_action.triggered.connect(self.take_snapshot)
+
         # 설정 메뉴 액션
         self.password_change_action = QAction(qta.icon('mdi.key'), "비밀번호 변경", self)
         self.password_change_action.setStatusTip("로그인 비밀번호를 변경합니다.")
         self.password_change_action.triggered.connect(self.password_manager.change_password_dialog)
 
+        self.fx_rate_action = QAction(qta.icon('mdi.currency-usd'), "환율 설정", self)
+        self.fx_rate_action.setStatusTip("외화 자산의 원화 환산에 사용할 환율을 입력합니다.")
+        self.fx_rate_action.triggered.connect(self.edit_fx_rate)
+
         self.password_option_action = QAction(qta.icon('mdi.cog-outline'), "로그인 옵션", self)
         self.password_option_action.setStatusTip("로그인 옵션을 설정합니다.")
         self.password_option_action.triggered.connect(self.password_manager.password_option_dialog)
 
+        # 편집 메뉴 액션 (실행 취소 / 다시 실행)
+        self.undo_action = QAction(qta.icon('mdi.undo'), "실행 취소", self)
+        self.undo_action.setShortcut("Ctrl+Z")
+        self.undo_action.setStatusTip("마지막 변경을 되돌립니다.")
+        # triggered(bool)의 checked 인자를 넘기지 않도록 람다로 연결 (undo/redo는 쓰기 잠금 래퍼로 감싸져 있음)
+        self.undo_action.triggered.connect(lambda: self.asset_manager.undo())
+
+        self.redo_action = QAction(qta.icon('mdi.redo'), "다시 실행", self)
+        self.redo_action.setShortcut("Ctrl+Y")
+        self.redo_action.setStatusTip("되돌린 변경을 다시 적용합니다.")
+        self.redo_action.triggered.connect(lambda: self.asset_manager.redo())
+
+        self.validate_action = QAction(qta.icon('mdi.check-all'), "전체 데이터 검증", self)
+        self.validate_action.setStatusTip("모든 탭의 금액/통화/만기일/알림 값을 백그라운드에서 검사합니다.")
+        self.validate_action.triggered.connect(self.validate_all_data)
+
+        self.rebuild_indexes_action = QAction(qta.icon('mdi.database-refresh'), "색인/집계 다시 계산", self)
+        self.rebuild_indexes_action.setStatusTip("자동 완성 색인과 금액 집계를 백그라운드에서 전체 데이터로 다시 계산합니다.")
+        self.rebuild_indexes_action.triggered.connect(self.rebuild_indexes)
+
+        self.fetch_quotes_action = QAction(qta.icon('mdi.chart-line'), "시세 조회", self)
+        self.fetch_quotes_action.setStatusTip("시세 서버에서 현재 탭 보유 자산의 현재 단가와 외화 환율을 받아 적용합니다.")
+        self.fetch_quotes_action.triggered.connect(self.fetch_quotes)
+
+        # 보기 메뉴 액션
+        self.fit_columns_action = QAction(qta.icon('mdi.arrow-expand-horizontal'), "열 너비 자동 맞춤", self)
+        self.fit_columns_action.setStatusTip("현재 탭의 열 너비를 내용에 맞게 다시 조절합니다.")
+        self.fit_columns_action.triggered.connect(self.fit_current_table_columns)
+
         # 탭 관리 액션 (이제 '+' 버튼은 cornerWidget으로 이동했으므로 툴바에는 추가하지 않음)
         self.add_tab_action = QAction(qta.icon('mdi.tab-plus'), "새 탭 추가", self)
         self.add_tab_action.setStatusTip("새로운 자산 탭을 추가합니다.")
@@ -469,6 +678,11 @@ class MainWindow(QMainWindow):
 
         self.toolbar.addSeparator()
 
+        # 실행 취소 / 다시 실행 버튼
+        self.toolbar.addAction(self.undo_action)
+        self.toolbar.addAction(self.redo_action)
+        self.toolbar.addSeparator()
+
         # 새로 추가된 '자세히 보기' 액션을 툴바에 추가
         self.toolbar.addAction(self.view_details_action)
         self.toolbar.addSeparator()
@@ -484,7 +698,7 @@ class MainWindow(QMainWindow):
         self.toolbar.addAction(self.delete_tab_action)
         self.toolbar.addSeparator()
 
-        # CSV 버튼
+        # 내보내기/가져오기 버튼
         self.toolbar.addAction(self.export_csv_action)
         self.toolbar.addAction(self.import_csv_action)
         self.toolbar.addSeparator()
@@ -501,13 +715,32 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("&파일")
         file_menu.addAction(self.export_csv_action)
         file_menu.addAction(self.import_csv_action)
+        file_menu.addAction(self.snapshot_action)
         file_menu.addSeparator()
         file_menu.addAction(self.exit_action)
 
+        # 편집 메뉴
+        edit_menu = menubar.addMenu("&편집")
+        edit_menu.addAction(self.undo_action)
+        edit_menu.addAction(self.redo_action)
+        edit_menu.addSeparator()
+        edit_menu.addAction(self.validate_action)
+        edit_menu.addAction(self.rebuild_indexes_action)
+        edit_menu.addAction(self.fetch_quotes_action)
+
+        # 보기 메뉴
+        view_menu = menubar.addMenu("&보기")
+        view_menu.addAction(self.fit_columns_action)
+        view_menu.addAction(self.summary_dock.toggleViewAction())
+        view_menu.addAction(self.maturity_dock.toggleViewAction())
+        view_menu.addAction(self.net_worth_dock.toggleViewAction())
+        view_menu.addAction(self.holdings_dock.toggleViewAction())
+
         # 설정 메뉴
         settings_menu = menubar.addMenu("&설정")
         settings_menu.addAction(self.password_change_action)
         settings_menu.addAction(self.password_option_action)
+        settings_menu.addAction(self.fx_rate_action)
         
         # 탭 관리 메뉴
         tab_menu = menubar.addMenu("&탭 관리")
@@ -523,14 +756,151 @@ class MainWindow(QMainWindow):
     def create_status_bar(self):
         self.statusBar().showMessage("준비됨")
 
+    def update_undo_actions(self):
+        """실행 취소/다시 실행 액션의 활성화 상태와 텍스트를 갱신합니다."""
+        undo_stack = self.asset_manager.undo_stack
+        self.undo_action.setEnabled(undo_stack.can_undo())
+        self.redo_action.setEnabled(undo_stack.can_redo())
+        undo_text = undo_stack.undo_text()
+        redo_text = undo_stack.redo_text()
+        self.undo_action.setText(f"실행 취소: {undo_text}" if undo_text else "실행 취소")
+        self.redo_action.setText(f"다시 실행: {redo_text}" if redo_text else "다시 실행")
+
     def update_total_amount_display(self):
         """총 금액을 업데이트하는 함수."""
         current_tab_name = self.tab_widget.tabText(self.tab_widget.currentIndex())
         if current_tab_name:
             total_amount = self.asset_manager.get_total_amount_by_tab(current_tab_name)
-            self.total_amount_label.setText(f"총 금액: {format_currency(total_amount)}")
+            currency_totals = self.asset_manager.get_currency_totals_by_tab(current_tab_name)
+            fx_rates = self.asset_manager.fx_rates
+            missing_rates = [currency for currency in currency_totals if fx_rates.rate(currency) is None]
+            label_text = f"총 금액: {format_currency(total_amount)}"
+            if missing_rates:
+                label_text += f" (환율 없음: {', '.join(sorted(missing_rates))})"
+            self.total_amount_label.setText(label_text)
+            # 통화별 원래 금액은 툴팁으로 표시
+            self.total_amount_label.setToolTip("\n".join(
+                format_currency(total, currency) for currency, total in sorted(currency_totals.items())))
         else:
             self.total_amount_label.setText("총 금액: 0 원")
+            self.total_amount_label.setToolTip("")
+
+    def take_snapshot(self):
+        """모든 탭의 현재 상태를 오늘 날짜 스냅샷으로 저장합니다."""
+        if self.asset_manager.take_snapshot():
+            self.statusBar().showMessage("오늘 날짜 스냅샷을 저장했습니다.", 3000)
+        else:
+            QMessageBox.warning(self, "스냅샷 저장 실패", "스냅샷을 저장하는 중 오류가 발생했습니다.")
+
+    def validate_all_data(self):
+        """
+        모든 탭의 자산 값을 프로세스 풀에서 검사합니다. (batch_jobs.ValidationJob)
+        현재 시점의 탭 스냅샷을 검사하므로 검사 중에도 계속 편집할 수 있습니다.
+        """
+        self._start_batch_job(ValidationJob(), self.asset_manager.get_all_tab_snapshots(), self._show_validation_result)
+
+    def rebuild_indexes(self):
+        """
+        자동 완성 색인과 금액 집계를 프로세스 풀에서 전체 데이터로 다시 계산합니다. (batch_jobs.IndexRebuildJob)
+        작업 중에 데이터가 바뀌면 결과를 반영하지 않습니다.
+        """
+        snapshots = self.asset_manager.get_all_tab_snapshots()
+        job = IndexRebuildJob(self.asset_manager.get_completion_fields())
+        self._start_batch_job(job, snapshots, lambda result: self._apply_index_rebuild(result, snapshots))
+
+    def _apply_index_rebuild(self, result, snapshots):
+        drifted = self.asset_manager.apply_index_rebuild(result, snapshots)
+        if drifted is None:
+            QMessageBox.information(self, "색인/집계 다시 계산", "계산 중에 데이터가 변경되어 반영하지 않았습니다. 다시 실행하세요.")
+            return
+        if drifted:
+            self.update_total_amount_display()
+            self.summary_pane.refresh()
+        self.statusBar().showMessage("색인과 집계를 다시 계산했습니다." + (" (집계 불일치 복구)" if drifted else ""), 5000)
+
+    def _start_batch_job(self, job, snapshots, on_finished):
+        """일괄 작업을 작업 스레드에서 시작하고 취소 가능한 진행률 창을 표시합니다. (한 번에 하나만 실행)"""
+        if self._batch_runner is not None:
+            return
+        runner = BatchJobRunner(job, snapshots, parent=self)
+        progress_dialog = QProgressDialog(f"{job.name} 중...", "취소", 0, 100, self)
+        progress_dialog.setWindowTitle(job.name)
+        progress_dialog.setMinimumDuration(300) # 금방 끝나는 작업은 창을 띄우지 않음
+        progress_dialog.canceled.connect(runner.cancel)
+        runner.progress_changed.connect(
+            lambda done, total: progress_dialog.setValue(done * 100 // total if total else 100))
+        runner.job_finished.connect(on_finished)
+        runner.job_failed.connect(lambda message: QMessageBox.warning(self, f"{job.name} 실패", f"작업 중 오류가 발생했습니다.\n{message}"))
+        runner.job_cancelled.connect(lambda: self.statusBar().showMessage(f"{job.name}을(를) 취소했습니다.", 3000))
+        runner.finished.connect(progress_dialog.reset)
+        runner.finished.connect(self._batch_job_done)
+        self._batch_runner = runner
+        self.validate_action.setEnabled(False)
+        self.rebuild_indexes_action.setEnabled(False)
+        runner.start()
+
+    def _batch_job_done(self):
+        self._batch_runner.deleteLater()
+        self._batch_runner = None
+        self.validate_action.setEnabled(True)
+        self.rebuild_indexes_action.setEnabled(True)
+
+    def _show_validation_result(self, issues):
+        """검증 결과를 보여주고, 문제가 있으면 첫 번째 자산으로 이동합니다."""
+        if not issues:
+            QMessageBox.information(self, "데이터 검증", "문제가 발견되지 않았습니다.")
+            return
+        max_lines = 20
+        lines = [f"[{issue.tab_name}] No.{issue.no} {issue.field} '{issue.value}': {issue.message}" for issue in issues[:max_lines]]
+        if len(issues) > max_lines:
+            lines.append(f"... 외 {len(issues) - max_lines:,}건")
+        QMessageBox.warning(self, "데이터 검증", f"{len(issues):,}건의 문제가 발견되었습니다.\n\n" + "\n".join(lines))
+        self.focus_asset(issues[0].tab_name, issues[0].no)
+
+    def fetch_quotes(self):
+        """
+        시세 서버 주소를 입력받아 현재 탭 보유 자산의 시세와 외화 환율을 작업 스레드에서 조회합니다.
+        (quote_fetcher.QuoteFetcher, AssetTreeView.start_price_fetch) 조회 중에도 화면은 멈추지 않으며,
+        바뀐 가격은 실행 취소할 수 있는 한 번의 수정으로 적용됩니다. (한 번에 하나만 실행)
+        """
+        tab_name = self.tab_widget.tabText(self.tab_widget.currentIndex())
+        if self._quote_worker is not None or not tab_name:
+            return
+        base_url, ok = QInputDialog.getText(self, "시세 조회", "시세 서버 주소:", QLineEdit.Normal, self._quote_base_url)
+        base_url = base_url.strip()
+        if not ok or not base_url:
+            return
+        try:
+            fetcher = QuoteFetcher(base_url)
+        except RuntimeError as e: # aiohttp 없음
+            QMessageBox.warning(self, "시세 조회", str(e))
+            return
+        self._quote_base_url = base_url
+        self.holdings_view.set_data_source(self.asset_manager, tab_name)
+        self.holdings_dock.show()
+        worker = self.holdings_view.start_price_fetch(fetcher)
+        worker.fetch_failed.connect(lambda message: QMessageBox.warning(self, "시세 조회 실패", message))
+        worker.finished.connect(self._quote_fetch_done)
+        self._quote_worker = worker
+        self.fetch_quotes_action.setEnabled(False)
+        if worker.isFinished(): # 연결 전에 끝난 경우
+            self._quote_fetch_done()
+
+    def _quote_fetch_done(self):
+        self._quote_worker = None
+        self.fetch_quotes_action.setEnabled(True)
+
+    def edit_fx_rate(self):
+        """통화를 골라 오늘 날짜의 원화 환산 환율을 입력합니다."""
+        fx_rates = self.asset_manager.fx_rates
+        currencies = [currency for currency in CURRENCY_UNITS if currency != DEFAULT_CURRENCY]
+        currency, ok = QInputDialog.getItem(self, "환율 설정", "통화:", currencies, 0, False)
+        if not ok:
+            return
+        current_rate = fx_rates.rate(currency) or 0.0
+        rate, ok = QInputDialog.getDouble(self, "환율 설정", f"1 {currency} = ? 원", current_rate, 0.0, 1e9, 4)
+        if ok and rate > 0:
+            fx_rates.set_rates({currency: rate})
 
     # --- 탭 관리 기능 슬롯 ---
     def add_new_tab(self):
@@ -563,7 +933,7 @@ class MainWindow(QMainWindow):
         tab_name = self.tab_widget.tabText(index)
         reply = QMessageBox.question(self, "탭 삭제 확인",
                                      f"'{tab_name}' 탭과 그 안의 모든 자산 데이터를 정말로 삭제하시겠습니까?\n"
-                                     "이 작업은 되돌릴 수 없습니다.",
+                                     "삭제 후 '실행 취소'(Ctrl+Z)로 되돌릴 수 있습니다.",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             if self.asset_manager.delete_tab_data(tab_name):
@@ -624,7 +994,7 @@ class MainWindow(QMainWindow):
 
         reply = QMessageBox.question(self, "탭 삭제 확인",
                                      f"'{tab_name}' 탭과 그 안의 모든 자산 데이터를 정말로 삭제하시겠습니까?\n"
-                                     "이 작업은 되돌릴 수 없습니다.",
+                                     "삭제 후 '실행 취소'(Ctrl+Z)로 되돌릴 수 있습니다.",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             if self.asset_manager.delete_tab_data(tab_name):
@@ -634,52 +1004,89 @@ class MainWindow(QMainWindow):
             else:
                 QMessageBox.warning(self, "탭 삭제 실패", "탭 삭제 중 오류가 발생했습니다.")
                 
-    # --- CSV 내보내기/가져오기 기능 슬롯 ---
+    # --- 파일 내보내기/가져오기 기능 슬롯 ---
     def export_current_tab_to_csv(self):
-        """현재 탭의 자산 데이터를 CSV 파일로 내보냅니다."""
+        """현재 탭의 자산 데이터를 파일로 내보냅니다. (형식은 확장자로 결정)"""
         current_index = self.tab_widget.currentIndex()
         if current_index == -1:
-            QMessageBox.warning(self, "CSV 내보내기", "내보낼 탭을 선택해주세요.")
+            QMessageBox.warning(self, "내보내기", "내보낼 탭을 선택해주세요.")
             return
         
         tab_name = self.tab_widget.tabText(current_index)
 
         options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getSaveFileName(self, "CSV 파일로 내보내기", f"{tab_name}_자산.csv", "CSV 파일 (*.csv);;모든 파일 (*)", options=options)
+        file_path, _ = QFileDialog.getSaveFileName(self, "파일로 내보내기", f"{tab_name}_자산.csv", file_dialog_filter(), options=options)
         
         if file_path:
-            if self.asset_manager.export_data_to_csv(tab_name, file_path):
-                QMessageBox.information(self, "CSV 내보내기 성공", f"'{tab_name}' 탭의 데이터가\n'{file_path}'(으)로 성공적으로 내보내졌습니다.")
+            if self.asset_manager.export_data_to_file(tab_name, file_path):
+                QMessageBox.information(self, "내보내기 성공", f"'{tab_name}' 탭의 데이터가\n'{file_path}'(으)로 성공적으로 내보내졌습니다.")
             else:
-                QMessageBox.warning(self, "CSV 내보내기 실패", "CSV 파일 내보내기 중 오류가 발생했습니다.")
+                QMessageBox.warning(self, "내보내기 실패", "파일 내보내기 중 오류가 발생했습니다.")
 
     def import_csv_to_current_tab(self):
-        """CSV 파일에서 자산 데이터를 현재 탭으로 가져옵니다."""
+        """파일에서 자산 데이터를 현재 탭으로 가져옵니다. (형식은 확장자로 결정)"""
         current_index = self.tab_widget.currentIndex()
         if current_index == -1:
-            QMessageBox.warning(self, "CSV 가져오기", "데이터를 가져올 탭을 선택해주세요.")
+            QMessageBox.warning(self, "가져오기", "데이터를 가져올 탭을 선택해주세요.")
             return
         
         tab_name = self.tab_widget.tabText(current_index)
 
         options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getOpenFileName(self, "CSV 파일 가져오기", "", "CSV 파일 (*.csv);;모든 파일 (*)", options=options)
+        file_path, _ = QFileDialog.getOpenFileName(self, "파일 가져오기", "", file_dialog_filter(), options=options)
         
         if file_path:
-            reply = QMessageBox.question(self, "CSV 가져오기 옵션",
-                                         "기존 탭의 데이터를 지우고 가져오시겠습니까?\n"
-                                         "('예'를 누르면 기존 데이터 삭제 후 가져오기, '아니오'를 누르면 기존 데이터에 추가)",
-                                         QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.No)
-            
-            if reply == QMessageBox.Cancel:
+            option_box = QMessageBox(QMessageBox.Question, "가져오기 옵션",
+                                     "데이터를 어떻게 가져오시겠습니까?\n"
+                                     "('병합'은 자산 명 + 세부 분류 + 만기일이 같은 자산을 갱신하고 나머지만 추가)", parent=self)
+            merge_button = option_box.addButton("병합", QMessageBox.AcceptRole)
+            append_button = option_box.addButton("추가", QMessageBox.AcceptRole)
+            replace_button = option_box.addButton("삭제 후 가져오기", QMessageBox.DestructiveRole)
+            option_box.addButton(QMessageBox.Cancel)
+            option_box.setDefaultButton(merge_button)
+            option_box.exec_()
+            clicked_button = option_box.clickedButton()
+
+            if clicked_button == merge_button:
+                self.upsert_file_to_tab(tab_name, file_path)
+                return
+            if clicked_button not in (append_button, replace_button):
                 return
 
-            clear_existing = (reply == QMessageBox.Yes)
+            clear_existing = (clicked_button == replace_button)
 
-            if self.asset_manager.import_data_from_csv(tab_name, file_path, clear_existing=clear_existing):
-                QMessageBox.information(self, "CSV 가져오기 성공", f"CSV 파일의 데이터가\n'{tab_name}' 탭으로 성공적으로 가져와졌습니다.")
+            if self.asset_manager.import_data_from_file(tab_name, file_path, clear_existing=clear_existing):
+                QMessageBox.information(self, "가져오기 성공", f"파일의 데이터가\n'{tab_name}' 탭으로 성공적으로 가져와졌습니다.\n"
+                                        f"(가져오기 프로필: {self.asset_manager.import_profiles.last_detected})")
             else:
-                QMessageBox.warning(self, "CSV 가져오기 실패", "CSV 파일 가져오기 중 오류가 발생했습니다.")
+                QMessageBox.warning(self, "가져오기 실패", "파일 가져오기 중 오류가 발생했습니다.")
+
+    def upsert_file_to_tab(self, tab_name, file_path):
+        """병합 결과(추가/갱신/변경 없음 건수)를 미리 보여주고 확인하면 차이만 적용합니다."""
+        plan = self.asset_manager.plan_import_upsert(tab_name, file_path)
+        if plan is None:
+            QMessageBox.warning(self, "가져오기 실패", "파일 가져오기 중 오류가 발생했습니다.")
+            return
+        if not (plan.inserts or plan.updates):
+            QMessageBox.information(self, "병합 가져오기", f"'{tab_name}' 탭에 반영할 변경 사항이 없습니다. (변경 없음 {plan.unchanged:,}건)")
+            return
+
+        preview = (f"'{tab_name}' 탭에 다음과 같이 병합합니다.\n\n"
+                   f"추가: {len(plan.inserts):,}건\n"
+                   f"갱신: {len(plan.updates):,}건\n"
+                   f"변경 없음: {plan.unchanged:,}건")
+        if plan.duplicates:
+            preview += f"\n파일 내 중복 (마지막 행 사용): {plan.duplicates:,}건"
+        reply = QMessageBox.question(self, "병합 미리보기", preview + "\n\n적용하시겠습니까?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if reply != QMessageBox.Yes:
+            return
+        result = self.asset_manager.apply_import_upsert(plan)
+        if result is None:
+            QMessageBox.warning(self, "병합 가져오기", f"미리보기 이후 '{tab_name}' 탭이 변경되었습니다. 다시 시도하세요.")
+            return
+        inserted, updated = result
+        QMessageBox.information(self, "병합 완료", f"추가 {inserted:,}건, 갱신 {updated:,}건을 반영했습니다.")
 
     # --- 트레이 아이콘 및 종료 관련 메서드 ---
     def setup_tray_icon(self):
@@ -700,6 +1107,18 @@ class MainWindow(QMainWindow):
         self.tray_icon.activated.connect(self.handle_tray_activation)
         self.tray_icon.show()
 
+    def show_maturity_alerts(self, alerts):
+        """만기 알림 시각이 된 자산을 트레이 알림으로 표시합니다. alerts: [(탭 이름, 자산), ...]"""
+        lines = []
+        for tab_name, asset in alerts[:5]:
+            d_day = calculate_d_day(asset.get('만기일', ''))
+            d_day_text = "오늘 만기" if d_day == 0 else f"D-{d_day}"
+            lines.append(f"[{tab_name}] {asset.get('자산 명', '')} - {asset.get('만기일', '')} ({d_day_text})")
+        if len(alerts) > 5:
+            lines.append(f"외 {len(alerts) - 5}건")
+        title = "만기 알림" if len(alerts) == 1 else f"만기 알림 ({len(alerts)}건)"
+        self.tray_icon.showMessage(title, "\n".join(lines), QSystemTrayIcon.Information, 10000)
+
     def handle_tray_activation(self, reason):
         """트레이 아이콘 활성화 이벤트를 처리합니다."""
         if reason == QSystemTrayIcon.Trigger: # 클릭 시
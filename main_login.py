@@ -2,6 +2,7 @@ import sys
 import json
 import os
 import hashlib
+import multiprocessing
 import qtawesome as qta
 from datetime import datetime
 
@@ -199,6 +200,8 @@ class LoginDialog(QDialog):
 
 # 메인 실행 부분 (개발 및 테스트용)
 if __name__ == '__main__':
+    # 일괄 작업(batch_jobs)의 작업 프로세스가 실행 파일로 묶인 경우에도 시작되도록 함
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
 
     login_dialog = LoginDialog()
@@ -0,0 +1,158 @@
+import heapq
+import itertools
+import json
+import os
+from datetime import date, datetime, time
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from asset_index import AssetIndex
+from sort_index import alert_sort_key, due_date_sort_key
+
+class MaturityAlertScheduler(QObject, AssetIndex):
+    """
+    자산의 '만기일'과 '알림'("9일 전") 설정으로 알림 시각을 계산하여 최소 힙으로 관리하는 스케줄러입니다.
+    AssetDataManager.register_index()로 등록하면 추가/수정/삭제된 자산만 힙에 반영되며,
+    가장 이른 알림 시각에 맞춰 QTimer 하나만 동작하므로 전체 자산을 주기적으로 검사하지 않습니다.
+    삭제/수정된 자산의 힙 항목은 바로 지우지 않고 꺼낼 때 무효 항목으로 건너뜁니다(지연 삭제).
+    이미 알린 (no, 만기일, 알림) 조합은 파일에 기록하여, 알림 기간 안의 자산이 프로그램을 다시 시작하거나
+    자산을 수정/실행 취소할 때마다 다시 알려지지 않게 합니다. (만기일이나 알림 설정을 바꾸면 새로 알림)
+    """
+    # 알림이 발생한 자산 목록 [(탭 이름, 자산), ...] (알림 시각 순)
+    alerts_due = pyqtSignal(list)
+
+    ALERT_HOUR = 9 # 알림 당일 알림을 보낼 시각
+    MAX_TIMER_INTERVAL_MS = 24 * 60 * 60 * 1000 # 시계 변경에 대비해 최대 하루 뒤에는 다시 확인
+
+    def __init__(self, parent=None, filename="maturity_alerts_sent.json"):
+        QObject.__init__(self, parent)
+        self.filename = filename
+        self._heap = [] # (알림 시각 timestamp, 순번, no)
+        self._live = {} # no -> (순번, 탭 이름, 자산): 현재 유효한 항목
+        self._counter = itertools.count()
+        self._notified = self._load_notified() # 이미 알린 (no, 만기일, 알림) 집합
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire_due_alerts)
+
+    @staticmethod
+    def _notify_key(asset):
+        return (asset.get('no', 0), str(asset.get('만기일', '')), str(asset.get('알림', '')))
+
+    def _load_notified(self):
+        """알린 기록을 읽습니다. 만기일이 지난 기록은 다시 알릴 일이 없으므로 버립니다."""
+        if not os.path.exists(self.filename):
+            return set()
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            today = date.today().isoformat()
+            return {(int(no), due_date, alert) for no, due_date, alert in entries if due_date >= today}
+        except (json.JSONDecodeError, ValueError, TypeError) as e:
+            print(f"만기 알림 기록 파일을 읽는 중 오류 발생: {e}")
+            return set()
+
+    def _save_notified(self):
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump(sorted(self._notified), f, ensure_ascii=False, indent=4)
+        except Exception as e:
+            print(f"Error saving maturity alert history to {self.filename}: {e}")
+
+    @classmethod
+    def alert_time(cls, asset):
+        """
+        자산의 알림 시각(timestamp)을 반환합니다.
+        알림이 '없음'이거나 만기일이 없거나 이미 만기일이 지났으면 None입니다.
+        """
+        missing_alert, days_before = alert_sort_key(asset)
+        missing_due, due_ordinal = due_date_sort_key(asset)
+        if missing_alert or missing_due or due_ordinal < date.today().toordinal():
+            return None
+        alert_date = date.fromordinal(max(due_ordinal - days_before, 1))
+        return datetime.combine(alert_date, time(cls.ALERT_HOUR)).timestamp()
+
+    # --- AssetIndex 통보 처리 ---
+    def clear(self):
+        self._heap = []
+        self._live = {}
+        self._arm_timer()
+
+    def assets_added(self, tab_name, assets):
+        for asset in assets:
+            fire_time = self.alert_time(asset)
+            if fire_time is None or self._notify_key(asset) in self._notified:
+                continue
+            sequence = next(self._counter)
+            self._live[asset.get('no', 0)] = (sequence, tab_name, asset)
+            heapq.heappush(self._heap, (fire_time, sequence, asset.get('no', 0)))
+        self._arm_timer()
+
+    def assets_removed(self, tab_name, assets):
+        for asset in assets:
+            self._live.pop(asset.get('no', 0), None)
+        self._compact()
+        self._arm_timer()
+
+    def assets_updated(self, tab_name, changes):
+        # 만기일/알림이 그대로인 수정은 힙을 건드리지 않고 알림에 쓸 자산만 교체 (알림 시각 유지)
+        rescheduled_old, rescheduled_new = [], []
+        for old_asset, new_asset in changes:
+            if self._notify_key(old_asset) == self._notify_key(new_asset):
+                live = self._live.get(new_asset.get('no', 0))
+                if live is not None:
+                    self._live[new_asset.get('no', 0)] = (live[0], live[1], new_asset)
+            else:
+                rescheduled_old.append(old_asset)
+                rescheduled_new.append(new_asset)
+        if rescheduled_old:
+            self.assets_removed(tab_name, rescheduled_old)
+            self.assets_added(tab_name, rescheduled_new)
+
+    def tab_removed(self, tab_name, assets):
+        self.assets_removed(tab_name, assets)
+
+    def tab_renamed(self, old_name, new_name):
+        for no, (sequence, tab_name, asset) in self._live.items():
+            if tab_name == old_name:
+                self._live[no] = (sequence, new_name, asset)
+
+    # --- 힙/타이머 관리 ---
+    def _is_live(self, entry):
+        live = self._live.get(entry[2])
+        return live is not None and live[0] == entry[1]
+
+    def _compact(self):
+        """무효 항목이 유효 항목보다 많이 쌓이면 힙을 다시 만듭니다. (지연 삭제의 메모리 상한)"""
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def _arm_timer(self):
+        """가장 이른 유효 알림 시각에 맞춰 타이머를 설정합니다."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self._timer.stop()
+            return
+        delay_ms = int((self._heap[0][0] - datetime.now().timestamp()) * 1000)
+        self._timer.start(min(max(delay_ms, 0), self.MAX_TIMER_INTERVAL_MS))
+
+    def _fire_due_alerts(self):
+        """알림 시각이 지난 항목을 모두 꺼내 한 번에 알립니다."""
+        now = datetime.now().timestamp()
+        due_alerts = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                _, tab_name, asset = self._live.pop(entry[2])
+                due_alerts.append((tab_name, asset))
+                self._notified.add(self._notify_key(asset))
+        self._arm_timer()
+        if due_alerts:
+            self._save_notified()
+            self.alerts_due.emit(due_alerts)
+
+    def pending_count(self):
+        """아직 알리지 않은 알림 수."""
+        return len(self._live)
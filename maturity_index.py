@@ -0,0 +1,89 @@
+import bisect
+
+from asset_index import AssetIndex
+from sort_index import due_date_sort_key
+
+class _TabRef:
+    """탭 이름을 담는 참조. 탭 이름 변경 시 항목을 하나씩 고치지 않고 이 객체만 바꿉니다."""
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class MaturityIndex(AssetIndex):
+    """
+    모든 탭의 자산을 만기일(날짜 서수) 순으로 보관하는 인덱스입니다.
+    정렬된 서수 리스트와 서수 -> {no: (탭 참조, 자산)} 딕셔너리로 구성되어
+    기간 조회는 O(log n + k), 추가/삭제는 해당 만기일 버킷만 갱신합니다.
+    만기일이 없거나 잘못된 자산은 보관하지 않습니다.
+    """
+
+    def __init__(self):
+        self._ordinals = [] # 자산이 하나 이상 있는 만기일 서수 (정렬 상태)
+        self._buckets = {} # 서수 -> {no: (_TabRef, 자산)}
+        self._tab_refs = {} # 탭 이름 -> _TabRef
+
+    def clear(self):
+        self._ordinals = []
+        self._buckets = {}
+        self._tab_refs = {}
+
+    def _tab_ref(self, tab_name):
+        tab_ref = self._tab_refs.get(tab_name)
+        if tab_ref is None:
+            tab_ref = self._tab_refs[tab_name] = _TabRef(tab_name)
+        return tab_ref
+
+    def assets_added(self, tab_name, assets):
+        tab_ref = self._tab_ref(tab_name)
+        for asset in assets:
+            missing, ordinal = due_date_sort_key(asset)
+            if missing:
+                continue
+            bucket = self._buckets.get(ordinal)
+            if bucket is None:
+                bucket = self._buckets[ordinal] = {}
+                bisect.insort(self._ordinals, ordinal)
+            bucket[asset.get('no', 0)] = (tab_ref, asset)
+
+    def assets_removed(self, tab_name, assets):
+        for asset in assets:
+            missing, ordinal = due_date_sort_key(asset)
+            if missing:
+                continue
+            bucket = self._buckets.get(ordinal)
+            if bucket is None or bucket.pop(asset.get('no', 0), None) is None:
+                continue
+            if not bucket:
+                del self._buckets[ordinal]
+                del self._ordinals[bisect.bisect_left(self._ordinals, ordinal)]
+
+    def tab_removed(self, tab_name, assets):
+        self.assets_removed(tab_name, assets)
+        self._tab_refs.pop(tab_name, None)
+
+    def tab_renamed(self, old_name, new_name):
+        tab_ref = self._tab_refs.pop(old_name, None)
+        if tab_ref is not None:
+            tab_ref.name = new_name
+            self._tab_refs[new_name] = tab_ref
+
+    def between(self, start_ordinal, end_ordinal):
+        """
+        만기일 서수가 start_ordinal 이상 end_ordinal 이하인 자산을 만기일 순으로 반환합니다.
+        반환값: [(만기일 서수, 탭 이름, 자산), ...]
+        """
+        result = []
+        start = bisect.bisect_left(self._ordinals, start_ordinal)
+        end = bisect.bisect_right(self._ordinals, end_ordinal)
+        for ordinal in self._ordinals[start:end]:
+            for tab_ref, asset in self._buckets[ordinal].values():
+                result.append((ordinal, tab_ref.name, asset))
+        return result
+
+    def count_between(self, start_ordinal, end_ordinal):
+        """기간 내 만기 자산 수를 반환합니다."""
+        start = bisect.bisect_left(self._ordinals, start_ordinal)
+        end = bisect.bisect_right(self._ordinals, end_ordinal)
+        return sum(len(self._buckets[ordinal]) for ordinal in self._ordinals[start:end])
@@ -0,0 +1,145 @@
+from datetime import date, timedelta
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QTableView,
+    QAbstractItemView, QHeaderView
+)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+from asset_item_delegate import AssetItemDelegate
+from asset_table_model import AMOUNT_ROLE, DUE_ORDINAL_ROLE, CURRENCY_ROLE, format_d_day
+from sort_index import amount_sort_key, due_date_sort_key
+from utils import format_currency, asset_currency
+
+MATURITY_HEADERS = ["탭", "자산 종류", "자산 명", "금액", "만기일", "D-Day"]
+MATURITY_AMOUNT_COLUMN = 3
+MATURITY_D_DAY_COLUMN = 5
+
+class MaturityTableModel(QAbstractTableModel):
+    """만기 임박 자산 [(탭 이름, 자산), ...]을 보여주는 모델입니다. (모든 탭 대상, 만기일 순)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_entry(self, row):
+        """행의 (탭 이름, 자산)을 반환합니다."""
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(MATURITY_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        tab_name, asset = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return tab_name
+            if column == MATURITY_AMOUNT_COLUMN:
+                return format_currency(asset.get('금액', 0), asset_currency(asset))
+            if column == MATURITY_D_DAY_COLUMN:
+                return format_d_day(asset.get('만기일', ''))
+            return str(asset.get(MATURITY_HEADERS[column], ''))
+        if role == Qt.TextAlignmentRole:
+            if column == MATURITY_AMOUNT_COLUMN:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return int(Qt.AlignCenter | Qt.AlignVCenter)
+        if role == AMOUNT_ROLE:
+            missing, amount = amount_sort_key(asset)
+            return None if missing else amount
+        if role == CURRENCY_ROLE:
+            return asset_currency(asset)
+        if role == DUE_ORDINAL_ROLE:
+            missing, due_ordinal = due_date_sort_key(asset)
+            return None if missing else due_ordinal
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return MATURITY_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+class MaturityView(QWidget):
+    """
+    모든 탭에서 앞으로 N일 이내에 만기가 도래하는 자산을 보여주는 '만기 임박' 화면입니다.
+    AssetDataManager의 만기일 인덱스로 기간 조회만 하므로 전체 자산을 훑지 않습니다.
+    """
+    # 자산 더블 클릭 시 (탭 이름, 자산 no) 전달
+    asset_activated = pyqtSignal(str, int)
+
+    DEFAULT_DAYS = 30
+
+    def __init__(self, asset_manager, parent=None):
+        super().__init__(parent)
+        self.asset_manager = asset_manager
+        self._today = date.today()
+        self._init_ui()
+
+    def _init_ui(self):
+        layout = QVBoxLayout(self)
+
+        option_layout = QHBoxLayout()
+        option_layout.addWidget(QLabel("기간:"))
+        self.days_spin = QSpinBox()
+        self.days_spin.setRange(1, 3650)
+        self.days_spin.setValue(self.DEFAULT_DAYS)
+        self.days_spin.setSuffix("일 이내")
+        self.days_spin.valueChanged.connect(self.refresh)
+        option_layout.addWidget(self.days_spin)
+        option_layout.addStretch()
+        self.count_label = QLabel()
+        option_layout.addWidget(self.count_label)
+        layout.addLayout(option_layout)
+
+        self.model = MaturityTableModel(self)
+        self.delegate = AssetItemDelegate(self, MATURITY_AMOUNT_COLUMN, MATURITY_D_DAY_COLUMN)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setItemDelegate(self.delegate)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(28)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table_view.horizontalHeader().setStretchLastSection(True)
+        self.table_view.doubleClicked.connect(self._on_double_clicked)
+        layout.addWidget(self.table_view)
+
+    def set_today(self, today):
+        """기준일을 바꾸고 (자정이 지났을 때) D-Day와 조회 기간을 다시 계산합니다."""
+        self._today = today
+        self.delegate.set_today(today.toordinal())
+        self.refresh()
+
+    def refresh(self):
+        """기준일부터 설정된 기간 안에 만기가 도래하는 자산을 다시 조회합니다. 숨겨져 있으면 건너뜁니다."""
+        if not self.isVisible():
+            return
+        end_date = self._today + timedelta(days=self.days_spin.value())
+        rows = self.asset_manager.get_maturing_assets(self._today, end_date)
+        self.model.set_rows(rows)
+        self.count_label.setText(f"{len(rows)}건")
+
+    def _on_double_clicked(self, index):
+        tab_name, asset = self.model.row_entry(index.row())
+        self.asset_activated.emit(tab_name, asset.get('no', 0))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh() # 숨겨진 동안 건너뛴 갱신 반영
@@ -0,0 +1,201 @@
+from datetime import date
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel
+from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF
+
+from net_worth_history import NetWorthHistory, SERIES_TOTAL, lttb
+from utils import format_currency
+
+LINE_COLOR = QColor("#007bff")
+GRID_COLOR = QColor("#dee2e6")
+TEXT_COLOR = QColor("#6c757d")
+
+# 기간 선택 (이름, 일 수 / None은 전체)
+CHART_PERIODS = [("3개월", 92), ("1년", 366), ("3년", 366 * 3), ("전체", None)]
+# 집계 단위 선택 (이름, 단위 / None은 기간에 따라 자동)
+CHART_RESOLUTIONS = [("자동", None), ("일", 'daily'), ("주", 'weekly'), ("월", 'monthly')]
+
+def _auto_resolution(days):
+    if days <= 120:
+        return 'daily'
+    if days <= 366 * 2:
+        return 'weekly'
+    return 'monthly'
+
+
+class NetWorthChart(QWidget):
+    """
+    순자산 시계열을 QPainter로 그리는 선 그래프입니다.
+    점이 위젯 폭보다 많으면 LTTB로 줄여(폭 1픽셀당 최대 1점, MAX_POINTS 이하) 그리므로
+    이력 길이와 무관하게 그리는 비용이 일정합니다.
+    """
+    MAX_POINTS = 600
+    MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 90, 12, 12, 24
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._xs, self._ys = [], [] # 원본 점
+        self._sampled = None # 다운샘플링된 (xs, ys) (크기 변경/데이터 변경 시 다시 계산)
+        self.setMinimumHeight(180)
+
+    def set_points(self, xs, ys):
+        self._xs, self._ys = xs, ys
+        self._sampled = None
+        self.update()
+
+    def _point_budget(self):
+        return max(3, min(self.MAX_POINTS, self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._sampled = None
+
+    def _sampled_points(self):
+        if self._sampled is None:
+            positions = lttb(self._xs, self._ys, self._point_budget())
+            self._sampled = ([self._xs[p] for p in positions], [self._ys[p] for p in positions])
+        return self._sampled
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        plot = QRectF(self.MARGIN_LEFT, self.MARGIN_TOP,
+                      self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT,
+                      self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM)
+        painter.setPen(QPen(GRID_COLOR, 1))
+        painter.drawRect(plot)
+        if not self._xs:
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(plot, Qt.AlignCenter, "스냅샷 이력이 없습니다.")
+            return
+
+        xs, ys = self._sampled_points()
+        x_min, x_max = xs[0], xs[-1]
+        y_min, y_max = min(ys), max(ys)
+        if y_min == y_max:
+            y_min, y_max = y_min - 1, y_max + 1
+        x_span = max(x_max - x_min, 1)
+
+        def to_point(x, y):
+            return QPointF(plot.left() + (x - x_min) / x_span * plot.width(),
+                           plot.bottom() - (y - y_min) / (y_max - y_min) * plot.height())
+
+        # 가로 눈금선과 금액 라벨 (위/가운데/아래)
+        for ratio in (0.0, 0.5, 1.0):
+            y = plot.bottom() - ratio * plot.height()
+            painter.setPen(QPen(GRID_COLOR, 1, Qt.DashLine))
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(0, y - 8, self.MARGIN_LEFT - 6, 16), Qt.AlignRight | Qt.AlignVCenter,
+                             format_currency(y_min + ratio * (y_max - y_min)))
+        # 시작/끝 날짜 라벨
+        label_top = plot.bottom() + 4
+        painter.drawText(QRectF(plot.left(), label_top, 100, 16), Qt.AlignLeft, date.fromordinal(x_min).isoformat())
+        painter.drawText(QRectF(plot.right() - 100, label_top, 100, 16), Qt.AlignRight, date.fromordinal(x_max).isoformat())
+
+        painter.setPen(QPen(LINE_COLOR, 2))
+        if len(xs) == 1:
+            painter.drawEllipse(to_point(xs[0], ys[0]), 3, 3)
+        else:
+            painter.drawPolyline(QPolygonF([to_point(x, y) for x, y in zip(xs, ys)]))
+
+
+class NetWorthChartView(QWidget):
+    """
+    전체/탭별/자산 종류별 순자산 추이 화면입니다.
+    스냅샷 합계 이력(NetWorthHistory)에 오늘의 현재 합계를 live 점으로 더해 보여주며,
+    AssetDataManager의 변경 시그널이 오면 live 점만 갱신합니다. (숨겨진 동안은 건너뛰고 표시될 때 반영)
+    """
+
+    def __init__(self, asset_manager, parent=None):
+        super().__init__(parent)
+        self.asset_manager = asset_manager
+        self.history = NetWorthHistory()
+        self.history.load(asset_manager.get_snapshot_history())
+        self._live_dirty = True # 숨겨진 동안 현재 합계가 바뀌었는지
+        self._init_ui()
+        asset_manager.snapshot_taken.connect(self.on_snapshot_taken)
+
+    def _init_ui(self):
+        layout = QVBoxLayout(self)
+        option_layout = QHBoxLayout()
+        option_layout.addWidget(QLabel("대상:"))
+        self.series_combo = QComboBox()
+        self.series_combo.currentIndexChanged.connect(self.refresh)
+        option_layout.addWidget(self.series_combo)
+        self.period_combo = QComboBox()
+        for name, days in CHART_PERIODS:
+            self.period_combo.addItem(name, days)
+        self.period_combo.setCurrentIndex(1)
+        self.period_combo.currentIndexChanged.connect(self.refresh)
+        option_layout.addWidget(self.period_combo)
+        self.resolution_combo = QComboBox()
+        for name, resolution in CHART_RESOLUTIONS:
+            self.resolution_combo.addItem(name, resolution)
+        self.resolution_combo.currentIndexChanged.connect(self.refresh)
+        option_layout.addWidget(self.resolution_combo)
+        option_layout.addStretch()
+        layout.addLayout(option_layout)
+
+        self.chart = NetWorthChart()
+        layout.addWidget(self.chart)
+        self.value_label = QLabel()
+        layout.addWidget(self.value_label)
+
+    @staticmethod
+    def _series_name(key):
+        kind, name = key
+        if kind == 'total':
+            return "전체"
+        return f"탭: {name}" if kind == 'tab' else f"종류: {name or '(없음)'}"
+
+    def _update_series_combo(self):
+        """시계열 목록이 바뀌었으면 대상 콤보 박스를 다시 채웁니다. (선택 유지)"""
+        keys = self.history.series_keys()
+        current = [self.series_combo.itemData(i) for i in range(self.series_combo.count())]
+        if keys == current:
+            return
+        selected = self.series_combo.currentData() or SERIES_TOTAL
+        self.series_combo.blockSignals(True)
+        self.series_combo.clear()
+        for key in keys:
+            self.series_combo.addItem(self._series_name(key), key)
+        self.series_combo.setCurrentIndex(keys.index(selected) if selected in keys else 0)
+        self.series_combo.blockSignals(False)
+
+    def mark_live_dirty(self, *args):
+        """현재 합계가 바뀌었을 때 호출됩니다. (data_changed, tab_list_changed, rates_changed)"""
+        self._live_dirty = True
+        self.refresh()
+
+    def on_snapshot_taken(self):
+        self.history.load(self.asset_manager.get_snapshot_history())
+        self._live_dirty = True # 날짜가 바뀐 뒤의 스냅샷이면 live 점도 새 날짜로 옮김
+        self.refresh()
+
+    def refresh(self):
+        """선택한 대상/기간/단위의 추이를 그립니다. 창이 숨겨져 있으면 건너뜁니다."""
+        if not self.isVisible():
+            return
+        today = date.today().toordinal()
+        if self._live_dirty:
+            self.history.set_live(today, self.asset_manager.get_current_totals())
+            self._live_dirty = False
+        self._update_series_combo()
+
+        days = self.period_combo.currentData()
+        span = self.history.span()
+        start = today - days if days is not None else (span[0] if span else today)
+        resolution = self.resolution_combo.currentData() or _auto_resolution(today - start)
+        xs, ys = self.history.points(self.series_combo.currentData() or SERIES_TOTAL, resolution, start)
+        self.chart.set_points(xs, ys)
+        if ys:
+            change = ys[-1] - ys[0]
+            self.value_label.setText(f"현재: {format_currency(ys[-1])} (기간 변동: {'+' if change >= 0 else ''}{format_currency(change)})")
+        else:
+            self.value_label.setText("")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh() # 숨겨진 동안 건너뛴 갱신 반영
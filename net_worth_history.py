@@ -0,0 +1,156 @@
+import bisect
+from datetime import date
+
+SERIES_TOTAL = ('total', '') # 전체 순자산 시계열 키
+RESOLUTIONS = ('daily', 'weekly', 'monthly')
+
+def lttb(xs, ys, threshold):
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링.
+    (xs, ys) 점 목록에서 모양을 잘 보존하는 threshold개 점의 위치(인덱스) 리스트를 반환합니다.
+    점 수가 threshold 이하이면 모든 위치를 반환합니다.
+    """
+    count = len(xs)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    selected = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        # 다음 버킷의 평균점 (마지막 버킷이면 마지막 점)
+        next_start, next_end = end, min(int((bucket + 2) * bucket_size) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+        average_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+        average_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+
+        # 이전 선택점, 다음 버킷 평균점과 이루는 삼각형 넓이가 가장 큰 점 선택
+        previous_x, previous_y = xs[previous], ys[previous]
+        best, best_area = start, -1.0
+        for position in range(start, end):
+            area = abs((previous_x - average_x) * (ys[position] - previous_y)
+                       - (previous_x - xs[position]) * (average_y - previous_y))
+            if area > best_area:
+                best, best_area = position, area
+        selected.append(best)
+        previous = best
+    selected.append(count - 1)
+    return selected
+
+def _bucket_of(ordinal, resolution):
+    """resolution 단위 기간의 키 (일: 날짜, 주: 그 주 월요일, 월: (연, 월))"""
+    if resolution == 'weekly':
+        return ordinal - date.fromordinal(ordinal).weekday()
+    if resolution == 'monthly':
+        day = date.fromordinal(ordinal)
+        return (day.year, day.month)
+    return ordinal
+
+
+class NetWorthHistory:
+    """
+    스냅샷 합계 이력으로 만든 순자산 시계열입니다. (전체, 탭별, 자산 종류별)
+    모든 시계열은 같은 날짜 축을 공유하며, 주/월 단위 집계(기간 마지막 값)는
+    날짜 축 위치 목록으로 한 번만 만들어 캐시하므로 기간을 바꿔 봐도 원본 이력을 다시 훑지 않습니다.
+    오늘 합계(live)는 마지막 점만 갱신/추가하고 캐시된 집계도 마지막 기간만 갱신합니다.
+    """
+
+    def __init__(self):
+        self._ordinals = [] # 날짜 축 (date.toordinal, 오름차순)
+        self._values = {} # 시계열 키 -> 날짜 축과 같은 길이의 값 리스트
+        self._rollups = {} # 집계 단위 -> (기간 시작 날짜 리스트, 기간 마지막 점 위치 리스트)
+        self._snapshot_count = 0 # 스냅샷에서 온 점 수 (이후 점은 live)
+        self._live = None # (날짜 ordinal, 합계 딕셔너리)
+
+    @staticmethod
+    def _flatten(totals):
+        """스냅샷 합계 딕셔너리 -> {시계열 키: 값}"""
+        values = {SERIES_TOTAL: totals.get('total', 0)}
+        for tab_name, total in totals.get('tabs', {}).items():
+            values[('tab', tab_name)] = total
+        for category, total in totals.get('categories', {}).items():
+            values[('category', category or '')] = total
+        return values
+
+    def load(self, entries):
+        """스냅샷 목록 [{'date', 'totals'}, ...](날짜 순)으로 시계열을 다시 만듭니다. live 점은 유지됩니다."""
+        flattened = [self._flatten(entry.get('totals', {})) for entry in entries]
+        keys = {SERIES_TOTAL}
+        for values in flattened:
+            keys.update(values)
+        self._ordinals = [date.fromisoformat(entry['date']).toordinal() for entry in entries]
+        self._values = {key: [values.get(key, 0) for values in flattened] for key in keys}
+        self._rollups = {}
+        self._snapshot_count = len(entries)
+        if self._live is not None:
+            self.set_live(*self._live)
+
+    def set_live(self, ordinal, totals):
+        """
+        오늘(ordinal)의 현재 합계를 마지막 점으로 반영합니다. 같은 날짜의 점이 있으면 값을 바꾸고 없으면 추가합니다.
+        (시계열 수에 비례, 캐시된 집계는 마지막 기간만 갱신)
+        """
+        self._live = (ordinal, totals)
+        if self._ordinals and self._ordinals[-1] > ordinal:
+            return # 오늘 이후 날짜의 스냅샷이 있으면 live 점을 그리지 않음
+        values = self._flatten(totals)
+        appended = not self._ordinals or self._ordinals[-1] != ordinal
+        if appended:
+            self._ordinals.append(ordinal)
+            for series in self._values.values():
+                series.append(0)
+        position = len(self._ordinals) - 1
+        for key in set(self._values) | set(values):
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * len(self._ordinals)
+            series[position] = values.get(key, 0)
+
+        if appended:
+            for resolution, (buckets, positions) in self._rollups.items():
+                bucket = _bucket_of(ordinal, resolution)
+                if buckets and buckets[-1] == bucket:
+                    positions[-1] = position
+                else:
+                    buckets.append(bucket)
+                    positions.append(position)
+
+    def series_keys(self):
+        """시계열 키 목록 (전체, 탭, 자산 종류 순)"""
+        order = {'total': 0, 'tab': 1, 'category': 2}
+        return sorted(self._values, key=lambda key: (order[key[0]], key[1]))
+
+    def _rollup(self, resolution):
+        rollup = self._rollups.get(resolution)
+        if rollup is None:
+            buckets, positions = [], []
+            for position, ordinal in enumerate(self._ordinals):
+                bucket = _bucket_of(ordinal, resolution)
+                if buckets and buckets[-1] == bucket:
+                    positions[-1] = position # 기간 마지막 값(기말 잔액)을 사용
+                else:
+                    buckets.append(bucket)
+                    positions.append(position)
+            rollup = self._rollups[resolution] = (buckets, positions)
+        return rollup
+
+    def span(self):
+        """(첫 날짜 ordinal, 마지막 날짜 ordinal) 또는 이력이 없으면 None"""
+        return (self._ordinals[0], self._ordinals[-1]) if self._ordinals else None
+
+    def points(self, key, resolution='daily', start=None, end=None):
+        """
+        시계열 key의 resolution 단위 점 ([날짜 ordinal, ...], [값, ...])을 반환합니다.
+        start/end(ordinal)로 범위를 제한하며, 범위 검색은 캐시된 집계 위에서 이진 탐색합니다.
+        """
+        series = self._values.get(key)
+        if series is None:
+            return [], []
+        _, positions = self._rollup(resolution)
+        ordinals = [self._ordinals[position] for position in positions] if resolution != 'daily' else self._ordinals
+        low = bisect.bisect_left(ordinals, start) if start is not None else 0
+        high = bisect.bisect_right(ordinals, end) if end is not None else len(ordinals)
+        return ordinals[low:high], [series[position] for position in positions[low:high]]
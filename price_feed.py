@@ -0,0 +1,126 @@
+import asyncio
+import csv
+import json
+import os
+
+from valuation_engine import parse_number
+
+# 가격 파일에서 키/가격 컬럼으로 인식하는 이름 (앞의 것이 우선)
+KEY_COLUMN_NAMES = ["코드", "code", "자산 이름", "name", "symbol"]
+PRICE_COLUMN_NAMES = ["현재 단가", "price", "가격", "close"]
+
+def _pick_column(fieldnames, candidates):
+    lowered = {str(name).strip().lower(): name for name in fieldnames}
+    for candidate in candidates:
+        if candidate.lower() in lowered:
+            return lowered[candidate.lower()]
+    return None
+
+def load_price_file(file_path):
+    """
+    가격 파일을 읽어 {키: 가격} 딕셔너리로 반환합니다.
+    CSV: 헤더에 키 컬럼(코드/자산 이름 등)과 가격 컬럼(현재 단가/price 등)이 있어야 합니다.
+    JSON: {"키": 가격, ...} 또는 [{"코드": ..., "현재 단가": ...}, ...] 형식을 지원합니다.
+    가격이 숫자가 아닌 행은 건너뜁니다.
+    """
+    prices = {}
+    if os.path.splitext(file_path)[1].lower() == ".json":
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            rows = ((key, value) for key, value in data.items())
+        else:
+            rows = []
+            if data:
+                key_column = _pick_column(data[0].keys(), KEY_COLUMN_NAMES)
+                price_column = _pick_column(data[0].keys(), PRICE_COLUMN_NAMES)
+                if key_column is None or price_column is None:
+                    raise ValueError("가격 파일에서 키/가격 항목을 찾을 수 없습니다.")
+                rows = ((row.get(key_column), row.get(price_column)) for row in data)
+    else:
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            key_column = _pick_column(header, KEY_COLUMN_NAMES)
+            price_column = _pick_column(header, PRICE_COLUMN_NAMES)
+            if key_column is None or price_column is None:
+                raise ValueError("가격 파일 헤더에서 키/가격 컬럼을 찾을 수 없습니다.")
+            key_index, price_index = header.index(key_column), header.index(price_column)
+            width = max(key_index, price_index) + 1
+            rows = [(row[key_index], row[price_index]) for row in reader if len(row) >= width]
+
+    for key, value in rows:
+        price = parse_number(value)
+        if key is not None and price is not None:
+            prices[str(key).strip()] = price
+    return prices
+
+
+class PriceSource:
+    """가격 공급원의 기본 클래스입니다. fetch(keys)는 {키: 가격}을 반환합니다. (keys: 보유 자산의 키 목록)"""
+    key_field = "자산 이름" # 보유 자산에서 가격 키와 대응되는 필드
+
+    def fetch(self, keys=None):
+        raise NotImplementedError
+
+
+class FilePriceSource(PriceSource):
+    """로컬 CSV/JSON 가격 파일 공급원."""
+
+    def __init__(self, file_path, key_field="자산 이름"):
+        self.file_path = file_path
+        self.key_field = key_field
+
+    def fetch(self, keys=None):
+        return load_price_file(self.file_path)
+
+
+class AsyncPriceSource(PriceSource):
+    """
+    비동기 가격 공급원의 기본 클래스입니다. 하위 클래스는 fetch_async(keys)를 구현합니다.
+    keys는 조회할 가격 키 목록이며, 결과는 {키: 가격}입니다.
+    fetch()는 별도 이벤트 루프로 실행하는 동기 래퍼이므로 GUI 스레드에서는 작업 스레드를 통해 호출해야 합니다.
+    (AssetTreeView.apply_price_source는 quote_fetcher.QuoteFetchWorker로 조회합니다)
+    """
+    metrics = None # 요청 통계를 기록하는 공급원은 FetchMetrics를 둠 (QuoteFetcher)
+
+    async def fetch_async(self, keys):
+        raise NotImplementedError
+
+    async def fetch_fx_rates_async(self, currencies):
+        """환율을 제공하지 않는 공급원은 빈 딕셔너리를 반환합니다."""
+        return {}
+
+    def fetch(self, keys=None):
+        return asyncio.run(self.fetch_async(list(keys or [])))
+
+
+def join_prices(holdings_model, prices, key_field="자산 이름"):
+    """
+    {키: 가격}을 보유 자산 행과 해시 인덱스로 결합하여 {행 번호: 가격}으로 반환합니다.
+    (가격 수 + 일치한 행 수에 비례, 보유 자산 전체를 훑지 않음)
+    """
+    rows_by_key = holdings_model.rows_by_key(key_field)
+    row_prices = {}
+    for key, price in prices.items():
+        for row in rows_by_key.get(key, ()):
+            row_prices[row] = price
+    return row_prices
+
+
+def apply_prices(holdings_model, prices, key_field="자산 이름", asset_manager=None, tab_name=None):
+    """
+    가격을 보유 자산에 한 번의 일괄 변경으로 적용합니다.
+    asset_manager와 tab_name을 주면 가격이 바뀐 자산만 AssetDataManager.update_assets로 수정하므로
+    저장되고 실행 취소 한 번으로 되돌릴 수 있으며, 모델은 data_changed를 받아 바뀐 행만 다시 계산합니다.
+    없으면 모델의 현재 단가만 바꿉니다. (데이터 관리자와 연결되지 않은 보기)
+    반환값: (일치한 행 수, 값이 바뀌어 다시 계산된 행 수)
+    """
+    row_prices = join_prices(holdings_model, prices, key_field)
+    if asset_manager is not None:
+        updates = holdings_model.price_updates(row_prices)
+        if updates:
+            asset_manager.update_assets(tab_name, updates)
+        return len(row_prices), len(updates)
+    changed_rows = holdings_model.update_current_prices(row_prices)
+    return len(row_prices), len(changed_rows)
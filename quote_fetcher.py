@@ -0,0 +1,168 @@
+import asyncio
+import random
+import time
+from collections import deque
+from urllib.parse import quote
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from price_feed import AsyncPriceSource
+
+try:
+    import aiohttp # 선택 의존성: 시세/환율 HTTP 조회에만 필요
+except ImportError:
+    aiohttp = None
+
+class FetchMetrics:
+    """요청 지연 시간(최근 SAMPLE_SIZE건)과 요청/오류/캐시 적중 횟수를 기록합니다."""
+    SAMPLE_SIZE = 1000
+
+    def __init__(self):
+        self.latencies = deque(maxlen=self.SAMPLE_SIZE) # 초 단위
+        self.request_count = 0
+        self.error_count = 0
+        self.retry_count = 0
+        self.cache_hit_count = 0 # TTL 이내 캐시 사용
+        self.not_modified_count = 0 # 304 응답 (ETag 일치)
+
+    def record(self, latency):
+        self.request_count += 1
+        self.latencies.append(latency)
+
+    def summary(self):
+        """지연 시간 통계(ms)와 횟수를 딕셔너리로 반환합니다."""
+        samples = sorted(self.latencies)
+
+        def percentile(ratio):
+            return round(samples[min(int(len(samples) * ratio), len(samples) - 1)] * 1000, 1) if samples else 0.0
+
+        return {
+            'requests': self.request_count,
+            'errors': self.error_count,
+            'retries': self.retry_count,
+            'cache_hits': self.cache_hit_count,
+            'not_modified': self.not_modified_count,
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(samples[-1] * 1000, 1) if samples else 0.0,
+        }
+
+
+class QuoteFetcher(AsyncPriceSource):
+    """
+    HTTP 엔드포인트에서 시세와 환율을 조회하는 asyncio 클라이언트입니다.
+      GET {base_url}/quotes/{키}   -> {"price": 숫자}
+      GET {base_url}/fx/{통화 코드} -> {"rate": 숫자} (1 단위 통화의 원화 환산 값)
+    연결 수(max_connections)와 동시 요청 수(max_concurrency)를 제한하고,
+    5xx/429/연결 오류는 지수 백오프로 재시도하며, ETag(If-None-Match)와 TTL로 응답을 캐시합니다.
+    base_url만 바꾸면 로컬 대역 서버로 시험할 수 있습니다.
+    """
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, base_url, key_field="자산 이름", max_connections=8, max_concurrency=16,
+                 max_retries=3, backoff_base=0.2, timeout=5.0, cache_ttl=30.0):
+        if aiohttp is None:
+            raise RuntimeError("시세 조회에는 aiohttp 패키지가 필요합니다. (pip install aiohttp)")
+        self.base_url = base_url.rstrip('/')
+        self.key_field = key_field
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.metrics = FetchMetrics()
+        self._cache = {} # URL -> (ETag, 값, 받은 시각)
+
+    async def _get_json_value(self, session, semaphore, url, field):
+        """url의 JSON 응답에서 field 값을 반환합니다. 캐시/재시도를 적용하며 실패하면 None."""
+        cached = self._cache.get(url)
+        if cached is not None and time.monotonic() - cached[2] < self.cache_ttl:
+            self.metrics.cache_hit_count += 1
+            return cached[1]
+
+        headers = {'If-None-Match': cached[0]} if cached is not None and cached[0] else {}
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.metrics.retry_count += 1
+                # 지수 백오프 + 지터 (동시에 실패한 요청이 같은 시각에 몰리지 않도록)
+                await asyncio.sleep(self.backoff_base * (2 ** (attempt - 1)) * (0.5 + random.random()))
+            started = time.perf_counter()
+            try:
+                async with semaphore:
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304 and cached is not None:
+                            self.metrics.not_modified_count += 1
+                            self._cache[url] = (cached[0], cached[1], time.monotonic())
+                            return cached[1]
+                        if response.status in self.RETRY_STATUSES:
+                            continue
+                        if response.status != 200:
+                            break
+                        data = await response.json(content_type=None)
+                        value = float(data[field])
+                        self._cache[url] = (response.headers.get('ETag'), value, time.monotonic())
+                        return value
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                continue
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"시세 응답 형식 오류 ({url}): {e}")
+                break
+            finally:
+                self.metrics.record(time.perf_counter() - started)
+        self.metrics.error_count += 1
+        return cached[1] if cached is not None else None # 실패 시 마지막으로 받은 값 사용
+
+    async def _fetch_values(self, paths, field):
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            values = await asyncio.gather(*[
+                self._get_json_value(session, semaphore, f"{self.base_url}/{path}", field) for _, path in paths
+            ])
+        return {key: value for (key, _), value in zip(paths, values) if value is not None}
+
+    async def fetch_async(self, keys):
+        """키 목록의 시세를 동시에 조회하여 {키: 가격}을 반환합니다. (조회 실패 키는 제외)"""
+        return await self._fetch_values([(key, f"quotes/{quote(str(key), safe='')}") for key in keys], 'price')
+
+    async def fetch_fx_rates_async(self, currencies):
+        """통화 코드 목록의 환율을 조회하여 {통화 코드: 원화 환산 값}을 반환합니다."""
+        return await self._fetch_values([(currency, f"fx/{currency}") for currency in currencies], 'rate')
+
+
+class QuoteFetchWorker(QThread):
+    """
+    작업 스레드에서 자체 asyncio 이벤트 루프로 시세/환율을 조회하여 GUI 스레드를 막지 않습니다.
+    결과는 시그널로 전달되며(Qt가 GUI 스레드로 전달), 조회 후 지연 시간 통계를 보고합니다.
+    """
+    prices_fetched = pyqtSignal(dict) # {키: 가격}
+    fx_rates_fetched = pyqtSignal(dict) # {통화 코드: 원화 환산 값}
+    metrics_reported = pyqtSignal(dict) # FetchMetrics.summary()
+    fetch_failed = pyqtSignal(str)
+
+    def __init__(self, fetcher, keys=(), currencies=(), parent=None):
+        super().__init__(parent)
+        self.fetcher = fetcher
+        self.keys = list(keys)
+        self.currencies = list(currencies)
+
+    async def _fetch_all(self):
+        return await asyncio.gather(
+            self.fetcher.fetch_async(self.keys),
+            self.fetcher.fetch_fx_rates_async(self.currencies),
+        )
+
+    def run(self):
+        try:
+            prices, fx_rates = asyncio.run(self._fetch_all())
+        except Exception as e:
+            self.fetch_failed.emit(str(e))
+            return
+        if self.keys:
+            self.prices_fetched.emit(prices)
+        if self.currencies:
+            self.fx_rates_fetched.emit(fx_rates)
+        if self.fetcher.metrics is not None:
+            self.metrics_reported.emit(self.fetcher.metrics.summary())
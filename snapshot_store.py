@@ -0,0 +1,157 @@
+import gzip
+import json
+import os
+from datetime import date
+
+class SnapshotStore:
+    """
+    전체 탭 자산의 과거 상태를 날짜별 스냅샷으로 보관하는 저장소입니다.
+    스냅샷은 직전 스냅샷 대비 변경분(자산 'no' 기준 추가/변경/삭제)만 gzip JSON으로 저장하고,
+    KEYFRAME_INTERVAL개마다 전체 상태(키프레임)를 저장합니다.
+    특정 날짜의 상태는 가장 가까운 이전 키프레임부터 변경분만 적용하여 복원하므로
+    저장 용량은 포트폴리오 크기가 아니라 변경량에 비례하여 늘어납니다.
+
+    index.json에는 스냅샷 목록과 함께 합계(전체/탭별/자산 종류별)를 기록하여
+    합계 이력은 스냅샷 파일을 열지 않고 조회할 수 있습니다.
+    """
+    KEYFRAME_INTERVAL = 30 # 키프레임 사이의 변경분 스냅샷 수
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, directory="snapshots"):
+        self.directory = directory
+        self._entries = self._load_index() # [{'date', 'file', 'kind', 'totals'}, ...] (날짜 순)
+        self._last_state = None # 마지막 스냅샷의 상태 {no: [탭 이름, 자산]} (처음 필요할 때 복원)
+
+    # --- 파일 입출력 ---
+    def _path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def _load_index(self):
+        try:
+            with open(self._path(self.INDEX_FILENAME), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"스냅샷 목록을 읽는 중 오류 발생: {e}")
+            return []
+
+    def _save_index(self):
+        with open(self._path(self.INDEX_FILENAME), 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False, indent=1)
+
+    def _write_payload(self, filename, payload):
+        with gzip.open(self._path(filename), 'wt', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+
+    def _read_payload(self, filename):
+        with gzip.open(self._path(filename), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    # --- 상태 변환 ---
+    @staticmethod
+    def _state_from_assets(assets_by_tab):
+        """{탭 이름: [자산, ...]} -> (탭 순서, {no: [탭 이름, 자산]})"""
+        rows = {}
+        for tab_name, assets in assets_by_tab.items():
+            for asset in assets:
+                rows[str(asset.get('no', 0))] = [tab_name, asset]
+        return list(assets_by_tab.keys()), rows
+
+    @staticmethod
+    def _assets_from_state(tabs, rows):
+        """(탭 순서, {no: [탭 이름, 자산]}) -> {탭 이름: [자산, ...]} (탭 안은 'no' 순)"""
+        assets_by_tab = {tab_name: [] for tab_name in tabs}
+        for no in sorted(rows, key=int):
+            tab_name, asset = rows[no]
+            assets_by_tab.setdefault(tab_name, []).append(asset)
+        return assets_by_tab
+
+    def _state_at(self, position):
+        """position번째 스냅샷의 (탭 순서, {no: [탭 이름, 자산]})을 복원합니다. (O(키프레임 이후 변경분))"""
+        keyframe_position = position
+        while self._entries[keyframe_position]['kind'] != 'keyframe':
+            keyframe_position -= 1
+        keyframe = self._read_payload(self._entries[keyframe_position]['file'])
+        tabs, rows = keyframe['tabs'], keyframe['rows']
+        for entry in self._entries[keyframe_position + 1:position + 1]:
+            delta = self._read_payload(entry['file'])
+            for no in delta['removed']:
+                rows.pop(no, None)
+            rows.update(delta['upserted'])
+            tabs = delta.get('tabs', tabs)
+        return tabs, rows
+
+    # --- 공개 API ---
+    def entries(self):
+        """스냅샷 목록 [{'date', 'kind', 'totals'}, ...]을 날짜 순으로 반환합니다."""
+        return [{'date': entry['date'], 'kind': entry['kind'], 'totals': entry.get('totals', {})} for entry in self._entries]
+
+    def has_snapshot(self, on_date):
+        """on_date(datetime.date)에 저장된 스냅샷이 있으면 True를 반환합니다."""
+        day = on_date.isoformat()
+        return any(entry['date'] == day for entry in self._entries)
+
+    def take_snapshot(self, assets_by_tab, totals=None, on_date=None):
+        """
+        현재 상태를 on_date(기본 오늘) 스냅샷으로 저장합니다. 같은 날짜의 마지막 스냅샷이 있으면 교체합니다.
+        totals: index.json에 함께 기록할 합계 딕셔너리 (예: {'total': ..., 'tabs': {...}, 'categories': {...}})
+        반환값: 저장된 스냅샷 종류 ('keyframe' 또는 'delta')
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        day = (on_date or date.today()).isoformat()
+        if self._entries and self._entries[-1]['date'] > day:
+            raise ValueError(f"마지막 스냅샷({self._entries[-1]['date']})보다 이전 날짜로 저장할 수 없습니다.")
+
+        if self._entries and self._entries[-1]['date'] == day:
+            # 같은 날짜는 교체: 마지막 항목을 지우고 그 직전 상태와 비교
+            replaced = self._entries.pop()
+            try:
+                os.remove(self._path(replaced['file']))
+            except OSError:
+                pass
+            self._last_state = None
+
+        tabs, rows = self._state_from_assets(assets_by_tab)
+        deltas_since_keyframe = 0
+        for entry in reversed(self._entries):
+            if entry['kind'] == 'keyframe':
+                break
+            deltas_since_keyframe += 1
+
+        if not self._entries or deltas_since_keyframe + 1 >= self.KEYFRAME_INTERVAL:
+            kind = 'keyframe'
+            payload = {'tabs': tabs, 'rows': rows}
+        else:
+            if self._last_state is None:
+                self._last_state = self._state_at(len(self._entries) - 1)
+            previous_tabs, previous_rows = self._last_state
+            kind = 'delta'
+            payload = {
+                'upserted': {no: row for no, row in rows.items() if previous_rows.get(no) != row},
+                'removed': [no for no in previous_rows if no not in rows],
+            }
+            if tabs != previous_tabs:
+                payload['tabs'] = tabs
+
+        filename = f"{day}.{kind}.json.gz"
+        self._write_payload(filename, payload)
+        self._entries.append({'date': day, 'file': filename, 'kind': kind, 'totals': totals or {}})
+        self._save_index()
+        self._last_state = (tabs, rows)
+        return kind
+
+    def load_snapshot(self, on_date):
+        """
+        on_date(datetime.date) 시점(그 날짜 이전의 가장 최근 스냅샷)의 {탭 이름: [자산, ...]}을 반환합니다.
+        해당 시점 이전 스냅샷이 없으면 None입니다.
+        """
+        day = on_date.isoformat()
+        position = None
+        for index, entry in enumerate(self._entries):
+            if entry['date'] > day:
+                break
+            position = index
+        if position is None:
+            return None
+        return self._assets_from_state(*self._state_at(position))
@@ -0,0 +1,221 @@
+import bisect
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+
+from asset_index import AssetIndex
+
+# 정렬 키는 (0, 값) 형태이며, 값이 없거나 잘못된 경우 (1, 0)으로 오름차순 정렬 시 맨 뒤에 놓입니다.
+_MISSING = (1, 0)
+
+def amount_sort_key(asset):
+    """'금액' 필드의 정수 정렬 키. ("1,000" 같은 문자열도 숫자로 비교)"""
+    try:
+        return (0, int(str(asset.get('금액', '')).replace(',', '').strip()))
+    except ValueError:
+        return _MISSING
+
+@lru_cache(maxsize=4096)
+def _parse_due_date(text):
+    # 같은 만기일 문자열이 반복되는 경우가 많아 strptime 결과를 캐시 (대량 추가 시 인덱스들이 모두 사용)
+    try:
+        return (0, datetime.strptime(text, "%Y-%m-%d").toordinal())
+    except (ValueError, TypeError):
+        return _MISSING
+
+def due_date_sort_key(asset):
+    """'만기일' 필드의 날짜 서수(ordinal) 정렬 키. D-Day 컬럼도 이 키로 정렬됩니다."""
+    try:
+        return _parse_due_date(asset.get('만기일', ''))
+    except TypeError: # 해시할 수 없는 값
+        return _MISSING
+
+def alert_sort_key(asset):
+    """'알림' 필드("9일 전")의 일수 정렬 키. '없음'은 맨 뒤로 보냅니다."""
+    alert_value = str(asset.get('알림', ''))
+    if alert_value.endswith("일 전"):
+        try:
+            return (0, int(alert_value[:-len("일 전")].strip()))
+        except ValueError:
+            pass
+    return _MISSING
+
+def text_sort_key(field_name):
+    """대소문자를 구분하지 않는 문자열 정렬 키 함수를 만듭니다."""
+    def key(asset):
+        return (0, str(asset.get(field_name, '')).casefold())
+    return key
+
+# 필드 이름 -> 정렬 키 함수
+SORT_KEY_FUNCS = {
+    '자산 종류': text_sort_key('자산 종류'),
+    '세부 분류': text_sort_key('세부 분류'),
+    '자산 명': text_sort_key('자산 명'),
+    '금액': amount_sort_key,
+    '만기일': due_date_sort_key,
+    '알림': alert_sort_key,
+    '비고': text_sort_key('비고'),
+}
+
+
+class _Descending:
+    """다중 컬럼 정렬에서 특정 컬럼만 내림차순으로 비교하기 위한 키 래퍼."""
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+class _TabSortState:
+    """탭 하나의 정렬 상태: 'no' -> 자산, 정렬 스펙 -> 정렬된 (키, no) 리스트."""
+
+    def __init__(self):
+        self.rows = {}
+        self.sorted_lists = OrderedDict() # 최근 사용 순서 유지 (캐시 상한 관리)
+
+
+class AssetSortIndex(AssetIndex):
+    """
+    탭별 정렬 순열(permutation) 캐시입니다.
+    정렬 스펙 [(필드 이름, 오름차순 여부), ...]마다 (정렬 키, no) 리스트를 한 번 만들어 두고,
+    이후 자산 추가/삭제는 bisect로 해당 위치만 갱신하고, 한 번에 많은 행이 바뀌면(가져오기, 일괄 삭제 등)
+    리스트를 한 번 훑어 병합/제거합니다.
+    내림차순은 오름차순 리스트를 뒤집어 사용하므로 방향별로 따로 정렬하지 않습니다.
+    """
+    MAX_SPECS_PER_TAB = 8 # 탭별로 유지하는 정렬 스펙 수 (초과 시 가장 오래 쓰지 않은 것부터 버림)
+    BULK_CHANGE_ROWS = 32 # 이보다 많은 행의 추가/삭제는 행마다 bisect하지 않고 리스트 전체를 한 번에 갱신
+
+    def __init__(self):
+        self._tabs = {}
+
+    def clear(self):
+        self._tabs = {}
+
+    def _state(self, tab_name):
+        state = self._tabs.get(tab_name)
+        if state is None:
+            state = _TabSortState()
+            self._tabs[tab_name] = state
+        return state
+
+    @staticmethod
+    def _normalize_spec(sort_spec):
+        """
+        첫 컬럼이 오름차순이 되도록 정규화한 스펙과 뒤집기 여부를 반환합니다.
+        예: [('금액', False)] -> ((('금액', True),), True)
+        """
+        spec = tuple((field_name, bool(ascending)) for field_name, ascending in sort_spec)
+        if spec and not spec[0][1]:
+            return tuple((field_name, not ascending) for field_name, ascending in spec), True
+        return spec, False
+
+    @staticmethod
+    def _row_key(spec, asset):
+        parts = []
+        for field_name, ascending in spec:
+            key = SORT_KEY_FUNCS[field_name](asset)
+            parts.append(key if ascending else _Descending(key))
+        return (tuple(parts), asset.get('no', 0))
+
+    def _build(self, state, spec):
+        """정렬 리스트를 만듭니다. 다중 컬럼이면 첫 컬럼의 캐시를 재사용하여 동점 구간만 정렬합니다."""
+        primary = spec[:1]
+        if len(spec) > 1 and primary in state.sorted_lists:
+            result = []
+            primary_list = state.sorted_lists[primary]
+            start = 0
+            while start < len(primary_list):
+                end = start + 1
+                primary_key = primary_list[start][0]
+                while end < len(primary_list) and primary_list[end][0] == primary_key:
+                    end += 1
+                run = [self._row_key(spec, state.rows[no]) for _, no in primary_list[start:end]]
+                if len(run) > 1:
+                    run.sort()
+                result.extend(run)
+                start = end
+            return result
+        return sorted(self._row_key(spec, asset) for asset in state.rows.values())
+
+    def _sorted_list(self, tab_name, sort_spec):
+        state = self._state(tab_name)
+        spec, reverse = self._normalize_spec(sort_spec)
+        sorted_list = state.sorted_lists.get(spec)
+        if sorted_list is None:
+            sorted_list = self._build(state, spec)
+            state.sorted_lists[spec] = sorted_list
+            while len(state.sorted_lists) > self.MAX_SPECS_PER_TAB:
+                state.sorted_lists.popitem(last=False)
+        else:
+            state.sorted_lists.move_to_end(spec)
+        return sorted_list, reverse
+
+    def sorted_nos(self, tab_name, sort_spec):
+        """sort_spec 순서로 정렬된 탭의 자산 'no' 리스트를 반환합니다."""
+        if not sort_spec:
+            return list(self._state(tab_name).rows)
+        sorted_list, reverse = self._sorted_list(tab_name, sort_spec)
+        nos = [no for _, no in sorted_list]
+        if reverse:
+            nos.reverse()
+        return nos
+
+    def get_asset(self, tab_name, no):
+        """탭에서 'no'에 해당하는 자산을 반환합니다. 없으면 None."""
+        state = self._tabs.get(tab_name)
+        return state.rows.get(no) if state is not None else None
+
+    def sorted_assets(self, tab_name, sort_spec):
+        """sort_spec 순서로 정렬된 탭의 자산 리스트를 반환합니다."""
+        rows = self._state(tab_name).rows
+        return [rows[no] for no in self.sorted_nos(tab_name, sort_spec)]
+
+    # --- AssetIndex 통보 처리 ---
+    def assets_added(self, tab_name, assets):
+        state = self._state(tab_name)
+        for asset in assets:
+            state.rows[asset.get('no', 0)] = asset
+        if len(assets) > self.BULK_CHANGE_ROWS:
+            # 정렬 키 계산이 비용의 대부분이므로 가장 최근에 쓴 스펙(화면에 보이는 정렬)만 갱신하고
+            # 나머지는 버려 다시 요청될 때 만듭니다.
+            while len(state.sorted_lists) > 1:
+                state.sorted_lists.popitem(last=False)
+            for spec, sorted_list in state.sorted_lists.items():
+                # 정렬된 기존 리스트 뒤에 붙여 정렬하면 Timsort가 두 구간을 병합하므로 O(n + k log k)
+                sorted_list.extend(self._row_key(spec, asset) for asset in assets)
+                sorted_list.sort()
+            return
+        for spec, sorted_list in state.sorted_lists.items():
+            for asset in assets:
+                bisect.insort(sorted_list, self._row_key(spec, asset))
+
+    def assets_removed(self, tab_name, assets):
+        state = self._tabs.get(tab_name)
+        if state is None:
+            return
+        for asset in assets:
+            state.rows.pop(asset.get('no', 0), None)
+        if len(assets) > self.BULK_CHANGE_ROWS:
+            removed_nos = {asset.get('no', 0) for asset in assets}
+            for sorted_list in state.sorted_lists.values():
+                sorted_list[:] = [entry for entry in sorted_list if entry[1] not in removed_nos]
+            return
+        for spec, sorted_list in state.sorted_lists.items():
+            for asset in assets:
+                row_key = self._row_key(spec, asset)
+                position = bisect.bisect_left(sorted_list, row_key)
+                if position < len(sorted_list) and sorted_list[position] == row_key:
+                    del sorted_list[position]
+
+    def tab_removed(self, tab_name, assets):
+        self._tabs.pop(tab_name, None)
+
+    def tab_renamed(self, old_name, new_name):
+        if old_name in self._tabs:
+            self._tabs[new_name] = self._tabs.pop(old_name)
@@ -0,0 +1,89 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QCheckBox, QLabel,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt
+
+from aggregation_engine import GROUP_DIMENSIONS
+from utils import format_currency
+
+class SummaryPane(QWidget):
+    """
+    그룹별 집계(합계, 건수, 최소, 최대, 비중)를 보여주는 요약 창입니다.
+    집계는 AssetDataManager의 AggregationEngine이 증분으로 유지하므로
+    refresh()는 그룹 수에 비례하는 비용만 듭니다.
+    """
+    SUMMARY_HEADERS = ["그룹", "합계", "건수", "최소", "최대", "비중"]
+
+    def __init__(self, asset_manager, parent=None):
+        super().__init__(parent)
+        self.asset_manager = asset_manager
+        self._tab_name = None # 현재 탭 (current_tab_only일 때 집계 범위)
+        self._init_ui()
+
+    def _init_ui(self):
+        layout = QVBoxLayout(self)
+
+        option_layout = QHBoxLayout()
+        option_layout.addWidget(QLabel("기준:"))
+        self.dimension_combo = QComboBox()
+        self.dimension_combo.addItems(list(GROUP_DIMENSIONS.keys()))
+        self.dimension_combo.currentIndexChanged.connect(self.refresh)
+        option_layout.addWidget(self.dimension_combo)
+
+        self.current_tab_only_check = QCheckBox("현재 탭만")
+        self.current_tab_only_check.setChecked(True)
+        self.current_tab_only_check.toggled.connect(self.refresh)
+        option_layout.addWidget(self.current_tab_only_check)
+        option_layout.addStretch()
+        layout.addLayout(option_layout)
+
+        self.summary_table = QTableWidget(0, len(self.SUMMARY_HEADERS))
+        self.summary_table.setHorizontalHeaderLabels(self.SUMMARY_HEADERS)
+        self.summary_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.summary_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.summary_table.verticalHeader().setVisible(False)
+        self.summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents) # 그룹 수만큼의 행만 측정
+        self.summary_table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.summary_table)
+
+        self.total_label = QLabel()
+        layout.addWidget(self.total_label)
+
+    def set_current_tab(self, tab_name):
+        """집계 범위로 사용할 현재 탭을 설정하고 다시 표시합니다."""
+        self._tab_name = tab_name
+        self.refresh()
+
+    def refresh(self):
+        """현재 기준/범위의 집계를 표시합니다. 창이 숨겨져 있으면 건너뜁니다."""
+        if not self.isVisible():
+            return
+        tab_name = self._tab_name if self.current_tab_only_check.isChecked() else None
+        if self.current_tab_only_check.isChecked() and not tab_name:
+            summaries = []
+        else:
+            summaries = self.asset_manager.get_group_summary(self.dimension_combo.currentText(), tab_name)
+
+        self.summary_table.setRowCount(len(summaries))
+        for row, summary in enumerate(summaries):
+            cells = [
+                summary.value or "(없음)",
+                format_currency(summary.total),
+                str(summary.count),
+                format_currency(summary.minimum) if summary.minimum is not None else "-",
+                format_currency(summary.maximum) if summary.maximum is not None else "-",
+                f"{summary.share * 100:.1f}%",
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment((Qt.AlignLeft if column == 0 else Qt.AlignRight) | Qt.AlignVCenter)
+                self.summary_table.setItem(row, column, item)
+
+        scope_total = sum(summary.total for summary in summaries)
+        scope_text = f"'{tab_name}' 탭" if tab_name else "전체 탭"
+        self.total_label.setText(f"{scope_text} 합계: {format_currency(scope_total)}")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh() # 숨겨진 동안 건너뛴 갱신 반영
@@ -0,0 +1,32 @@
+import os
+import sys
+
+# 화면 없이 Qt 위젯을 만들 수 있도록 offscreen 플랫폼을 기본으로 사용
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# 저장소 루트의 모듈(asset_data_manager 등)을 바로 임포트할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """테스트 세션 전체에서 공유하는 QApplication 인스턴스입니다."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """데이터 파일(assets.json, 목록 파일 등)이 임시 디렉터리에 만들어지도록 작업 디렉터리를 옮깁니다."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def manager(qapp, workdir):
+    """임시 디렉터리에 데이터를 저장하는 AssetDataManager입니다. '예금' 탭이 하나 만들어져 있습니다."""
+    from asset_data_manager import AssetDataManager
+    asset_manager = AssetDataManager()
+    asset_manager.add_tab_data("예금")
+    return asset_manager
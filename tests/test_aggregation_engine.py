@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from aggregation_engine import AggregationEngine, NO_MATURITY
+
+
+def _asset(no, category, amount, currency="KRW", due_date=""):
+    return {"no": no, "자산 종류": category, "세부 분류": "", "금액": amount, "통화": currency, "만기일": due_date}
+
+
+def _summary(engine, dimension, tab_name=None):
+    return [(group.value, group.total, group.count, group.minimum, group.maximum)
+            for group in engine.summarize(dimension, tab_name)]
+
+
+def test_group_totals_and_share():
+    engine = AggregationEngine()
+    engine.assets_added("A", [_asset(1, "현금", 100), _asset(2, "현금", 300), _asset(3, "투자", 600)])
+    engine.assets_added("B", [_asset(4, "현금", 1000, due_date="2030-05-01")])
+
+    assert _summary(engine, "자산 종류", "A") == [("투자", 600, 1, 600, 600), ("현금", 400, 2, 100, 300)]
+    assert _summary(engine, "자산 종류") == [("현금", 1400, 3, 100, 1000), ("투자", 600, 1, 600, 600)]
+    assert [group.share for group in engine.summarize("탭")] == [pytest.approx(0.5), pytest.approx(0.5)]
+    assert {group.value for group in engine.summarize("만기월")} == {NO_MATURITY, "2030-05"}
+    assert engine.tab_total("A") == 1000
+    assert engine.grand_total() == 2000
+
+
+def test_invalid_amount_is_counted_but_not_summed():
+    engine = AggregationEngine()
+    engine.assets_added("A", [_asset(1, "현금", "abc"), _asset(2, "현금", 50)])
+    assert _summary(engine, "자산 종류") == [("현금", 50, 2, 50, 50)]
+
+
+def test_currencies_are_converted_at_query_time():
+    rates = {"KRW": 1.0, "USD": 1300.0}
+    engine = AggregationEngine(rates.get)
+    engine.assets_added("A", [_asset(1, "투자", 10, "USD"), _asset(2, "투자", 1000), _asset(3, "투자", 5, "JPY")])
+
+    assert engine.currency_totals("A") == {"USD": 10, "KRW": 1000, "JPY": 5}
+    # 환율이 없는 통화(JPY)는 환산 합계에서 제외
+    assert engine.tab_total("A") == pytest.approx(14000)
+    rates["USD"] = 1400.0
+    assert engine.tab_total("A") == pytest.approx(15000)
+
+
+def test_incremental_updates_match_rebuild():
+    random.seed(5)
+    engine = AggregationEngine()
+    rows = {}
+    for no in range(1, 301):
+        asset = _asset(no, random.choice("가나다"), random.randint(0, 1000))
+        rows[no] = asset
+        engine.assets_added("A", [asset])
+    for no in random.sample(list(rows), 100):
+        old = rows[no]
+        new = _asset(no, random.choice("가나다"), random.randint(0, 1000))
+        engine.assets_updated("A", [(old, new)])
+        rows[no] = new
+    removed = [rows.pop(no) for no in random.sample(list(rows), 50)]
+    engine.assets_removed("A", removed)
+
+    fresh = AggregationEngine()
+    fresh.assets_added("A", list(rows.values()))
+    assert _summary(engine, "자산 종류") == _summary(fresh, "자산 종류")
+    assert engine.category_totals() == fresh.category_totals()
+
+
+def test_tab_rename_and_remove():
+    engine = AggregationEngine()
+    engine.assets_added("A", [_asset(1, "현금", 100)])
+    engine.tab_renamed("A", "B")
+    assert engine.tab_total("B") == 100
+    assert _summary(engine, "탭") == [("B", 100, 1, 100, 100)]
+    engine.tab_removed("B", [])
+    assert engine.grand_total() == 0
+    assert engine.summarize("자산 종류") == []
@@ -0,0 +1,136 @@
+from asset_formats import write_assets
+
+
+def _asset(name, amount, **fields):
+    asset = {"자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": name, "금액": amount,
+             "통화": "KRW", "만기일": "", "알림": "없음", "비고": ""}
+    asset.update(fields)
+    return asset
+
+
+def _collect(signal):
+    received = []
+    signal.connect(lambda *args: received.append(args))
+    return received
+
+
+def test_add_assets_assigns_consecutive_nos_and_emits_once(manager):
+    changed = _collect(manager.data_changed)
+    added = manager.add_assets("예금", [_asset("A", 100), _asset("B", 200, 만기일="2030-01-31"), _asset("C", 300)])
+
+    assert [asset["no"] for asset in added] == [1, 2, 3]
+    assert manager.get_assets_by_tab("예금") == added
+    assert changed == [("예금",)]
+    # 빈 만기일은 저장하지 않음
+    assert "만기일" not in added[0]
+    assert added[1]["만기일"] == "2030-01-31"
+
+
+def test_add_assets_to_unknown_tab_does_nothing(manager):
+    undo_depth = len(manager.undo_stack._undo)
+    assert manager.add_assets("없는 탭", [_asset("A", 100)]) == []
+    assert manager.add_assets("예금", []) == []
+    assert len(manager.undo_stack._undo) == undo_depth
+
+
+def test_update_assets_applies_batch_and_keeps_no(manager):
+    first, second = manager.add_assets("예금", [_asset("A", 100), _asset("B", 200)])
+    changed = _collect(manager.data_changed)
+
+    count = manager.update_assets("예금", [
+        (first, _asset("A", 150)),
+        (second, _asset("B2", 200)),
+        ({"no": 99}, _asset("없음", 1)),
+    ])
+
+    assert count == 2
+    assert [(asset["no"], asset["자산 명"], asset["금액"]) for asset in manager.get_assets_by_tab("예금")] == \
+        [(1, "A", 150), (2, "B2", 200)]
+    assert changed == [("예금",)]
+    # 원래 딕셔너리는 바뀌지 않음 (새 딕셔너리로 교체)
+    assert first["금액"] == 100
+
+
+def test_update_without_content_change_is_not_recorded(manager):
+    asset, = manager.add_assets("예금", [_asset("A", 100)])
+    undo_depth = len(manager.undo_stack._undo)
+    changed = _collect(manager.data_changed)
+
+    assert manager.update_assets("예금", [(asset, _asset("A", 100))]) == 1
+    assert len(manager.undo_stack._undo) == undo_depth
+    assert changed == []
+
+
+def test_delete_assets_by_no(manager):
+    manager.add_assets("예금", [_asset("A", 100), _asset("B", 200), _asset("C", 300)])
+    assert manager.delete_assets_by_no("예금", [1, 3])
+    assert [asset["자산 명"] for asset in manager.get_assets_by_tab("예금")] == ["B"]
+    assert not manager.delete_assets_by_no("예금", [42])
+
+
+def test_assets_survive_reload(manager):
+    from asset_data_manager import AssetDataManager
+
+    manager.add_assets("예금", [_asset("A", 100), _asset("B", 200)])
+    reloaded = AssetDataManager()
+    assert [asset["자산 명"] for asset in reloaded.get_assets_by_tab("예금")] == ["A", "B"]
+    # 다음 번호는 저장된 최대 번호 다음부터
+    assert reloaded.add_assets("예금", [_asset("C", 300)])[0]["no"] == 3
+
+
+def _existing(manager):
+    return manager.add_assets("예금", [_asset("A", 100), _asset("B", 200, 만기일="2030-01-31"), _asset("C", 300)])
+
+
+def test_plan_classifies_inserts_updates_unchanged_and_duplicates(manager, workdir):
+    _existing(manager)
+    path = str(workdir / "병합.csv")
+    write_assets(path, [
+        _asset("A", 100), # 변경 없음 (금액은 숫자로 비교)
+        _asset("B", 250, 만기일="2030-01-31", 비고="첫 행"), # 같은 키가 뒤에 다시 나옴
+        _asset("B", 260, 만기일="2030-01-31", 비고="둘째 행"), # 갱신
+        _asset("B", 999, 만기일="2031-01-31"), # 만기일이 다르면 다른 자산 -> 추가
+        _asset("D", 400), # 추가
+    ])
+
+    plan = manager.plan_import_upsert("예금", path)
+    assert (plan.unchanged, plan.duplicates) == (1, 1)
+    assert sorted((asset["자산 명"], asset["만기일"]) for asset in plan.inserts) == [("B", "2031-01-31"), ("D", "")]
+    [(current, replacement)] = plan.updates
+    assert current["no"] == 2
+    assert (replacement["no"], replacement["비고"], int(replacement["금액"])) == (2, "둘째 행", 260)
+    # 계획만 만들고 데이터는 바꾸지 않음
+    assert [asset["금액"] for asset in manager.get_assets_by_tab("예금")] == [100, 200, 300]
+
+
+def test_apply_upsert_is_one_undoable_change(manager, workdir):
+    _existing(manager)
+    path = str(workdir / "병합.jsonl")
+    write_assets(path, [_asset("C", 350), _asset("E", 500)])
+    undo_depth = len(manager.undo_stack._undo)
+
+    assert manager.apply_import_upsert(manager.plan_import_upsert("예금", path)) == (1, 1)
+    assets = manager.get_assets_by_tab("예금")
+    assert [(asset["no"], asset["자산 명"], int(asset["금액"])) for asset in assets] == [
+        (1, "A", 100), (2, "B", 200), (3, "C", 350), (4, "E", 500)]
+    assert len(manager.undo_stack._undo) == undo_depth + 1
+
+    manager.undo()
+    assert [(asset["자산 명"], asset["금액"]) for asset in manager.get_assets_by_tab("예금")] == [
+        ("A", 100), ("B", 200), ("C", 300)]
+
+
+def test_stale_or_empty_plan(manager, workdir):
+    _existing(manager)
+    path = str(workdir / "병합.jsonl")
+    write_assets(path, [_asset("A", 100)])
+    assert manager.apply_import_upsert(manager.plan_import_upsert("예금", path)) == (0, 0)
+
+    write_assets(path, [_asset("A", 150)])
+    plan = manager.plan_import_upsert("예금", path)
+    manager.add_assets("예금", [_asset("Z", 1)]) # 계획 후 탭이 바뀜
+    assert manager.apply_import_upsert(plan) is None
+    assert manager.get_assets_by_tab("예금")[0]["금액"] == 100
+
+    assert manager.plan_import_upsert("없는 탭", path) is None
+    assert manager.plan_import_upsert("예금", str(workdir / "없음.csv")) is None
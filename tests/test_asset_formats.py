@@ -0,0 +1,74 @@
+from datetime import date, datetime
+
+import pytest
+
+import asset_formats
+from asset_formats import _FORMATS, cell_text, file_dialog_filter, format_for_path, read_assets, write_assets
+
+
+def _asset(no, name, amount, **fields):
+    asset = {"no": no, "자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": name, "금액": amount,
+             "알림": "없음", "비고": ""}
+    asset.update(fields)
+    return asset
+
+
+ASSETS = [
+    _asset(1, "원화 예금", 1500000, 만기일="2030-01-31", 비고="쉼표, \"따옴표\" 포함"),
+    _asset(2, "달러 예금", 2500, 통화="usd"),
+    _asset(3, "빈 값", 0),
+]
+
+
+@pytest.fixture(params=[file_format.name for file_format in _FORMATS])
+def file_format(request):
+    file_format = next(file_format for file_format in _FORMATS if file_format.name == request.param)
+    if not file_format.available():
+        pytest.skip(f"{file_format.requirement}가 설치되어 있지 않음")
+    return file_format
+
+
+def test_round_trip_normalizes_values(file_format, tmp_path):
+    path = str(tmp_path / ("자산" + file_format.extensions[0]))
+    write_assets(path, ASSETS)
+    [batch] = list(read_assets(path))
+
+    assert all("no" not in asset_data for asset_data in batch)
+    assert [asset_data["금액"] for asset_data in batch] == ["1500000", "2500", "0"]
+    assert [asset_data["통화"] for asset_data in batch] == ["KRW", "USD", "KRW"]
+    assert [asset_data["만기일"] for asset_data in batch] == ["2030-01-31", "", ""]
+    assert batch[0]["비고"] == "쉼표, \"따옴표\" 포함"
+    assert batch[2]["자산 명"] == "빈 값"
+
+
+def test_read_assets_batches_and_skips_blank_rows(tmp_path):
+    path = tmp_path / "자산.csv"
+    path.write_text("자산 명,금액,기타\nA,\"1,000\",x\n,,\nB,2000,y\nC,,z\n", encoding="utf-8-sig")
+    batches = list(read_assets(str(path), batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [(asset_data["자산 명"], asset_data["금액"]) for batch in batches for asset_data in batch] == [
+        ("A", "1000"), ("B", "2000"), ("C", "")]
+
+    # 변환 함수가 None을 돌려준 행은 건너뜀
+    batches = list(read_assets(str(path), make_transformer=lambda header: lambda row: None if row[0] == "B" else row))
+    assert [row[0] for batch in batches for row in batch] == ["A", "C"]
+
+
+def test_format_lookup_errors(monkeypatch):
+    assert format_for_path("자산.NDJSON").name == format_for_path("a.jsonl").name
+    with pytest.raises(ValueError):
+        format_for_path("자산.txt")
+    monkeypatch.setattr(asset_formats, "openpyxl", None)
+    with pytest.raises(RuntimeError):
+        format_for_path("자산.xlsx")
+    assert "*.xlsx" not in file_dialog_filter()
+    assert file_dialog_filter().endswith("모든 파일 (*)")
+
+
+def test_cell_text():
+    assert cell_text("  값 ") == "값"
+    assert cell_text(None) == ""
+    assert cell_text(datetime(2030, 1, 31, 9, 30)) == "2030-01-31"
+    assert cell_text(date(2030, 1, 31)) == "2030-01-31"
+    assert cell_text(1000.0) == "1000"
+    assert cell_text(12.5) == "12.5"
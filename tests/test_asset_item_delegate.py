@@ -0,0 +1,63 @@
+from datetime import date
+
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QImage, QPainter, QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QStyleOptionViewItem
+
+from asset_item_delegate import AssetItemDelegate
+from asset_table_model import AMOUNT_COLUMN, D_DAY_COLUMN, AMOUNT_ROLE, DUE_ORDINAL_ROLE, CURRENCY_ROLE
+
+
+class _CountingModel(QStandardItemModel):
+    """DisplayRole 조회 횟수를 기록하는 모델."""
+
+    def __init__(self):
+        super().__init__(1, D_DAY_COLUMN + 1)
+        self.display_requests = 0
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            self.display_requests += 1
+        return super().data(index, role)
+
+
+def _paint(delegate, model, column):
+    image = QImage(200, 30, QImage.Format_ARGB32)
+    painter = QPainter(image)
+    option = QStyleOptionViewItem()
+    option.rect = QRect(0, 0, 200, 30)
+    delegate.paint(painter, option, model.index(0, column))
+    painter.end()
+
+
+def _model(amount, due_ordinal):
+    model = _CountingModel()
+    for column in range(model.columnCount()):
+        item = QStandardItem()
+        item.setData(amount, AMOUNT_ROLE)
+        item.setData("KRW", CURRENCY_ROLE)
+        item.setData(due_ordinal, DUE_ORDINAL_ROLE)
+        model.setItem(0, column, item)
+    return model
+
+
+def test_amount_and_d_day_cells_do_not_fetch_display_text(qapp):
+    delegate = AssetItemDelegate()
+    model = _model(1500000, date.today().toordinal() + 10)
+
+    _paint(delegate, model, AMOUNT_COLUMN)
+    _paint(delegate, model, D_DAY_COLUMN)
+
+    assert model.display_requests == 0
+    assert delegate._amount_texts == {(1500000, "KRW"): "1,500,000 원"}
+    assert any(text == "D-10" for _, text in delegate._static_texts)
+
+
+def test_d_day_uses_delegate_today(qapp):
+    delegate = AssetItemDelegate()
+    due_ordinal = date(2030, 1, 10).toordinal()
+    delegate.set_today(date(2030, 1, 12).toordinal())
+    _paint(delegate, _model(0, due_ordinal), D_DAY_COLUMN)
+    assert any(text == "D+2" for _, text in delegate._static_texts)
+    assert delegate._days_left(due_ordinal) == -2
+    assert delegate._days_left(None) is None
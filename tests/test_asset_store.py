@@ -0,0 +1,85 @@
+import json
+
+from asset_data_manager import AssetDataManager
+
+
+def _asset(name, amount):
+    return {"자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": name, "금액": amount,
+            "만기일": "", "알림": "없음", "비고": ""}
+
+
+def _record_writes(manager):
+    """저장소가 쓰는 파일 이름을 기록합니다."""
+    written = []
+    write_json = manager.store._write_json
+
+    def recording_write(filename, data, indent=None):
+        written.append(filename)
+        write_json(filename, data, indent)
+
+    manager.store._write_json = recording_write
+    return written
+
+
+def test_tabs_are_saved_to_separate_files_and_reloaded(manager, workdir):
+    manager.add_tab_data("주식")
+    manager.add_assets("예금", [_asset("A", 100)])
+    manager.add_assets("주식", [_asset("B", 200), _asset("C", 300)])
+
+    manifest = json.loads((workdir / "asset_data" / "manifest.json").read_text(encoding="utf-8"))
+    assert [(tab["name"], tab["shard"]) for tab in manifest["tabs"]] == [("예금", "tab_0001.json"), ("주식", "tab_0002.json")]
+
+    reloaded = AssetDataManager()
+    assert reloaded.get_all_tab_names() == ["예금", "주식"]
+    assert [asset["자산 명"] for asset in reloaded.get_assets_by_tab("주식")] == ["B", "C"]
+    assert reloaded.last_no == 3
+    assert reloaded._verify_integrity() == []
+
+
+def test_only_changed_tabs_and_manifest_are_written(manager, workdir):
+    manager.add_tab_data("주식")
+    manager.add_assets("주식", [_asset("B", 200)])
+    written = _record_writes(manager)
+
+    manager.add_assets("예금", [_asset("A", 100)])
+    assert written == ["tab_0001.json"]
+
+    # 이름 변경은 manifest만 씀
+    del written[:]
+    manager.rename_tab_data_key("주식", "해외 주식")
+    assert written == ["manifest.json"]
+
+    # 삭제는 manifest를 쓰고 샤드 파일을 지움
+    del written[:]
+    manager.delete_tab_data("해외 주식")
+    assert written == ["manifest.json"]
+    assert sorted(path.name for path in (workdir / "asset_data").iterdir()) == ["manifest.json", "tab_0001.json"]
+
+
+def test_legacy_single_file_is_migrated(qapp, workdir):
+    legacy = {"예금": [dict(_asset("A", 100), no=1)], "주식": [dict(_asset("B", 200), no=5)]}
+    (workdir / "assets.json").write_text(json.dumps(legacy, ensure_ascii=False), encoding="utf-8")
+
+    manager = AssetDataManager()
+    assert manager.get_all_tab_names() == ["예금", "주식"]
+    assert manager.last_no == 5
+    assert not (workdir / "assets.json").exists()
+    assert (workdir / "assets.json.bak").exists()
+    # 다음 실행부터는 탭별 파일에서 읽음
+    assert AssetDataManager().get_assets_by_tab("주식")[0]["자산 명"] == "B"
+
+
+def test_unreadable_shard_starts_empty_and_edits_are_detected(manager, workdir):
+    manager.add_tab_data("주식")
+    manager.add_assets("예금", [_asset("A", 100)])
+    manager.add_assets("주식", [_asset("B", 200)])
+
+    shard = workdir / "asset_data" / "tab_0001.json"
+    data = json.loads(shard.read_text(encoding="utf-8"))
+    data["assets"][0]["금액"] = 999 # 외부에서 수정
+    shard.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    (workdir / "asset_data" / "tab_0002.json").write_text("{깨짐", encoding="utf-8")
+
+    reloaded = AssetDataManager()
+    assert reloaded.get_assets_by_tab("주식") == []
+    assert reloaded._verify_integrity() == ["예금"]
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+from PyQt5.QtCore import Qt
+
+from asset_table_model import (
+    AssetTableModel, AMOUNT_COLUMN, D_DAY_COLUMN, AMOUNT_ROLE, DUE_ORDINAL_ROLE, CURRENCY_ROLE, INVALID_DATE,
+    format_cell,
+)
+
+
+def _asset(name, amount, **fields):
+    asset = {"자산 종류": "현금", "세부 분류": "", "자산 명": name, "금액": amount, "통화": "KRW", "알림": "없음"}
+    asset.update(fields)
+    return asset
+
+
+def _model(manager, count):
+    manager.add_assets("예금", [_asset(f"자산 {i}", i * 1000) for i in range(count)])
+    model = AssetTableModel(manager, "예금")
+    model.FETCH_BATCH_SIZE = 10
+    model.set_rows(manager.get_sorted_nos("예금", [("금액", False)]))
+    return model
+
+
+def test_rows_are_fetched_in_batches(manager):
+    model = _model(manager, 25)
+    assert model.total_row_count() == 25
+    assert model.rowCount() == 10
+    assert model.canFetchMore()
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 25
+    assert not model.canFetchMore()
+
+
+def test_row_of_no_loads_rows_up_to_target(manager):
+    model = _model(manager, 25)
+    # 금액 내림차순이므로 첫 번째로 추가된 자산(no=1)이 마지막 행
+    assert model.row_of_no(1) == 24
+    assert model.rowCount() == 25
+    assert model.row_of_no(999) == -1
+
+
+def test_data_roles(manager):
+    due = date.today() + timedelta(days=3)
+    manager.add_assets("예금", [
+        _asset("달러", 1234567, 통화="USD", 만기일=due.isoformat()),
+        _asset("오류", "abc", 만기일="2030-13-45"),
+    ])
+    model = AssetTableModel(manager, "예금")
+    model.set_rows(manager.get_sorted_nos("예금", []))
+
+    amount = model.index(0, AMOUNT_COLUMN)
+    assert model.data(amount, AMOUNT_ROLE) == 1234567
+    assert model.data(amount, CURRENCY_ROLE) == "USD"
+    assert model.data(amount, Qt.DisplayRole) == format_cell(model.asset_at(0), AMOUNT_COLUMN)
+    assert model.data(model.index(0, D_DAY_COLUMN), Qt.DisplayRole) == "D-3"
+    assert model.data(model.index(0, 0), DUE_ORDINAL_ROLE) == due.toordinal()
+    assert model.data(model.index(0, 2), Qt.UserRole)["자산 명"] == "달러"
+
+    assert model.data(model.index(1, AMOUNT_COLUMN), AMOUNT_ROLE) is None
+    assert model.data(model.index(1, 0), DUE_ORDINAL_ROLE) == INVALID_DATE
+    assert model.data(model.index(1, D_DAY_COLUMN), Qt.DisplayRole) == "날짜 오류"
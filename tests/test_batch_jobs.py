@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+
+import batch_jobs
+from batch_jobs import (
+    AggregationJob, BatchJobRunner, IndexRebuildJob, TermCountJob, ValidationJob,
+    decode_column, encode_column, make_chunk, partition_snapshots, run_job, shutdown_executor
+)
+from tab_snapshots import TabSnapshot
+
+
+def _asset(no, category, amount, currency="KRW", due_date="", alert="없음"):
+    return {"no": no, "자산 종류": category, "세부 분류": "정기예금", "자산 명": f"자산 {no % 7}", "금액": amount,
+            "통화": currency, "만기일": due_date, "알림": alert, "비고": ""}
+
+
+def _snapshots():
+    deposits = [_asset(i, "예금", i * 10) for i in range(1, 101)]
+    stocks = [_asset(100 + i, "주식", 1000, "USD" if i % 2 else "KRW") for i in range(1, 51)]
+    stocks[3] = _asset(104, "주식", "1,000원", due_date="2030/01/31", alert="매일")
+    stocks[4] = _asset(105, "주식", 5, currency="dollar", due_date="2030-01-31", alert="9일 전")
+    return {"예금": TabSnapshot("예금", 1, tuple(deposits)), "주식": TabSnapshot("주식", 2, tuple(stocks))}
+
+
+@pytest.fixture
+def pool_path(monkeypatch):
+    """행 수와 관계없이 프로세스 풀 경로를 사용합니다."""
+    monkeypatch.setattr(batch_jobs, "MIN_PARALLEL_ROWS", 0)
+    yield
+    shutdown_executor()
+
+
+def test_column_encoding_round_trip():
+    repeated = ["KRW", "USD"] * 50
+    assert encode_column(repeated)[0] == "dict"
+    assert decode_column(encode_column(repeated)) == repeated
+    distinct = [str(i) for i in range(10)]
+    assert encode_column(distinct) == ("plain", distinct)
+
+    chunk = make_chunk("탭", [{"no": 3, "금액": 100}, {"no": 4, "금액": None}, {}], ("금액", "통화"))
+    assert list(chunk.nos) == [3, 4, 0]
+    assert batch_jobs.chunk_columns(chunk) == {"금액": ["100", "", ""], "통화": ["", "", ""]}
+
+
+def test_validation_reports_each_bad_field_in_order():
+    issues = run_job(ValidationJob(), _snapshots(), max_workers=1, chunk_size=16)
+    assert [(issue.tab_name, issue.no, issue.field) for issue in issues] == [
+        ("주식", 104, "금액"), ("주식", 104, "만기일"), ("주식", 104, "알림"), ("주식", 105, "통화")]
+
+
+def test_aggregation_and_term_counts_inline():
+    snapshots = _snapshots()
+    groups = run_job(AggregationJob(), snapshots, max_workers=1, chunk_size=16)
+    assert groups[("예금", "예금", "KRW")] == [100, sum(i * 10 for i in range(1, 101))]
+    # 숫자가 아닌 금액은 건수만 포함
+    assert sum(count for (tab_name, _, _), (count, _) in groups.items() if tab_name == "주식") == 50
+
+    counts = run_job(TermCountJob("자산 명"), snapshots, max_workers=1, chunk_size=16)
+    assert sum(counts.values()) == 150 and counts["자산 0"] == 21
+
+    aggregates, term_counts = run_job(IndexRebuildJob(["자산 명"]), snapshots, max_workers=1, chunk_size=16)
+    assert aggregates == groups and term_counts == {"자산 명": counts}
+
+
+def test_pool_results_match_inline(pool_path):
+    snapshots = _snapshots()
+    for job in (ValidationJob(), AggregationJob(), IndexRebuildJob(["자산 명", "세부 분류"])):
+        inline = run_job(job, snapshots, max_workers=1, chunk_size=16)
+        assert run_job(job, snapshots, max_workers=2, chunk_size=16) == inline
+    assert batch_jobs._executor is not None # 작업 프로세스에서 실행됨
+
+
+def test_progress_and_cancellation():
+    snapshots = _snapshots()
+    progress = []
+    run_job(AggregationJob(), snapshots, max_workers=1, chunk_size=40, progress=lambda done, total: progress.append((done, total)))
+    assert progress == [(40, 150), (80, 150), (100, 150), (140, 150), (150, 150)]
+
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert run_job(AggregationJob(), snapshots, max_workers=1, cancel_event=cancel_event) is None
+
+    # 처리 도중 취소
+    cancel_event = threading.Event()
+    assert run_job(AggregationJob(), snapshots, max_workers=1, chunk_size=40,
+                   progress=lambda done, total: cancel_event.set(), cancel_event=cancel_event) is None
+
+
+def test_pool_cancellation(pool_path):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert run_job(AggregationJob(), _snapshots(), max_workers=2, chunk_size=16, cancel_event=cancel_event) is None
+
+
+def test_encoded_columns_are_cached_per_snapshot_version():
+    snapshots = _snapshots()
+    first = list(partition_snapshots(snapshots, ("금액",), 64))
+    second = list(partition_snapshots(snapshots, ("금액",), 64))
+    assert all(a.columns["금액"] is b.columns["금액"] for a, b in zip(first, second))
+
+    snapshots["예금"] = TabSnapshot("예금", 3, snapshots["예금"].assets)
+    third = list(partition_snapshots(snapshots, ("금액",), 64))
+    assert third[0].columns["금액"] is not first[0].columns["금액"] # 새 버전은 다시 인코딩
+    assert third[-1].columns["금액"] is first[-1].columns["금액"]
+
+
+def test_runner_emits_result_and_cancellation(qapp):
+    results = []
+    runner = BatchJobRunner(AggregationJob(), _snapshots(), max_workers=1)
+    runner.job_finished.connect(results.append)
+    runner.start()
+    assert runner.wait(10000)
+    qapp.processEvents()
+    assert len(results) == 1 and ("주식", "주식", "USD") in results[0]
+
+    cancelled = []
+    runner = BatchJobRunner(AggregationJob(), _snapshots(), max_workers=1)
+    runner.job_cancelled.connect(lambda: cancelled.append(True))
+    runner.cancel()
+    runner.start()
+    assert runner.wait(10000)
+    qapp.processEvents()
+    assert cancelled == [True]
@@ -0,0 +1,43 @@
+from PyQt5.QtWidgets import QTableView
+
+from asset_table_model import AssetTableModel, COLUMN_HEADERS
+from column_sizer import ColumnLengthIndex, ColumnSizer
+
+NAME_COLUMN = COLUMN_HEADERS.index("자산 명")
+
+
+def _asset(no, name):
+    return {"no": no, "자산 종류": "현금", "자산 명": name, "금액": no, "통화": "KRW", "알림": "없음"}
+
+
+def test_longest_assets_follow_changes():
+    index = ColumnLengthIndex()
+    short, medium, longest = _asset(1, "a"), _asset(2, "abc"), _asset(3, "abcdef")
+    index.assets_added("탭", [short, medium, longest])
+    assert index.longest_assets("탭", NAME_COLUMN, 2) == [longest, medium]
+
+    index.assets_removed("탭", [longest])
+    assert index.longest_assets("탭", NAME_COLUMN, 1) == [medium]
+
+    renamed = _asset(1, "abcdefgh")
+    index.assets_updated("탭", [(short, renamed)])
+    assert index.longest_assets("탭", NAME_COLUMN, 1) == [renamed]
+    assert index.longest_assets("없는 탭", NAME_COLUMN, 1) == []
+
+
+def test_sizer_measures_longest_value_outside_sample(qapp, manager):
+    rows = [{"자산 종류": "현금", "자산 명": f"자산 {i}", "금액": i, "통화": "KRW", "알림": "없음"} for i in range(2000)]
+    rows[1500]["자산 명"] = "아주 긴 이름의 자산 " * 4
+    manager.add_assets("예금", rows)
+    model = AssetTableModel(manager, "예금")
+    model.set_rows(manager.get_sorted_nos("예금", []))
+    view = QTableView()
+    view.setModel(model)
+
+    sizer = ColumnSizer(manager)
+    sizer.RANDOM_SAMPLE_SIZE = 0
+    widths = sizer.estimate_widths(view)
+
+    assert len(widths) == len(COLUMN_HEADERS)
+    assert all(sizer.MIN_WIDTH <= width <= sizer.MAX_WIDTH for width in widths)
+    assert widths[NAME_COLUMN] == sizer.MAX_WIDTH
@@ -0,0 +1,70 @@
+import random
+
+from completion_index import CompletionIndex, IndexedCompleter
+from vocabulary_store import VocabularyStore
+
+
+def _brute_force(index, prefix, limit):
+    folded = prefix.casefold()
+    matches = [value for value in index._counts if value.casefold().startswith(folded)]
+    matches.sort(key=lambda value: (-index.count(value), value.casefold(), value))
+    return matches[:limit]
+
+
+def test_complete_orders_by_frequency_then_name():
+    index = CompletionIndex("자산 명")
+    index.assets_added("탭", [{"자산 명": name} for name in ["예금 B", "예금 A", "예금 B", "적금", "예수금"]])
+    assert index.complete("예") == ["예금 B", "예금 A", "예수금"]
+    assert index.complete("예금", limit=1) == ["예금 B"]
+    assert index.complete("없음") == []
+
+
+def test_complete_ignores_case():
+    index = CompletionIndex("자산 명")
+    for value in ["Samsung", "samsung", "SK"]:
+        index.add_value(value)
+    assert index.complete("sAm") == ["Samsung", "samsung"]
+    assert index.complete("s") == ["Samsung", "samsung", "SK"]
+
+
+def test_removed_assets_leave_index():
+    index = CompletionIndex("자산 명")
+    assets = [{"자산 명": "예금"}, {"자산 명": "예금"}, {"자산 명": "적금"}]
+    index.assets_added("탭", assets)
+    index.assets_removed("탭", assets[:1])
+    assert index.count("예금") == 1
+    index.assets_removed("탭", assets[1:])
+    assert index.complete("") == []
+
+
+def test_wide_prefix_top_k_matches_full_scan():
+    random.seed(7)
+    index = CompletionIndex("자산 명")
+    index.WIDE_PREFIX_MATCHES = 10
+    index.TOP_K = 5
+    names = [f"{head}{n}" for head in "가나a" for n in range(40)]
+    for _ in range(300):
+        index.add_value(random.choice(names))
+
+    for prefix in ["", "가", "a", "A1"]:
+        assert index.complete(prefix, 5) == _brute_force(index, prefix, 5)
+
+    # 상위 후보 목록이 만들어진 뒤의 증가/감소/삭제도 반영되어야 함
+    for _ in range(500):
+        value = random.choice(names)
+        if random.random() < 0.6:
+            index.add_value(value, random.randint(1, 3))
+        else:
+            index.discard_value(value, random.randint(1, 3))
+        prefix = random.choice(["", "가", "나", "a"])
+        assert index.complete(prefix, 5) == _brute_force(index, prefix, 5)
+
+
+def test_completer_fills_from_index_then_vocabulary(qapp, workdir):
+    index = CompletionIndex("자산 명")
+    index.assets_added("탭", [{"자산 명": "예금 B"}, {"자산 명": "예금 B"}, {"자산 명": "예금 A"}])
+    completer = IndexedCompleter(VocabularyStore("names.json", ["예금 A", "예금 C", "적금"]))
+    completer.set_index(index)
+    assert completer.candidates("예금") == ["예금 B", "예금 A", "예금 C"]
+    completer.update_candidates("적")
+    assert completer.model().stringList() == ["적금"]
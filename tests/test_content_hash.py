@@ -0,0 +1,65 @@
+from content_hash import ContentHashIndex, asset_digest, tab_digest
+
+
+def _asset(name, amount):
+    return {"자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": name, "금액": amount,
+            "만기일": "", "알림": "없음", "비고": ""}
+
+
+def test_digests_ignore_field_and_asset_order():
+    first, second = {"a": 1, "b": "가"}, {"b": "가", "a": 1}
+    assert asset_digest(first) == asset_digest(second)
+    assert asset_digest(first) != asset_digest({"a": 2, "b": "가"})
+    assets = [_asset("A", 1), _asset("B", 2)]
+    assert tab_digest(assets) == tab_digest(list(reversed(assets)))
+    assert tab_digest([]) == 0
+
+
+def test_index_tracks_tab_digest_incrementally():
+    index = ContentHashIndex()
+    a, b, c = _asset("A", 1), _asset("B", 2), _asset("C", 3)
+    index.assets_added("탭", [a, b])
+    index.assets_added("탭", [c])
+    index.assets_removed("탭", [b])
+    assert index.tab_hash("탭") == tab_digest([a, c])
+    index.assets_updated("탭", [(a, _asset("A", 10))])
+    assert index.tab_hash("탭") == tab_digest([_asset("A", 10), c])
+
+    index.tab_renamed("탭", "새 탭")
+    assert index.tab_hash("탭") == 0
+    assert index.tab_hash("새 탭") == tab_digest([_asset("A", 10), c])
+    index.tab_removed("새 탭", [])
+    assert index.tab_hash("새 탭") == 0
+
+
+def test_manager_hash_matches_current_data(manager):
+    manager.add_assets("예금", [_asset("A", 1), _asset("B", 2), _asset("C", 3)])
+    first = manager.get_assets_by_tab("예금")[0]
+    manager.update_assets("예금", [(first, _asset("A", 5))])
+    manager.delete_assets_by_no("예금", [2])
+    manager.undo()
+    assert manager._content_hashes.tab_hash("예금") == tab_digest(manager.assets["예금"])
+
+
+def test_no_op_update_skips_undo_save_and_signal(manager):
+    manager.add_assets("예금", [_asset("A", 1)])
+    asset = manager.get_assets_by_tab("예금")[0]
+    undo_depth = len(manager.undo_stack._undo)
+    written = []
+    manager.store._write_json = lambda filename, data, indent=None: written.append(filename)
+    changed = []
+    manager.data_changed.connect(changed.append)
+
+    assert manager.update_assets("예금", [(asset, _asset("A", 1))]) == 1
+    assert len(manager.undo_stack._undo) == undo_depth
+    assert written == [] and changed == []
+
+
+def test_store_skips_dirty_tab_with_saved_content(manager):
+    manager.add_assets("예금", [_asset("A", 1)])
+    written = []
+    manager.store._write_json = lambda filename, data, indent=None: written.append(filename)
+    # 바뀌었다가 원래 내용으로 돌아온 탭은 다시 쓰지 않음
+    manager.store.assets_updated("예금", [])
+    assert manager.store.save(manager.assets, manager._content_hashes.tab_hash) == 0
+    assert written == []
@@ -0,0 +1,74 @@
+import json
+from datetime import date
+
+from fx_rates import FxRateTable
+from utils import asset_currency, format_currency
+
+
+def _asset(name, amount, currency=None):
+    asset = {"자산 종류": "예금/적금", "세부 분류": "외화예금", "자산 명": name, "금액": amount,
+             "만기일": "", "알림": "없음", "비고": ""}
+    if currency:
+        asset["통화"] = currency
+    return asset
+
+
+def test_rate_uses_latest_rate_on_or_before_date(workdir):
+    table = FxRateTable()
+    table.set_rates({"USD": 1300}, on_date=date(2024, 1, 10))
+    table.set_rates({"USD": 1350}, on_date=date(2024, 2, 1))
+
+    assert table.rate("KRW") == 1.0
+    assert table.rate("USD", date(2024, 1, 9)) is None
+    assert table.rate("USD", date(2024, 1, 10)) == 1300.0
+    assert table.rate("USD", date(2024, 1, 31)) == 1300.0
+    assert table.rate("USD", date(2030, 1, 1)) == 1350.0
+    assert table.rate("JPY", date(2030, 1, 1)) is None
+    assert table.currencies() == ["USD"]
+
+
+def test_set_rates_invalidates_cache_and_signals_changed_currencies(workdir):
+    table = FxRateTable()
+    changed = []
+    table.rates_changed.connect(changed.append)
+    day = date(2024, 3, 1)
+    table.set_rates({"USD": 1300, "JPY": 9}, on_date=day)
+    assert table.rate("USD", day) == 1300.0 # 캐시에 저장됨
+
+    # 같은 값은 무시하고, 원화는 등록하지 않음
+    table.set_rates({"USD": 1300, "KRW": 2}, on_date=day)
+    table.set_rates({"USD": 1310}, on_date=day)
+    assert sorted(changed[0]) == ["JPY", "USD"]
+    assert changed[1:] == [["USD"]]
+    assert table.rate("USD", day) == 1310.0
+    assert table.rate("KRW") == 1.0
+
+
+def test_rates_persist_and_bad_file_is_ignored(workdir):
+    FxRateTable().set_rates({"EUR": 1450.5}, on_date=date(2024, 5, 1))
+    assert FxRateTable().rate("EUR", date(2024, 6, 1)) == 1450.5
+    assert json.loads((workdir / "fx_rates.json").read_text(encoding="utf-8")) == {"EUR": {"2024-05-01": 1450.5}}
+
+    (workdir / "fx_rates.json").write_text("{깨진 파일", encoding="utf-8")
+    assert FxRateTable().currencies() == []
+
+
+def test_asset_currency_and_format_currency():
+    assert asset_currency({}) == "KRW"
+    assert asset_currency({"통화": ""}) == "KRW"
+    assert asset_currency({"통화": "USD"}) == "USD"
+    assert format_currency(1234567) == "1,234,567 원"
+    assert format_currency(1500, "USD") == "1,500 달러"
+    assert format_currency(10, "CHF") == "10 CHF"
+    assert format_currency("미정") == "미정 원"
+
+
+def test_manager_totals_convert_with_current_rates(manager):
+    manager.add_assets("예금", [_asset("원화", 1000), _asset("달러", 10, "USD"), _asset("달러2", 5, "USD")])
+    # 환율이 없는 통화는 환산 합계에서 빠짐
+    assert manager.get_total_amount_by_tab("예금") == 1000
+
+    manager.fx_rates.set_rates({"USD": 1300})
+    assert manager.get_total_amount_by_tab("예금") == 1000 + 15 * 1300
+    manager.fx_rates.set_rates({"USD": 1000})
+    assert manager.get_total_amount_by_tab("예금") == 1000 + 15 * 1000
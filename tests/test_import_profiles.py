@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from import_profiles import DEFAULT_PROFILE_NAME, ImportProfile, ImportProfileStore
+
+
+def _bank_profile(**options):
+    return ImportProfile("은행", {"자산 명": "상품명", "금액": "잔액", "만기일": "만기"},
+                         constants={"자산 종류": "예금/적금"}, **options)
+
+
+def test_compile_maps_columns_constants_and_defaults():
+    transform = ImportProfile.default().compile(["자산 명", "금액", "통화", "없는 열"])
+    assert transform(["A", "1,500", "usd", "x"]) == {
+        "자산 종류": "", "세부 분류": "", "자산 명": "A", "금액": "1500", "통화": "USD", "만기일": "", "알림": "",
+        "비고": ""}
+
+    transform = _bank_profile(date_formats=["%Y.%m.%d", "%Y%m%d"]).compile(["상품명", "만기", "잔액"])
+    asset_data = transform(("정기예금", "2030.01.31", "2,000원"))
+    assert (asset_data["자산 종류"], asset_data["자산 명"], asset_data["만기일"]) == ("예금/적금", "정기예금", "2030-01-31")
+    assert transform(("A", "20300131", "1"))["만기일"] == "2030-01-31"
+    assert transform(("A", datetime(2030, 1, 31), 1))["만기일"] == "2030-01-31"
+    assert transform(("A", "31/01/2030", 1))["만기일"] == "31/01/2030" # 형식이 맞지 않으면 원래 값
+    # 짧은 행은 없는 값으로 처리
+    assert transform(("A",))["금액"] == "0"
+
+
+def test_amounts_become_integer_text():
+    transform = _bank_profile(amount_remove=",원 ").compile(["상품명", "잔액"])
+    assert transform(("A", "1,234.56 원"))["금액"] == "1235"
+    assert transform(("A", "-1,500.5"))["금액"] == "-1501"
+    assert transform(("A", 1234.4))["금액"] == "1234" # XLSX 숫자 셀
+    assert transform(("A", 2000))["금액"] == "2000"
+    assert transform(("A", "미정"))["금액"] == "미정" # 숫자가 아니면 원래 값
+
+
+def test_european_decimal_mark():
+    transform = _bank_profile(amount_remove=" ", decimal_mark=",").compile(["상품명", "잔액"])
+    assert transform(("A", "1.234,56"))["금액"] == "1235"
+    assert transform(("A", "1 234 567,4"))["금액"] == "1234567"
+    assert transform(("A", "12,5"))["금액"] == "13"
+    # 기본 amount_remove(",")와 함께 써도 소수점은 지우지 않음
+    transform = _bank_profile(decimal_mark=",").compile(["상품명", "잔액"])
+    assert transform(("A", "1.234,56"))["금액"] == "1235"
+
+
+def test_skip_rules():
+    profile = _bank_profile(skip_if_empty=["자산 명"], skip_if_contains={"자산 명": ["합계", "소계"]})
+    transform = profile.compile(["상품명", "잔액"])
+    assert transform(("", "1")) is None
+    assert transform(("예금 합계", "1")) is None
+    assert transform(("예금", "1")) is not None
+
+
+def test_store_detects_profile_with_most_columns(workdir):
+    store = ImportProfileStore()
+    store.save_profile(ImportProfile("이름만", {"자산 명": "상품명"}))
+    store.save_profile(_bank_profile(decimal_mark=","))
+
+    assert store.detect(["상품명", "잔액", "만기", "기타"]).name == "은행"
+    assert store.detect(["상품명", "기타"]).name == "이름만"
+    assert store.detect(["자산 명", "금액"]).name == DEFAULT_PROFILE_NAME
+    store.compile_for_header(["상품명"])
+    assert store.last_detected == "이름만"
+
+    # 저장한 프로필은 다시 읽을 수 있음
+    reloaded = ImportProfileStore()
+    assert [profile.name for profile in reloaded.profiles()] == ["이름만", "은행"]
+    assert reloaded.profiles()[1].to_dict() == _bank_profile(decimal_mark=",").to_dict()
+    reloaded.delete_profile("이름만")
+    assert [profile.name for profile in ImportProfileStore().profiles()] == ["은행"]
+
+
+def test_import_with_detected_profile_produces_summable_amounts(manager, workdir):
+    manager.import_profiles.save_profile(_bank_profile(amount_remove=" ", decimal_mark=",",
+                                                       skip_if_contains={"자산 명": ["합계"]}))
+    path = workdir / "은행.csv"
+    path.write_text("상품명,잔액,만기\n정기예금,\"1.000,50\",\n적금,\"2.000,40\",\n합계,\"3.000,90\",\n", encoding="utf-8")
+
+    assert manager.import_data_from_file("예금", str(path))
+    assert manager.import_profiles.last_detected == "은행"
+    assert [asset["금액"] for asset in manager.get_assets_by_tab("예금")] == ["1001", "2000"]
+    assert manager.get_total_amount_by_tab("예금") == 3001
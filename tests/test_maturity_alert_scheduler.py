@@ -0,0 +1,70 @@
+from datetime import date, datetime, time, timedelta
+
+from maturity_alert_scheduler import MaturityAlertScheduler
+
+
+def _asset(no, days_until_due, alert="9일 전"):
+    due_date = (date.today() + timedelta(days=days_until_due)).isoformat()
+    return {"no": no, "자산 명": f"자산 {no}", "만기일": due_date, "알림": alert}
+
+
+def _fired(scheduler):
+    received = []
+    scheduler.alerts_due.connect(received.extend)
+    return received
+
+
+def test_alert_time():
+    asset = _asset(1, 30, "9일 전")
+    expected = datetime.combine(date.today() + timedelta(days=21), time(MaturityAlertScheduler.ALERT_HOUR))
+    assert MaturityAlertScheduler.alert_time(asset) == expected.timestamp()
+    assert MaturityAlertScheduler.alert_time(_asset(2, 30, "없음")) is None
+    assert MaturityAlertScheduler.alert_time(_asset(3, -1)) is None
+    assert MaturityAlertScheduler.alert_time({"no": 4, "알림": "3일 전"}) is None
+
+
+def test_due_alerts_fire_in_time_order_and_future_ones_wait(qapp, workdir):
+    scheduler = MaturityAlertScheduler()
+    fired = _fired(scheduler)
+    later, sooner, future = _asset(1, 5, "6일 전"), _asset(2, 1, "9일 전"), _asset(3, 100, "3일 전")
+    scheduler.assets_added("예금", [later, sooner, future])
+    assert scheduler.pending_count() == 3
+
+    scheduler._fire_due_alerts()
+    assert fired == [("예금", sooner), ("예금", later)]
+    assert scheduler.pending_count() == 1
+    assert scheduler._timer.isActive()
+
+
+def test_sent_alerts_are_not_repeated(qapp, workdir):
+    asset = _asset(1, 2)
+    scheduler = MaturityAlertScheduler()
+    scheduler.assets_added("예금", [asset])
+    scheduler._fire_due_alerts()
+
+    # 재시작하거나 같은 자산이 다시 추가(실행 취소 등)되어도 다시 알리지 않음
+    restarted = MaturityAlertScheduler()
+    fired = _fired(restarted)
+    restarted.assets_added("예금", [dict(asset)])
+    restarted._fire_due_alerts()
+    assert fired == []
+    assert restarted.pending_count() == 0
+
+    # 만기일이나 알림 설정을 바꾸면 새로 알림
+    restarted.assets_updated("예금", [(asset, dict(asset, 알림="6일 전"))])
+    restarted._fire_due_alerts()
+    assert [entry[1]["알림"] for entry in fired] == ["6일 전"]
+
+
+def test_remove_and_update(qapp, workdir):
+    scheduler = MaturityAlertScheduler()
+    fired = _fired(scheduler)
+    first, second = _asset(1, 2), _asset(2, 2)
+    scheduler.assets_added("예금", [first, second])
+    scheduler.assets_removed("예금", [first])
+
+    renamed = dict(second, **{"자산 명": "새 이름"})
+    scheduler.assets_updated("예금", [(second, renamed)])
+    scheduler.tab_renamed("예금", "저축")
+    scheduler._fire_due_alerts()
+    assert fired == [("저축", renamed)]
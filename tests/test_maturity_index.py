@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+
+from maturity_index import MaturityIndex
+from maturity_view import MaturityView
+
+DAY = date(2030, 1, 1).toordinal()
+
+
+def _asset(no, day_offset=None):
+    asset = {"no": no, "자산 종류": "예금/적금", "자산 명": f"자산 {no}", "금액": no * 100, "통화": "KRW"}
+    if day_offset is not None:
+        asset["만기일"] = date.fromordinal(DAY + day_offset).isoformat()
+    return asset
+
+
+def test_between_returns_assets_in_due_date_order():
+    index = MaturityIndex()
+    index.assets_added("A", [_asset(1, 10), _asset(2, 0), _asset(3)])
+    index.assets_added("B", [_asset(4, 5), _asset(5, 40), {"no": 6, "만기일": "잘못된 날짜"}])
+
+    assert [(tab_name, asset["no"]) for _, tab_name, asset in index.between(DAY, DAY + 30)] == \
+        [("A", 2), ("B", 4), ("A", 1)]
+    assert index.count_between(DAY, DAY + 30) == 3
+    assert index.count_between(DAY + 1, DAY + 4) == 0
+    assert index.count_between(DAY + 40, DAY + 40) == 1
+
+
+def test_changes_and_tab_operations():
+    index = MaturityIndex()
+    first, second = _asset(1, 3), _asset(2, 3)
+    index.assets_added("A", [first, second])
+    index.assets_updated("A", [(first, _asset(1, 20))])
+    assert [asset["no"] for _, _, asset in index.between(DAY, DAY + 10)] == [2]
+
+    index.tab_renamed("A", "C")
+    assert {tab_name for _, tab_name, _ in index.between(DAY, DAY + 30)} == {"C"}
+    index.tab_removed("C", [_asset(1, 20), second])
+    assert index.between(DAY, DAY + 30) == []
+    assert index._ordinals == []
+
+
+def test_view_lists_assets_within_period(qapp, manager):
+    today = date.today()
+    manager.add_tab_data("투자")
+    manager.add_assets("예금", [
+        {"자산 명": "곧", "금액": 1, "만기일": (today + timedelta(days=3)).isoformat()},
+        {"자산 명": "나중", "금액": 2, "만기일": (today + timedelta(days=90)).isoformat()},
+    ])
+    manager.add_assets("투자", [{"자산 명": "오늘", "금액": 3, "만기일": today.isoformat()}])
+
+    view = MaturityView(manager)
+    view.show()
+    assert [view.model.row_entry(row)[1]["자산 명"] for row in range(view.model.rowCount())] == ["오늘", "곧"]
+    assert view.count_label.text() == "2건"
+
+    view.days_spin.setValue(120)
+    assert view.model.rowCount() == 3
@@ -0,0 +1,91 @@
+import math
+from datetime import date, timedelta
+
+from net_worth_history import SERIES_TOTAL, NetWorthHistory, lttb
+
+
+def _entries(start, values):
+    return [{"date": (start + timedelta(days=offset)).isoformat(),
+             "totals": {"total": value, "tabs": {"예금": value}, "categories": {"": 1}}}
+            for offset, value in enumerate(values)]
+
+
+def _fresh_rollup(history, resolution):
+    """캐시 없이 새로 계산한 집계"""
+    fresh = NetWorthHistory()
+    fresh._ordinals, fresh._values = list(history._ordinals), {key: list(series) for key, series in history._values.items()}
+    return fresh.points(SERIES_TOTAL, resolution)
+
+
+def test_lttb_keeps_budget_endpoints_and_peaks():
+    xs = list(range(1000))
+    ys = [math.sin(x / 50) for x in xs]
+    ys[500] = 10.0
+    selected = lttb(xs, ys, 50)
+    assert len(selected) == 50
+    assert selected[0] == 0 and selected[-1] == 999
+    assert selected == sorted(selected)
+    assert 500 in selected # 튀는 값은 보존됨
+
+    assert lttb(xs[:10], ys[:10], 50) == list(range(10))
+    assert lttb(xs, ys, 2) == list(range(1000))
+
+
+def test_points_rollups_use_period_end_values_and_ranges():
+    history = NetWorthHistory()
+    start = date(2024, 1, 1) # 월요일
+    history.load(_entries(start, range(40)))
+
+    ordinals, values = history.points(SERIES_TOTAL, "weekly")
+    assert values[:2] == [6, 13]
+    assert ordinals[0] == date(2024, 1, 7).toordinal()
+    _, values = history.points(SERIES_TOTAL, "monthly")
+    assert values == [30, 39]
+
+    low, high = date(2024, 1, 10).toordinal(), date(2024, 1, 12).toordinal()
+    assert history.points(SERIES_TOTAL, "daily", low, high)[1] == [9, 10, 11]
+    assert history.points(("tab", "없음")) == ([], [])
+    assert history.series_keys() == [SERIES_TOTAL, ("tab", "예금"), ("category", "")]
+    assert history.span() == (start.toordinal(), (start + timedelta(days=39)).toordinal())
+
+
+def test_set_live_updates_last_point_and_cached_rollups():
+    history = NetWorthHistory()
+    start = date(2024, 1, 1)
+    history.load(_entries(start, [1, 2, 3]))
+    history.points(SERIES_TOTAL, "weekly") # 집계를 캐시
+
+    today = date(2024, 1, 8).toordinal()
+    history.set_live(today, {"total": 100, "tabs": {"주식": 100}})
+    history.set_live(today, {"total": 120, "tabs": {"주식": 120}})
+    for resolution in ("daily", "weekly", "monthly"):
+        assert history.points(SERIES_TOTAL, resolution) == _fresh_rollup(history, resolution)
+    assert history.points(SERIES_TOTAL)[1] == [1, 2, 3, 120]
+    assert history.points(("tab", "주식"))[1] == [0, 0, 0, 120]
+    assert history.points(("tab", "예금"))[1] == [1, 2, 3, 0]
+
+    # 다시 load해도 live 점은 유지됨
+    history.load(_entries(start, [5, 6]))
+    assert history.points(SERIES_TOTAL)[1] == [5, 6, 120]
+
+
+def test_live_point_is_hidden_when_later_snapshot_exists():
+    history = NetWorthHistory()
+    history.load(_entries(date(2024, 1, 1), [1, 2]))
+    history.set_live(date(2023, 12, 31).toordinal(), {"total": 99})
+    assert history.points(SERIES_TOTAL)[1] == [1, 2]
+
+
+def test_refresh_snapshot_rewrites_stale_snapshot_of_same_day(manager):
+    today = date.today()
+    manager.take_snapshot(today)
+    manager.refresh_snapshot(today) # 바뀐 것이 없으면 그대로
+    assert manager.get_snapshot_history()[-1]["totals"]["total"] == 0
+
+    manager.add_assets("예금", [{"자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": "A", "금액": 500,
+                                "만기일": "", "알림": "없음", "비고": ""}])
+    manager.refresh_snapshot(today - timedelta(days=1)) # 마지막 스냅샷 날짜가 아니면 무시
+    assert manager.get_snapshot_history()[-1]["totals"]["total"] == 0
+    manager.refresh_snapshot(today)
+    history = manager.get_snapshot_history()
+    assert len(history) == 1 and history[-1]["totals"]["total"] == 500
@@ -0,0 +1,99 @@
+import json
+
+from asset_tree_view import AssetTreeView
+from holdings_model import HoldingsModel
+from price_feed import AsyncPriceSource, FilePriceSource, apply_prices, join_prices, load_price_file
+
+
+def _holding(name, quantity, current_price):
+    return {"자산 이름": name, "수량": quantity, "매입 단가": 100, "현재 단가": current_price,
+            "매입일": "2024-01-01", "만기일": "", "메모": ""}
+
+
+def _managed_holding(name, current_price):
+    """AssetDataManager에 저장되는 자산 필드를 함께 가진 보유 자산입니다."""
+    holding = _holding(name, 1, current_price)
+    holding.update({"자산 종류": "주식", "세부 분류": "국내", "자산 명": name, "금액": 100, "통화": "KRW", "만기일": "2030-01-31",
+                    "알림": "없음", "비고": ""})
+    return holding
+
+
+class _StaticAsyncSource(AsyncPriceSource):
+    """요청받은 키 중 가격이 있는 것만 돌려주는 비동기 공급원입니다."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.requested_keys = None
+
+    async def fetch_async(self, keys):
+        self.requested_keys = keys
+        return {key: self.prices[key] for key in keys if key in self.prices}
+
+
+def test_load_price_file_csv_and_json(tmp_path):
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text("Symbol,Close,비고\nA,\"1,200\",x\nB,없음,y\nC\n", encoding="utf-8-sig")
+    assert load_price_file(str(csv_path)) == {"A": 1200.0}
+
+    json_path = tmp_path / "prices.json"
+    json_path.write_text(json.dumps([{"코드": "A ", "현재 단가": "15.5"}, {"코드": "B", "현재 단가": None}]),
+                         encoding="utf-8")
+    assert load_price_file(str(json_path)) == {"A": 15.5}
+    json_path.write_text(json.dumps({"A": 1, "B": "2"}), encoding="utf-8")
+    assert FilePriceSource(str(json_path)).fetch() == {"A": 1.0, "B": 2.0}
+
+
+def test_join_prices_matches_duplicate_keys(qapp):
+    model = HoldingsModel()
+    model.set_holdings([_holding("A", 1, 100), _holding("B", 1, 100), _holding("A", 2, 100)])
+    assert join_prices(model, {"A": 110, "없음": 1}) == {0: 110, 2: 110}
+
+
+def test_apply_prices_without_manager_updates_model_only(qapp):
+    model = HoldingsModel()
+    model.set_holdings([_holding("A", 1, 100), _holding("B", 1, 100)])
+    assert apply_prices(model, {"A": 100, "B": 120}) == (2, 1)
+    assert model.asset_at(1)["현재 단가"] == 120
+
+
+def test_apply_prices_with_manager_is_one_undoable_update(manager):
+    manager.add_assets("예금", [_managed_holding("A", 100), _managed_holding("B", 100), _managed_holding("C", 100)])
+    view = AssetTreeView()
+    view.set_data_source(manager, "예금")
+    undo_depth = len(manager.undo_stack._undo)
+
+    assert apply_prices(view.holdings_model, {"A": 150, "B": 100, "C": 90}, asset_manager=manager,
+                        tab_name="예금") == (3, 2)
+    assert [asset["현재 단가"] for asset in manager.get_assets_by_tab("예금")] == [150, 100, 90]
+    # data_changed를 받아 보기 모델도 갱신됨
+    assert view.holdings_model.asset_at(2)["현재 단가"] == 90
+    assert len(manager.undo_stack._undo) == undo_depth + 1
+
+    manager.undo()
+    assert [asset["현재 단가"] for asset in manager.get_assets_by_tab("예금")] == [100, 100, 100]
+    assert view.holdings_model.asset_at(0)["현재 단가"] == 100
+
+
+def test_apply_price_source_runs_async_source_on_worker_thread(qapp):
+    view = AssetTreeView()
+    view.load_assets([_holding("A", 1, 100), _holding("B", 1, 100)])
+    updates = []
+    view.prices_updated.connect(lambda matched, changed: updates.append((matched, changed)))
+
+    source = _StaticAsyncSource({"A": 130})
+    worker = view.apply_price_source(source)
+    assert worker.wait(5000)
+    qapp.processEvents() # 작업 스레드의 시그널은 GUI 스레드 이벤트 루프에서 전달됨
+
+    assert sorted(source.requested_keys) == ["A", "B"]
+    assert updates == [(1, 1)]
+    assert view.holdings_model.asset_at(0)["현재 단가"] == 130
+
+
+def test_apply_price_source_applies_sync_source_directly(qapp, tmp_path):
+    path = tmp_path / "prices.json"
+    path.write_text(json.dumps({"B": 80}), encoding="utf-8")
+    view = AssetTreeView()
+    view.load_assets([_holding("A", 1, 100), _holding("B", 1, 100)])
+    assert view.apply_price_source(FilePriceSource(str(path))) == (1, 1)
+    assert view.holdings_model.asset_at(1)["현재 단가"] == 80
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import quote_fetcher
+from asset_tree_view import AssetTreeView
+from quote_fetcher import QuoteFetcher, QuoteFetchWorker
+
+pytestmark = pytest.mark.skipif(quote_fetcher.aiohttp is None, reason="aiohttp가 설치되어 있지 않음")
+
+
+class _QuoteHandler(BaseHTTPRequestHandler):
+    """
+    시세 서버 대역입니다.
+      /quotes/A     200 + ETag (If-None-Match가 일치하면 304)
+      /quotes/FLAKY 처음 두 번은 429, 503 후 200
+      /quotes/DOWN  항상 500
+      /fx/USD       200
+    """
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("If-None-Match")))
+            if self.path == "/quotes/FLAKY":
+                server.flaky_calls += 1
+                flaky_calls = server.flaky_calls
+        if self.path == "/quotes/A":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304)
+            else:
+                self._send(200, {"price": 1200}, etag='"v1"')
+        elif self.path == "/quotes/FLAKY":
+            if flaky_calls == 1:
+                self._send(429)
+            elif flaky_calls == 2:
+                self._send(503)
+            else:
+                self._send(200, {"price": "55.5"})
+        elif self.path == "/fx/USD":
+            self._send(200, {"rate": 1350})
+        elif self.path == "/quotes/DOWN":
+            self._send(500)
+        else:
+            self._send(404)
+
+    def _send(self, status, payload=None, etag=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def quote_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _QuoteHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.flaky_calls = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _fetcher(server, **options):
+    options.setdefault("backoff_base", 0.001)
+    return QuoteFetcher(f"http://127.0.0.1:{server.server_address[1]}/", **options)
+
+
+def _requests_to(server, path):
+    """path로 온 요청들의 If-None-Match 값 목록입니다."""
+    return [headers for requested, headers in server.requests if requested == path]
+
+
+def test_fetch_prices_and_fx_rates(quote_server):
+    fetcher = _fetcher(quote_server)
+    assert fetcher.fetch(["A"]) == {"A": 1200.0}
+    assert asyncio.run(fetcher.fetch_fx_rates_async(["USD"])) == {"USD": 1350.0}
+    summary = fetcher.metrics.summary()
+    assert summary["requests"] == 2 and summary["errors"] == 0
+
+
+def test_retries_429_and_5xx_then_succeeds(quote_server):
+    fetcher = _fetcher(quote_server)
+    assert fetcher.fetch(["FLAKY"]) == {"FLAKY": 55.5}
+    assert len(_requests_to(quote_server, "/quotes/FLAKY")) == 3
+    assert fetcher.metrics.retry_count == 2
+    assert fetcher.metrics.error_count == 0
+
+
+def test_gives_up_after_max_retries(quote_server):
+    fetcher = _fetcher(quote_server, max_retries=2)
+    # 실패한 키는 결과에서 빠지고 나머지는 그대로 반환됨
+    assert fetcher.fetch(["DOWN", "A"]) == {"A": 1200.0}
+    assert len(_requests_to(quote_server, "/quotes/DOWN")) == 3
+    assert fetcher.metrics.error_count == 1
+
+
+def test_ttl_cache_hit_skips_request(quote_server):
+    fetcher = _fetcher(quote_server, cache_ttl=60.0)
+    fetcher.fetch(["A"])
+    assert fetcher.fetch(["A"]) == {"A": 1200.0}
+    assert len(_requests_to(quote_server, "/quotes/A")) == 1
+    assert fetcher.metrics.cache_hit_count == 1
+
+
+def test_expired_cache_revalidates_with_etag(quote_server):
+    fetcher = _fetcher(quote_server, cache_ttl=0.0)
+    fetcher.fetch(["A"])
+    assert fetcher.fetch(["A"]) == {"A": 1200.0}
+    assert _requests_to(quote_server, "/quotes/A") == [None, '"v1"']
+    assert fetcher.metrics.not_modified_count == 1
+    assert fetcher.metrics.cache_hit_count == 0
+
+
+def test_worker_emits_prices_rates_and_metrics(qapp, quote_server):
+    worker = QuoteFetchWorker(_fetcher(quote_server), keys=["A", "DOWN"], currencies=["USD"])
+    received = {}
+    worker.prices_fetched.connect(lambda prices: received.__setitem__("prices", prices))
+    worker.fx_rates_fetched.connect(lambda rates: received.__setitem__("rates", rates))
+    worker.metrics_reported.connect(lambda metrics: received.__setitem__("metrics", metrics))
+    worker.start()
+    assert worker.wait(10000)
+    qapp.processEvents()
+
+    assert received["prices"] == {"A": 1200.0}
+    assert received["rates"] == {"USD": 1350.0}
+    assert received["metrics"]["errors"] == 1
+
+
+def test_start_price_fetch_applies_prices_and_fx_rates(qapp, manager, quote_server):
+    manager.add_assets("예금", [{
+        "자산 종류": "주식", "세부 분류": "해외", "자산 명": "A", "금액": 100, "통화": "USD", "만기일": "2030-01-31",
+        "알림": "없음", "비고": "", "자산 이름": "A", "수량": 2, "매입 단가": 1000, "현재 단가": 1000,
+        "매입일": "2024-01-01", "메모": "",
+    }])
+    view = AssetTreeView()
+    view.set_data_source(manager, "예금")
+    reported = []
+    view.fetch_metrics_reported.connect(reported.append)
+
+    worker = view.start_price_fetch(_fetcher(quote_server))
+    assert worker.wait(10000)
+    qapp.processEvents()
+
+    assert manager.get_assets_by_tab("예금")[0]["현재 단가"] == 1200.0
+    assert manager.fx_rates.rate("USD") == 1350.0
+    assert reported and reported[0]["requests"] == 2
@@ -0,0 +1,82 @@
+from datetime import date
+
+import pytest
+
+from snapshot_store import SnapshotStore
+
+
+def _asset(no, name, amount):
+    return {"no": no, "자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": name, "금액": amount,
+            "알림": "없음", "비고": ""}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(SnapshotStore, "KEYFRAME_INTERVAL", 3)
+    return SnapshotStore(str(tmp_path / "snapshots"))
+
+
+def test_deltas_store_only_changes_and_keyframes_repeat(store):
+    day1 = {"예금": [_asset(1, "A", 100), _asset(2, "B", 200)]}
+    day2 = {"예금": [_asset(1, "A", 150)], "주식": [_asset(3, "C", 300)]}
+    day3 = {"주식": [_asset(3, "C", 300)], "예금": [_asset(1, "A", 150)]}
+    kinds = [store.take_snapshot(day1, on_date=date(2024, 1, 1)),
+             store.take_snapshot(day2, on_date=date(2024, 1, 2)),
+             store.take_snapshot(day3, on_date=date(2024, 1, 3)),
+             store.take_snapshot(day3, on_date=date(2024, 1, 4))]
+    assert kinds == ["keyframe", "delta", "delta", "keyframe"]
+
+    delta = store._read_payload("2024-01-02.delta.json.gz")
+    assert sorted(delta["upserted"]) == ["1", "3"]
+    assert delta["removed"] == ["2"]
+    # 탭 순서만 바뀐 날은 탭 목록만 기록됨
+    delta = store._read_payload("2024-01-03.delta.json.gz")
+    assert delta == {"upserted": {}, "removed": [], "tabs": ["주식", "예금"]}
+
+
+def test_load_snapshot_reconstructs_nearest_earlier_state(store, tmp_path):
+    day1 = {"예금": [_asset(2, "B", 200), _asset(1, "A", 100)]}
+    day2 = {"예금": [_asset(1, "A", 150)], "주식": [_asset(3, "C", 300)]}
+    store.take_snapshot(day1, on_date=date(2024, 1, 1))
+    store.take_snapshot(day2, on_date=date(2024, 1, 5))
+
+    assert store.load_snapshot(date(2023, 12, 31)) is None
+    # 탭 안은 'no' 순으로 복원됨
+    assert store.load_snapshot(date(2024, 1, 4)) == {"예금": [_asset(1, "A", 100), _asset(2, "B", 200)]}
+    assert store.load_snapshot(date(2024, 2, 1)) == day2
+
+    # index.json만으로 다시 열어도 같은 상태를 복원
+    reopened = SnapshotStore(str(tmp_path / "snapshots"))
+    assert reopened.load_snapshot(date(2024, 1, 5)) == day2
+    assert reopened.has_snapshot(date(2024, 1, 1)) and not reopened.has_snapshot(date(2024, 1, 2))
+
+
+def test_same_day_snapshot_is_replaced(store, tmp_path):
+    store.take_snapshot({"예금": [_asset(1, "A", 100)]}, on_date=date(2024, 1, 1))
+    store.take_snapshot({"예금": [_asset(1, "A", 110)]}, totals={"total": 110}, on_date=date(2024, 1, 2))
+    store.take_snapshot({"예금": [_asset(1, "A", 120)]}, totals={"total": 120}, on_date=date(2024, 1, 2))
+
+    assert [(entry["date"], entry["totals"]) for entry in store.entries()] == [
+        ("2024-01-01", {}), ("2024-01-02", {"total": 120})]
+    assert store.load_snapshot(date(2024, 1, 2)) == {"예금": [_asset(1, "A", 120)]}
+    assert sorted(path.name for path in (tmp_path / "snapshots").iterdir()) == [
+        "2024-01-01.keyframe.json.gz", "2024-01-02.delta.json.gz", "index.json"]
+
+
+def test_earlier_date_is_rejected(store):
+    store.take_snapshot({"예금": []}, on_date=date(2024, 1, 2))
+    with pytest.raises(ValueError):
+        store.take_snapshot({"예금": []}, on_date=date(2024, 1, 1))
+    assert len(store.entries()) == 1
+
+
+def test_manager_daily_snapshot_records_totals(manager):
+    manager.add_assets("예금", [{"자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": "A", "금액": 1000,
+                                "만기일": "", "알림": "없음", "비고": ""}])
+    manager.take_daily_snapshot()
+    manager.take_daily_snapshot() # 오늘 스냅샷이 있으면 다시 저장하지 않음
+
+    history = manager.get_snapshot_history()
+    assert len(history) == 1
+    assert history[0]["totals"]["total"] == 1000
+    assert manager.get_snapshot(date.today())["예금"][0]["금액"] == 1000
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from sort_index import AssetSortIndex, alert_sort_key, amount_sort_key, due_date_sort_key
+
+
+def _asset(no, name, amount, due_date="", alert="없음"):
+    return {"no": no, "자산 명": name, "금액": amount, "만기일": due_date, "알림": alert}
+
+
+def test_typed_keys():
+    assert amount_sort_key({"금액": "1,500"}) < amount_sort_key({"금액": 20000})
+    assert amount_sort_key({"금액": "abc"}) > amount_sort_key({"금액": 10 ** 12})
+    assert due_date_sort_key({"만기일": "2029-12-31"}) < due_date_sort_key({"만기일": "2030-01-01"})
+    assert due_date_sort_key({}) > due_date_sort_key({"만기일": "2999-01-01"})
+    assert alert_sort_key({"알림": "9일 전"}) < alert_sort_key({"알림": "12일 전"}) < alert_sort_key({"알림": "없음"})
+
+
+def test_sorted_nos_ascending_descending_and_multi_column():
+    index = AssetSortIndex()
+    index.assets_added("탭", [
+        _asset(1, "b", 300, "2030-01-01"),
+        _asset(2, "A", 100),
+        _asset(3, "c", 300, "2029-01-01"),
+        _asset(4, "d", "오류"),
+    ])
+    assert index.sorted_nos("탭", [("금액", True)]) == [2, 1, 3, 4]
+    assert index.sorted_nos("탭", [("금액", False)]) == [4, 3, 1, 2]
+    assert index.sorted_nos("탭", [("자산 명", True)]) == [2, 1, 3, 4]
+    # 금액 내림차순, 같은 금액은 만기일 오름차순
+    assert index.sorted_nos("탭", [("금액", False), ("만기일", True)])[1:3] == [3, 1]
+    assert index.sorted_nos("탭", []) == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("batch_size", [3, 200])
+def test_incremental_changes_match_fresh_sort(batch_size):
+    random.seed(batch_size)
+    specs = [[("금액", True)], [("자산 명", False)], [("만기일", False), ("금액", True)]]
+    index = AssetSortIndex()
+    rows = {}
+    next_no = 1
+    for step in range(20):
+        if rows and step % 3 == 2:
+            removed = random.sample(list(rows.values()), min(batch_size, len(rows)))
+            for asset in removed:
+                del rows[asset["no"]]
+            index.assets_removed("탭", removed)
+        else:
+            added = []
+            for _ in range(batch_size):
+                added.append(_asset(next_no, random.choice("가나다라"), random.randint(0, 5),
+                                    random.choice(["", "2030-01-01", "2031-06-30"])))
+                next_no += 1
+            for asset in added:
+                rows[asset["no"]] = asset
+            index.assets_added("탭", added)
+        spec = specs[step % len(specs)]
+        fresh = AssetSortIndex()
+        fresh.assets_added("탭", list(rows.values()))
+        assert index.sorted_nos("탭", spec) == fresh.sorted_nos("탭", spec)
+
+
+def test_bulk_add_keeps_only_most_recent_spec():
+    index = AssetSortIndex()
+    index.assets_added("탭", [_asset(i, str(i), i) for i in range(10)])
+    index.sorted_nos("탭", [("자산 명", True)])
+    index.sorted_nos("탭", [("금액", True)])
+    index.assets_added("탭", [_asset(i, str(i), -i) for i in range(10, 10 + index.BULK_CHANGE_ROWS + 1)])
+    assert list(index._tabs["탭"].sorted_lists) == [(("금액", True),)]
+    assert index.sorted_nos("탭", [("금액", True)])[0] == 10 + index.BULK_CHANGE_ROWS
+
+
+def test_tab_rename_and_remove():
+    index = AssetSortIndex()
+    index.assets_added("탭", [_asset(1, "a", 1)])
+    index.tab_renamed("탭", "새 탭")
+    assert index.get_asset("새 탭", 1)["자산 명"] == "a"
+    index.tab_removed("새 탭", [])
+    assert index.get_asset("새 탭", 1) is None
@@ -0,0 +1,68 @@
+from tab_snapshots import TabSnapshotIndex
+
+
+def _asset(name, amount):
+    return {"자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": name, "금액": amount,
+            "만기일": "", "알림": "없음", "비고": ""}
+
+
+def test_publish_rebuilds_only_changed_tabs():
+    assets_by_tab = {"예금": [{"no": 1}], "주식": [{"no": 2}]}
+    index = TabSnapshotIndex()
+    index.rebuild(assets_by_tab)
+    first = index.snapshots()
+    assert [snapshot.version for snapshot in first.values()] == [1, 2]
+
+    assets_by_tab["주식"].append({"no": 3})
+    index.assets_added("주식", [{"no": 3}])
+    index.publish(assets_by_tab)
+    second = index.snapshots()
+    assert second is not first # 참조 교체
+    assert second["예금"] is first["예금"]
+    assert second["주식"].version == 3
+    assert second["주식"].assets == ({"no": 2}, {"no": 3})
+    # 이전 스냅샷은 그대로
+    assert first["주식"].assets == ({"no": 2},)
+
+
+def test_rename_and_remove():
+    assets_by_tab = {"예금": [], "주식": []}
+    index = TabSnapshotIndex()
+    index.rebuild(assets_by_tab)
+
+    assets_by_tab = {"예금": [], "해외 주식": []}
+    index.tab_renamed("주식", "해외 주식")
+    index.publish(assets_by_tab)
+    assert list(index.snapshots()) == ["예금", "해외 주식"]
+    assert index.snapshot("해외 주식").tab_name == "해외 주식"
+    assert index.snapshot("주식") is None
+
+    del assets_by_tab["예금"]
+    index.tab_removed("예금", [])
+    index.publish(assets_by_tab)
+    assert list(index.snapshots()) == ["해외 주식"]
+
+
+def test_manager_snapshots_are_immutable_and_versioned(manager):
+    manager.add_tab_data("주식")
+    manager.add_assets("예금", [_asset("A", 100)])
+    before = manager.get_all_tab_snapshots()
+    assert list(before) == ["예금", "주식"]
+
+    asset = manager.get_assets_by_tab("예금")[0]
+    manager.update_assets("예금", [(asset, _asset("A", 200))])
+    after = manager.get_all_tab_snapshots()
+    assert before["예금"].assets[0]["금액"] == 100
+    assert after["예금"].assets[0]["금액"] == 200
+    assert after["예금"].version > before["예금"].version
+    assert after["주식"] is before["주식"]
+
+    # 내용이 그대로인 수정은 새 버전을 만들지 않음
+    manager.update_assets("예금", [(manager.get_assets_by_tab("예금")[0], _asset("A", 200))])
+    assert manager.get_tab_snapshot("예금") is after["예금"]
+
+
+def test_index_rebuild_result_is_rejected_for_stale_snapshots(manager):
+    snapshots = manager.get_all_tab_snapshots()
+    manager.add_assets("예금", [_asset("A", 100)])
+    assert manager.apply_index_rebuild(({}, {}), snapshots) is None
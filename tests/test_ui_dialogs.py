@@ -0,0 +1,48 @@
+from ui_dialogs import AssetInputDialog
+from utils import DEFAULT_CURRENCY
+
+ASSET = {
+    "자산 종류": "예금/적금", "세부 분류": "정기예금", "자산 명": "OO은행 예금",
+    "금액": 1500000, "통화": "KRW", "만기일": "2030-06-30", "알림": "9일 전", "비고": "자동이체",
+}
+
+
+def test_reset_for_asset_fills_fields(qapp, workdir):
+    dialog = AssetInputDialog()
+    dialog.reset_for_asset(ASSET)
+
+    data = dialog.get_asset_data()
+    assert data["자산 명"] == "OO은행 예금"
+    assert data["금액"] == 1500000
+    assert data["만기일"] == "2030-06-30"
+    assert data["알림"] == "9일 전"
+    assert data["비고"] == "자동이체"
+
+
+def test_reused_dialog_does_not_keep_previous_input(qapp, workdir):
+    dialog = AssetInputDialog(asset_data=ASSET)
+    dialog._staged_assets.append(dict(ASSET))
+
+    # 같은 인스턴스를 새 자산 입력용으로 다시 사용
+    dialog.reset_for_asset(None)
+
+    assert dialog.asset_data == {}
+    assert dialog.asset_name_combo.currentText() == ""
+    assert dialog.amount_input.text() == ""
+    assert dialog.note_input.text() == ""
+    assert dialog.currency_combo.currentText() == DEFAULT_CURRENCY
+    assert dialog.alert_combo.currentText() == "없음"
+    assert not dialog._alert_enabled
+    assert dialog.take_staged_assets() == []
+
+
+def test_reset_switches_between_assets(qapp, workdir):
+    dialog = AssetInputDialog()
+    dialog.reset_for_asset(ASSET)
+    dialog.reset_for_asset(dict(ASSET, **{"자산 명": "적금", "금액": 30000, "만기일": "", "알림": "없음"}))
+
+    data = dialog.get_asset_data()
+    assert data["자산 명"] == "적금"
+    assert data["금액"] == 30000
+    assert data["만기일"] == ""
+    assert data["알림"] == "없음"
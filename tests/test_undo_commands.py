@@ -0,0 +1,91 @@
+from undo_commands import AssetCommand, UndoStack
+
+
+class _Rows(AssetCommand):
+    def __init__(self, rows):
+        self.rows = rows
+        self.description = f"{rows}행"
+
+    def row_count(self):
+        return self.rows
+
+
+def _asset(name, amount):
+    return {"자산 종류": "현금", "자산 명": name, "금액": amount, "통화": "KRW", "알림": "없음"}
+
+
+def _names(manager, tab_name="예금"):
+    return [asset["자산 명"] for asset in manager.get_assets_by_tab(tab_name)]
+
+
+def test_stack_drops_oldest_commands_over_limits():
+    stack = UndoStack(max_commands=3, max_rows=10)
+    for rows in (1, 2, 3, 4):
+        stack.push(_Rows(rows))
+    assert [command.rows for command in stack._undo] == [2, 3, 4]
+
+    stack.push(_Rows(5))
+    # 행 수 합계가 10 이하가 되도록 오래된 명령부터 버림
+    assert [command.rows for command in stack._undo] == [4, 5]
+
+
+def test_stack_keeps_newest_command_even_if_oversized():
+    stack = UndoStack(max_rows=10)
+    stack.push(_Rows(3))
+    stack.push(_Rows(50))
+    assert stack.can_undo()
+    assert stack.undo_text() == "50행"
+    assert stack.pop_undo().rows == 50
+    assert stack.can_redo()
+    stack.pop_redo()
+    assert stack.undo_text() == "50행"
+
+
+def test_push_clears_redo():
+    stack = UndoStack()
+    stack.push(_Rows(1))
+    stack.pop_undo()
+    assert stack.can_redo()
+    stack.push(_Rows(2))
+    assert not stack.can_redo()
+
+
+def test_add_update_delete_round_trip(manager):
+    first, second, third = manager.add_assets("예금", [_asset("A", 1), _asset("B", 2), _asset("C", 3)])
+    manager.update_assets("예금", [(second, _asset("B2", 20))])
+    manager.delete_assets_by_no("예금", [first["no"], third["no"]])
+    assert _names(manager) == ["B2"]
+
+    assert manager.undo() # 삭제 취소: 원래 위치로 복원
+    assert _names(manager) == ["A", "B2", "C"]
+    assert manager.undo() # 수정 취소
+    assert _names(manager) == ["A", "B", "C"]
+    assert manager.undo() # 추가 취소
+    assert _names(manager) == []
+
+    assert manager.redo() and manager.redo() and manager.redo()
+    assert _names(manager) == ["B2"]
+    assert [asset["no"] for asset in manager.get_assets_by_tab("예금")] == [second["no"]]
+
+
+def test_tab_changes_round_trip(manager):
+    manager.add_assets("예금", [_asset("A", 1)])
+    manager.rename_tab_data_key("예금", "저축")
+    manager.delete_tab_data("저축")
+    assert "저축" not in manager.get_all_tab_names()
+
+    manager.undo()
+    assert _names(manager, "저축") == ["A"]
+    manager.undo()
+    assert _names(manager, "예금") == ["A"]
+    manager.redo()
+    manager.redo()
+    assert manager.get_all_tab_names() == []
+
+
+def test_oversized_change_stays_undoable(manager):
+    manager.undo_stack.max_rows = 10
+    manager.add_assets("예금", [_asset(f"자산 {i}", i) for i in range(50)])
+    assert manager.can_undo()
+    assert manager.undo()
+    assert _names(manager) == []
@@ -0,0 +1,76 @@
+import pytest
+
+import valuation_engine
+from holdings_model import HoldingsModel, format_quantity, CURRENT_PRICE_COLUMN, PROFIT_LOSS_COLUMN
+from valuation_engine import ValuationEngine, parse_number
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    """NumPy 경로와 순수 파이썬 경로를 모두 검사합니다."""
+    if request.param == "numpy":
+        if valuation_engine.np is None:
+            pytest.skip("numpy가 설치되어 있지 않음")
+    else:
+        monkeypatch.setattr(valuation_engine, "np", None)
+    return ValuationEngine()
+
+
+def _holding(name, quantity, purchase_price, current_price):
+    return {"자산 이름": name, "수량": quantity, "매입 단가": purchase_price, "현재 단가": current_price,
+            "매입일": "2024-01-01", "만기일": "", "메모": ""}
+
+
+def test_parse_number():
+    assert parse_number("1,234.5") == 1234.5
+    assert parse_number(" 7 ") == 7.0
+    assert parse_number("abc") is None
+
+
+def test_valuation_rules(engine):
+    engine.load([10, 2, 5], [1000, 500, 0], [1200, 400, 10])
+    assert engine.values(0) == (12000.0, 2000.0, pytest.approx(20.0))
+    assert engine.values(1) == (800.0, -200.0, pytest.approx(-20.0))
+    # 매입 총액이 0이면 수익률은 계산하지 않음
+    assert engine.values(2) == (50.0, 50.0, None)
+    assert engine.totals() == (12850.0, 1850.0)
+
+
+def test_set_current_prices_recomputes_only_changed_rows(engine):
+    engine.load([1, 1, 1], [100, 100, 100], [100, 100, 100])
+    assert engine.set_current_prices({0: 100, 2: 150}) == [2]
+    assert engine.values(2)[1] == 50.0
+    assert engine.set_current_prices({2: 150}) == []
+
+
+def test_format_quantity():
+    assert format_quantity(1234.5) == "1,234.5"
+    assert format_quantity(0.00012345) == "0.00012345"
+    assert format_quantity(3.0) == "3"
+    assert format_quantity(-0.0) == "0"
+    assert format_quantity(12345678901.25) == "12,345,678,901.25"
+
+
+def test_holdings_model_skips_invalid_rows_and_formats(qapp):
+    model = HoldingsModel()
+    model.set_holdings([_holding("A", "1,000", 10, 12), {"자산 이름": "누락"}, _holding("B", "x", 1, 1),
+                        _holding("C", 0.5, 100, 90)])
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, 0)) == "1"
+    assert model.data(model.index(1, 0)) == "4" # 원래 위치 기준 번호
+    assert model.data(model.index(0, 2)) == "1,000"
+    assert model.data(model.index(0, 6)) == "20.00%"
+    assert model.data(model.index(1, 7)) == "-5 원"
+
+
+def test_price_update_signals_only_changed_rows(qapp):
+    model = HoldingsModel()
+    model.set_holdings([_holding(str(i), 1, 100, 100) for i in range(6)])
+    ranges = []
+    model.dataChanged.connect(lambda top_left, bottom_right: ranges.append(
+        (top_left.row(), bottom_right.row(), top_left.column(), bottom_right.column())))
+
+    assert model.update_current_prices({1: 110, 2: 120, 4: 100, 5: 90}) == [1, 2, 5]
+    assert ranges == [(1, 2, CURRENT_PRICE_COLUMN, PROFIT_LOSS_COLUMN), (5, 5, CURRENT_PRICE_COLUMN, PROFIT_LOSS_COLUMN)]
+    assert model.asset_at(1)["현재 단가"] == 110
+    assert model.source_asset_at(1)["현재 단가"] == 100
@@ -0,0 +1,52 @@
+import json
+
+from vocabulary_store import VocabularyStore, get_vocabulary, flush_all_vocabularies
+
+
+def test_load_sorts_and_deduplicates(qapp, workdir):
+    (workdir / "names.json").write_text(json.dumps(["나", "가", "다", "가"]), encoding="utf-8")
+    store = VocabularyStore("names.json", ["무시됨"])
+    assert list(store) == ["가", "나", "다"]
+
+
+def test_missing_file_uses_defaults(qapp, workdir):
+    store = VocabularyStore("missing.json", ["투자", "현금", "투자"])
+    assert list(store) == ["투자", "현금"]
+    assert not (workdir / "missing.json").exists()
+
+
+def test_add_and_remove_keep_order(qapp, workdir):
+    store = VocabularyStore("types.json", ["가", "다"])
+    assert store.add("나")
+    assert not store.add("나")
+    assert list(store) == ["가", "나", "다"]
+    assert "나" in store
+    assert store.remove("가")
+    assert not store.remove("없는 항목")
+    assert list(store) == ["나", "다"]
+
+
+def test_items_with_prefix(qapp, workdir):
+    store = VocabularyStore("names.json", ["예금 A", "예금 B", "적금", "예수금"])
+    assert store.items_with_prefix("예금") == ["예금 A", "예금 B"]
+    assert store.items_with_prefix("예", limit=2) == ["예금 A", "예금 B"]
+    assert store.items_with_prefix("없음") == []
+
+
+def test_changes_are_written_behind(qapp, workdir):
+    store = VocabularyStore("names.json", [])
+    store.add("예금")
+    store.add("적금")
+    # 변경 즉시 저장하지 않고 flush 때 한 번에 기록
+    assert not (workdir / "names.json").exists()
+    store.flush()
+    assert json.loads((workdir / "names.json").read_text(encoding="utf-8")) == ["예금", "적금"]
+
+
+def test_get_vocabulary_is_shared(qapp, workdir):
+    first = get_vocabulary("shared_vocabulary_test.json", ["가"])
+    second = get_vocabulary("shared_vocabulary_test.json")
+    assert first is second
+    first.add("나")
+    flush_all_vocabularies()
+    assert json.loads((workdir / "shared_vocabulary_test.json").read_text(encoding="utf-8")) == ["가", "나"]
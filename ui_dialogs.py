@@ -1,14 +1,16 @@
 import unicodedata # 한글 문자 판별을 위해 추가
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QComboBox,
-    QPushButton, QDialogButtonBox, QDateEdit, QMessageBox, QLabel, QCompleter,
+    QPushButton, QDialogButtonBox, QDateEdit, QMessageBox, QLabel,
     QApplication # QApplication 임포트 추가
 )
-from PyQt5.QtCore import QDate, Qt, QStringListModel, QRegularExpression, pyqtSignal # pyqtSignal 임포트 추가
+from PyQt5.QtCore import QDate, Qt, QRegularExpression, pyqtSignal # pyqtSignal 임포트 추가
 from PyQt5.QtGui import QFont, QIntValidator, QRegularExpressionValidator, QValidator # QValidator 임포트 추가
 
 import qtawesome as qta
-from utils import parse_date_string_to_qdate
+from utils import parse_date_string_to_qdate, asset_currency, DEFAULT_CURRENCY, CURRENCY_UNITS
+from vocabulary_store import get_vocabulary
+from completion_index import IndexedCompleter
 from calculator_dialog import CalculatorDialog # 계산기 다이얼로그 임포트
 
 # 한글/한문 15자, 그 외 모든 언어 (영어, 숫자 등) 30자 제한을 위한 커스텀 유효성 검사기 (이제 직접 사용되지 않음)
@@ -60,20 +62,40 @@ class AssetInputDialog(QDialog):
         self.setFixedSize(400, 450) # 다이얼로그 고정 크기를 400x450으로 설정
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
 
-        # 콤보박스 목록 데이터 로드 (클래스 초기화 시 한 번 로드)
-        self.asset_types_list = self._load_list_data(ASSET_TYPES_FILE, ["현금", "예금/적금", "투자", "부동산", "자동차", "기타"])
-        self.detail_types_list = self._load_list_data(DETAIL_TYPES_FILE)
-        self.asset_names_list = self._load_list_data(ASSET_NAMES_FILE)
+        # 콤보박스 목록 데이터 (프로세스 전역 VocabularyStore, 세션 중 한 번만 파일에서 로드)
+        self.asset_types_list = get_vocabulary(ASSET_TYPES_FILE, ["현금", "예금/적금", "투자", "부동산", "자동차", "기타"])
+        self.detail_types_list = get_vocabulary(DETAIL_TYPES_FILE)
+        self.asset_names_list = get_vocabulary(ASSET_NAMES_FILE)
 
         # 알림 활성화 상태를 위한 내부 변수
         self._alert_enabled = False 
         # '날짜 없음' 상태를 추적하는 새로운 플래그
         self._due_date_cleared_state = False
         self.calc_dialog = None # 계산기 다이얼로그 인스턴스 저장
+        self._completers = {} # 자산 필드 이름 -> IndexedCompleter
+        self._staged_assets = [] # '추가입력'으로 기록되어 일괄 추가를 기다리는 자산 목록
 
         self.init_ui()
         self.load_qss("style.qss") # QSS 로드 먼저
 
+        self.reset_for_asset(self.asset_data)
+
+    def reset_for_asset(self, asset_data=None):
+        """
+        다이얼로그를 재사용하기 위해 입력 상태를 초기화하고 asset_data로 필드를 채웁니다.
+        asset_data가 없으면 새 자산 입력을 위한 빈 상태로 설정합니다.
+        """
+        self.asset_data = asset_data if asset_data else {}
+        self._staged_assets = []
+
+        # 이전 세션에서 열려 있던 계산기는 닫습니다.
+        if self.calc_dialog and self.calc_dialog.isVisible():
+            self.calc_dialog.close()
+        self.calc_dialog = None
+
+        self._alert_enabled = False
+        self._due_date_cleared_state = False
+
         if self.asset_data:
             self.populate_fields()
         else:
@@ -83,37 +105,19 @@ class AssetInputDialog(QDialog):
             self.asset_name_combo.setCurrentText("")
             self.note_input.setText("") # 비고 필드도 새로운 자산일 때 비어있도록 초기화
             self.amount_input.setText("") # 금액 필드도 새로운 자산일 때 비어있도록 초기화
-            # 새 자산은 기본적으로 날짜 기록 상태로 시작
-            self._due_date_cleared_state = False 
+            self.currency_combo.setCurrentText(DEFAULT_CURRENCY)
+            self.alert_combo.setCurrentText("없음")
+            # 새 자산은 기본적으로 오늘 날짜의 날짜 기록 상태로 시작
+            self.due_date_input.blockSignals(True)
+            self.due_date_input.setDate(QDate.currentDate())
+            self.due_date_input.blockSignals(False)
             self.date_status_combo.setCurrentIndex(0) # '날짜 기록'으로 설정
-
+            self._due_date_cleared_state = False
 
         # UI 초기화 및 데이터 로드 후 최종적으로 알림 UI 상태 업데이트
         self._update_alert_ui_state()
         self._update_date_status_ui() # 초기 로드 시 날짜 상태 UI 업데이트
-
-    def _load_list_data(self, filename, default_items=None):
-        """특정 파일에서 목록 데이터를 로드합니다."""
-        import json
-        import os
-        if default_items is None:
-            default_items = []
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
-        return default_items
-
-    def _save_list_data(self, filename, data_list):
-        """특정 파일에 목록 데이터를 저장합니다."""
-        import json
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data_list, f, ensure_ascii=False, indent=4)
-        except Exception as e:
-            print(f"Error saving list data to {filename}: {e}")
+        self.amount_input.setFocus()
 
     def init_ui(self):
         main_layout = QVBoxLayout()
@@ -132,31 +136,31 @@ class AssetInputDialog(QDialog):
 
         # --- 자산 종류 (Editable ComboBox + Add/Remove Buttons) ---
         self.asset_type_combo = QComboBox()
-        self._setup_editable_combo(self.asset_type_combo, self.asset_types_list, ASSET_TYPES_FILE,
+        self._setup_editable_combo(self.asset_type_combo, self.asset_types_list, "자산 종류",
                                    placeholder_text="자산 종류를 입력해주세요.") # 플레이스홀더 텍스트 추가
         self.asset_type_combo.setFixedWidth(285) # 너비 285px로 조정 (400px 총 너비에 맞춤)
         form_layout.addRow("자산 종류", self._create_combo_with_buttons( # 콜론 제거
-            self.asset_type_combo, self.asset_types_list, ASSET_TYPES_FILE,
+            self.asset_type_combo, self.asset_types_list,
             add_tooltip="자산 종류 추가", remove_tooltip="자산 종류 제거" # 툴팁 추가
         ))
 
         # --- 세부 분류 (Editable ComboBox + Add/Remove Buttons) ---
         self.detail_type_combo = QComboBox()
-        self._setup_editable_combo(self.detail_type_combo, self.detail_types_list, DETAIL_TYPES_FILE,
+        self._setup_editable_combo(self.detail_type_combo, self.detail_types_list, "세부 분류",
                                    placeholder_text="세부 분류를 입력해주세요.") # 플레이스홀더 텍스트 추가
         self.detail_type_combo.setFixedWidth(285) # 너비 285px로 조정
         form_layout.addRow("세부 분류", self._create_combo_with_buttons( # 콜론 제거
-            self.detail_type_combo, self.detail_types_list, DETAIL_TYPES_FILE,
+            self.detail_type_combo, self.detail_types_list,
             add_tooltip="세부 분류 추가", remove_tooltip="세부 분류 제거" # 툴팁 추가
         ))
 
         # --- 자산 명 (Editable ComboBox + Add/Remove Buttons) ---
         self.asset_name_combo = QComboBox()
-        self._setup_editable_combo(self.asset_name_combo, self.asset_names_list, ASSET_NAMES_FILE,
+        self._setup_editable_combo(self.asset_name_combo, self.asset_names_list, "자산 명",
                                    placeholder_text="자산 명을 입력해주세요.") # 플레이스홀더 텍스트 추가
         self.asset_name_combo.setFixedWidth(285) # 너비 285px로 조정
         form_layout.addRow("자산 명", self._create_combo_with_buttons( # 콜론 제거
-            self.asset_name_combo, self.asset_types_list, ASSET_NAMES_FILE,
+            self.asset_name_combo, self.asset_names_list,
             add_tooltip="자산 명 추가", remove_tooltip="자산 명 제거" # 툴팁 추가
         ))
 
@@ -169,7 +173,13 @@ class AssetInputDialog(QDialog):
         self.amount_input.setMaxLength(30) # 숫자 30자리로 변경
         self.amount_input.textChanged.connect(self._format_amount_input)
         self.amount_input.setMinimumHeight(30)
-        self.amount_input.setFixedWidth(283) # 너비를 283px로 조정 (400px 총 너비에 맞춤)
+        self.amount_input.setFixedWidth(213) # 통화 선택 콤보박스 자리를 빼고 283px에서 213px로 조정
+
+        # 통화 선택 (금액 입력 필드 오른쪽, 기본 원화)
+        self.currency_combo = QComboBox()
+        self.currency_combo.addItems(list(CURRENCY_UNITS.keys()))
+        self.currency_combo.setCurrentText(DEFAULT_CURRENCY)
+        self.currency_combo.setFixedSize(65, 30)
 
         # 계산기 버튼 (아이콘 제거 및 텍스트 버튼으로 변경)
         self.calculator_button = QPushButton("계산기") # 텍스트 "계산기"로 변경
@@ -182,6 +192,7 @@ class AssetInputDialog(QDialog):
         amount_input_layout.setContentsMargins(0,0,0,0)
         amount_input_layout.setSpacing(5) # 금액 필드와 버튼 사이 간격
         amount_input_layout.addWidget(self.amount_input) # stretch 제거, fixed width 사용
+        amount_input_layout.addWidget(self.currency_combo)
         amount_input_layout.addWidget(self.calculator_button)
         amount_input_layout.addStretch(1) # 우측에 여백 추가 (QFormLayout에 의해 왼쪽 정렬될 수 있도록)
 
@@ -561,28 +572,37 @@ class AssetInputDialog(QDialog):
         print(f"DEBUG: 'dateStatusCombo' style updated. Is cleared (from internal flag): {is_date_cleared}. Property: {self.date_status_combo.property('date-cleared')}")
 
 
-    def _setup_editable_combo(self, combo_box, data_list, filename, placeholder_text=""): # placeholder_text 인자 추가
+    def _setup_editable_combo(self, combo_box, vocabulary, field_name, placeholder_text=""): # placeholder_text 인자 추가
         """편집 가능한 콤보박스를 설정하고 초기 데이터를 채웁니다."""
         combo_box.setEditable(True)
-        combo_box.addItems(data_list)
+        combo_box.addItems(vocabulary.items)
         combo_box.setMinimumHeight(30)
         combo_box.lineEdit().setPlaceholderText(placeholder_text) # 플레이스홀더 텍스트 설정
         
         # 명시적으로 유효성 검사기 제거
         combo_box.lineEdit().setValidator(None) # <--- 이 줄이 추가/수정되었습니다.
         
-        # 자동 완성 기능 추가
-        completer = QCompleter(combo_box)
+        # 자동 완성 기능 추가: 입력된 접두어에 맞는 후보만 인덱스에서 조회하여 채움
+        completer = IndexedCompleter(vocabulary, combo_box)
         combo_box.setCompleter(completer)
-        model = QStringListModel()
-        model.setStringList(data_list)
-        completer.setModel(model)
+        completer.attach(combo_box.lineEdit())
+        self._completers[field_name] = completer
         
         # 콤보박스의 에디터 (QLineEdit) 변경 감지 시 목록에 추가
         # 사용자가 직접 타이핑 후 포커스를 잃었을 때 (또는 Enter) 목록에 자동 추가
-        combo_box.lineEdit().editingFinished.connect(lambda: self._add_item_on_edit_finish(combo_box, data_list, filename))
+        combo_box.lineEdit().editingFinished.connect(lambda: self._add_item_on_edit_finish(combo_box, vocabulary))
+
+    def set_completion_indexes(self, indexes):
+        """
+        저장된 자산에서 구축된 자동 완성 인덱스를 연결합니다.
+        indexes: {필드 이름: CompletionIndex} (AssetDataManager.get_completion_index 참고)
+        """
+        for field_name, index in indexes.items():
+            completer = self._completers.get(field_name)
+            if completer:
+                completer.set_index(index)
 
-    def _create_combo_with_buttons(self, combo_box, data_list, filename, add_tooltip="", remove_tooltip=""):
+    def _create_combo_with_buttons(self, combo_box, vocabulary, add_tooltip="", remove_tooltip=""):
         """콤보박스와 +/- 버튼을 포함하는 QHBoxLayout을 생성합니다."""
         hbox = QHBoxLayout()
         hbox.setContentsMargins(0,0,0,0)
@@ -590,56 +610,49 @@ class AssetInputDialog(QDialog):
 
         add_button = QPushButton(qta.icon('mdi.plus'), "")
         add_button.setFixedSize(30, 30)
-        add_button.clicked.connect(lambda: self._add_item_to_combo(combo_box, data_list, filename))
+        add_button.clicked.connect(lambda: self._add_item_to_combo(combo_box, vocabulary))
         add_button.setToolTip(add_tooltip) # 툴팁 설정
         hbox.addWidget(add_button)
 
         remove_button = QPushButton(qta.icon('mdi.minus'), "")
         remove_button.setFixedSize(30, 30)
-        remove_button.clicked.connect(lambda: self._remove_item_from_combo(combo_box, data_list, filename))
+        remove_button.clicked.connect(lambda: self._remove_item_from_combo(combo_box, vocabulary))
         remove_button.setToolTip(remove_tooltip) # 툴팁 설정
         hbox.addWidget(remove_button)
 
         return hbox
 
-    def _add_item_on_edit_finish(self, combo_box, data_list, filename):
-        """콤보박스 에디터의 편집이 끝났을 때 항목을 목록에 추가하고 저장합니다."""
+    def _add_item_on_edit_finish(self, combo_box, vocabulary):
+        """콤보박스 에디터의 편집이 끝났을 때 항목을 목록에 추가합니다. (파일 저장은 VocabularyStore가 지연 처리)"""
         text = combo_box.lineEdit().text().strip()
-        if text and text not in data_list:
-            data_list.append(text)
-            data_list.sort()
-            self._update_combo_items(combo_box, data_list)
-            self._save_list_data(filename, data_list)
+        if text and vocabulary.add(text):
+            self._update_combo_items(combo_box, vocabulary)
             # 새로 추가된 항목이 자동으로 선택되도록 설정
             combo_box.setCurrentText(text)
 
 
-    def _add_item_to_combo(self, combo_box, data_list, filename):
-        """콤보박스의 현재 텍스트를 목록에 추가하고 저장합니다."""
+    def _add_item_to_combo(self, combo_box, vocabulary):
+        """콤보박스의 현재 텍스트를 목록에 추가합니다."""
         text = combo_box.currentText().strip()
-        if text and text not in data_list:
-            data_list.append(text)
-            data_list.sort()
-            self._update_combo_items(combo_box, data_list)
-            self._save_list_data(filename, data_list)
+        if text and vocabulary.add(text):
+            self._update_combo_items(combo_box, vocabulary)
             combo_box.setCurrentText(text)
             QMessageBox.information(self, "항목 추가", f"'{text}' 항목이 추가되었습니다.")
-        elif text in data_list:
+        elif text:
             QMessageBox.information(self, "항목 추가", f"'{text}' 항목은 이미 존재합니다.")
         else:
             QMessageBox.warning(self, "항목 추가", "추가할 항목을 입력하거나 선택해주세요.")
 
-    def _remove_item_from_combo(self, combo_box, data_list, filename):
-        """콤보박스에서 현재 텍스트에 해당하는 항목을 목록에서 제거하고 저장합니다."""
+    def _remove_item_from_combo(self, combo_box, vocabulary):
+        """콤보박스에서 현재 텍스트에 해당하는 항목을 목록에서 제거합니다."""
         text_to_remove = combo_box.currentText().strip()
-        if text_to_remove and text_to_remove in data_list:
+        if text_to_remove and text_to_remove in vocabulary:
             reply = QMessageBox.question(self, "항목 삭제 확인",
                                          f"'{text_to_remove}' 항목을 목록에서 정말로 삭제하시겠습니까?",
                                          QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                data_list.remove(text_to_remove)
-                self._update_combo_items(combo_box, data_list)
-                self._save_list_data(filename, data_list)
+                vocabulary.remove(text_to_remove)
+                self._update_combo_items(combo_box, vocabulary)
                 combo_box.setCurrentIndex(-1)
                 combo_box.lineEdit().setText("") # 삭제 후 텍스트 필드 비우기
                 combo_box.setPlaceholderText("항목을 선택하거나 입력하세요")
@@ -649,12 +662,12 @@ class AssetInputDialog(QDialog):
         else:
             QMessageBox.warning(self, "항목 삭제", f"'{text_to_remove}' 항목은 목록에 없습니다.")
 
-    def _update_combo_items(self, combo_box, data_list):
-        """콤보박스의 항목들을 최신 데이터 리스트로 업데이트합니다."""
+    def _update_combo_items(self, combo_box, vocabulary):
+        """콤보박스의 항목들을 최신 목록(이미 정렬된 상태)으로 업데이트합니다."""
         current_text = combo_box.currentText()
         combo_box.clear()
-        combo_box.addItems(data_list)
-        if current_text in data_list:
+        combo_box.addItems(vocabulary.items)
+        if current_text in vocabulary:
             combo_box.setCurrentText(current_text)
         else:
             combo_box.setCurrentIndex(-1)
@@ -789,6 +802,7 @@ class AssetInputDialog(QDialog):
             self._format_amount_input() # 로드 후 포맷 적용
         else:
             self.amount_input.setText("")
+        self.currency_combo.setCurrentText(asset_currency(self.asset_data))
         
         due_date_str = self.asset_data.get('만기일', '')
         if due_date_str:
@@ -862,7 +876,8 @@ class AssetInputDialog(QDialog):
     def _add_more_asset(self):
         """
         '추가입력' 버튼 클릭 시 호출됩니다.
-        현재 자산 데이터를 전송하고, 금액과 비고 필드를 초기화하며 다이얼로그는 열려 있습니다.
+        현재 자산 데이터를 스테이징 목록에 기록하고, 금액과 비고 필드를 초기화하며 다이얼로그는 열려 있습니다.
+        기록된 자산은 다이얼로그가 닫힐 때 take_staged_assets()로 꺼내 한 번에 추가됩니다.
         """
         # 필수 필드 검사 (accept_data와 동일한 로직)
         asset_type = self.asset_type_combo.currentText().strip()
@@ -888,9 +903,10 @@ class AssetInputDialog(QDialog):
             QMessageBox.warning(self, "입력 오류", "금액은 유효한 숫자로 입력해야 합니다.")
             return
 
-        # 유효성 검사를 통과하면 데이터 전송 및 필드 초기화
+        # 유효성 검사를 통과하면 데이터 기록 및 필드 초기화
         current_asset_data = self.get_asset_data()
-        self.asset_added_and_continue_signal.emit(current_asset_data) # 시그널 전송
+        self._staged_assets.append(current_asset_data)
+        self.asset_added_and_continue_signal.emit(current_asset_data) # 시그널 전송 (기록 알림용)
 
         # 금액 및 비고 필드 초기화
         self.amount_input.setText("")
@@ -909,6 +925,12 @@ class AssetInputDialog(QDialog):
         self.amount_input.setFocus() # 금액 입력 필드에 다시 포커스 설정
 
 
+    def take_staged_assets(self):
+        """'추가입력'으로 기록된 자산 목록을 반환하고 스테이징 목록을 비웁니다."""
+        staged_assets = self._staged_assets
+        self._staged_assets = []
+        return staged_assets
+
     def get_asset_data(self):
         """유효성 검사를 통과한 입력된 자산 데이터를 딕셔너리로 반환합니다."""
         due_date = self.due_date_input.date().toString("yyyy-MM-dd")
@@ -927,6 +949,7 @@ class AssetInputDialog(QDialog):
             "세부 분류": self.detail_type_combo.currentText().strip(),
             "자산 명": self.asset_name_combo.currentText().strip(),
             "금액": int(self.amount_input.text().replace(',', '').strip()), # 금액은 콤마 제거 후 숫자로 저장
+            "통화": self.currency_combo.currentText(),
             "만기일": due_date,
             "알림": alert_value, # 알림은 콤보박스 텍스트로 저장 (상태에 따라 '없음' 처리됨)
             "비고": self.note_input.text().strip()
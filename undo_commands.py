@@ -0,0 +1,222 @@
+from collections import deque
+
+
+class AssetCommand:
+    """
+    AssetDataManager의 변경 하나를 되돌리거나 다시 적용하기 위한 명령의 기본 클래스입니다.
+    명령은 전체 데이터의 사본이 아니라 변경된 자산(추가된 자산, 이전 값, 삭제된 행과 위치)만 보관합니다.
+    """
+    description = ""
+    changes_tab_list = False # True이면 실행/취소 후 tab_list_changed 시그널이 필요함
+
+    def undo(self, manager):
+        """변경을 되돌립니다. 데이터가 바뀐 탭 이름 목록을 반환합니다."""
+        raise NotImplementedError
+
+    def redo(self, manager):
+        """되돌린 변경을 다시 적용합니다. 데이터가 바뀐 탭 이름 목록을 반환합니다."""
+        raise NotImplementedError
+
+    def row_count(self):
+        """명령이 보관하는 자산 행 수 (실행 취소 스택의 메모리 상한 계산용)."""
+        return 0
+
+
+class AddAssetsCommand(AssetCommand):
+    """탭 끝에 자산을 추가한 변경. 취소 시 추가된 자산만 제거합니다. (O(추가된 행 수))"""
+    description = "자산 추가"
+
+    def __init__(self, tab_name, added_assets):
+        self.tab_name = tab_name
+        self.added_assets = added_assets
+
+    def undo(self, manager):
+        manager._remove_appended_assets(self.tab_name, self.added_assets)
+        return [self.tab_name]
+
+    def redo(self, manager):
+        manager._append_assets(self.tab_name, self.added_assets)
+        return [self.tab_name]
+
+    def row_count(self):
+        return len(self.added_assets)
+
+
+class UpdateAssetsCommand(AssetCommand):
+    """자산 수정 변경. [(이전 자산, 새 자산), ...]을 보관하고 'no' 기준으로 교체합니다."""
+    description = "자산 수정"
+
+    def __init__(self, tab_name, changes):
+        self.tab_name = tab_name
+        self.changes = changes
+
+    def undo(self, manager):
+        manager._replace_assets(self.tab_name, [(new, old) for old, new in self.changes])
+        return [self.tab_name]
+
+    def redo(self, manager):
+        manager._replace_assets(self.tab_name, self.changes)
+        return [self.tab_name]
+
+    def row_count(self):
+        return len(self.changes) * 2
+
+
+class RemoveAssetsCommand(AssetCommand):
+    """자산 삭제 변경. 삭제된 행과 원래 위치 [(위치, 자산), ...]를 보관합니다."""
+    description = "자산 삭제"
+
+    def __init__(self, tab_name, removed_rows):
+        self.tab_name = tab_name
+        self.removed_rows = removed_rows
+
+    def undo(self, manager):
+        manager._insert_assets_at(self.tab_name, self.removed_rows)
+        return [self.tab_name]
+
+    def redo(self, manager):
+        manager._remove_assets_by_no(self.tab_name, {asset['no'] for _, asset in self.removed_rows})
+        return [self.tab_name]
+
+    def row_count(self):
+        return len(self.removed_rows)
+
+
+class AddTabCommand(AssetCommand):
+    """탭 추가 변경."""
+    description = "탭 추가"
+    changes_tab_list = True
+
+    def __init__(self, tab_name):
+        self.tab_name = tab_name
+
+    def undo(self, manager):
+        manager._remove_tab(self.tab_name)
+        return []
+
+    def redo(self, manager):
+        manager._insert_tab(self.tab_name, [], None)
+        return []
+
+
+class RemoveTabCommand(AssetCommand):
+    """탭 삭제 변경. 삭제된 탭의 자산 리스트(사본이 아닌 원본)와 탭 순서상의 위치를 보관합니다."""
+    description = "탭 삭제"
+    changes_tab_list = True
+
+    def __init__(self, tab_name, position, assets):
+        self.tab_name = tab_name
+        self.position = position
+        self.assets = assets
+
+    def undo(self, manager):
+        manager._insert_tab(self.tab_name, self.assets, self.position)
+        return []
+
+    def redo(self, manager):
+        manager._remove_tab(self.tab_name)
+        return []
+
+    def row_count(self):
+        return len(self.assets)
+
+
+class RenameTabCommand(AssetCommand):
+    """탭 이름 변경."""
+    description = "탭 이름 변경"
+    changes_tab_list = True
+
+    def __init__(self, old_name, new_name):
+        self.old_name = old_name
+        self.new_name = new_name
+
+    def undo(self, manager):
+        manager._rename_tab(self.new_name, self.old_name)
+        return []
+
+    def redo(self, manager):
+        manager._rename_tab(self.old_name, self.new_name)
+        return []
+
+
+class CompositeCommand(AssetCommand):
+    """여러 명령을 하나의 실행 취소 단위로 묶습니다. (예: 기존 데이터 삭제 후 CSV 가져오기)"""
+
+    def __init__(self, description, commands):
+        self.description = description
+        self.commands = commands
+        self.changes_tab_list = any(command.changes_tab_list for command in commands)
+
+    def undo(self, manager):
+        tabs = []
+        for command in reversed(self.commands):
+            tabs.extend(command.undo(manager))
+        return tabs
+
+    def redo(self, manager):
+        tabs = []
+        for command in self.commands:
+            tabs.extend(command.redo(manager))
+        return tabs
+
+    def row_count(self):
+        return sum(command.row_count() for command in self.commands)
+
+
+class UndoStack:
+    """
+    실행 취소/다시 실행 스택입니다.
+    명령 개수와 보관 중인 자산 행 수의 합계에 상한을 두어, 넘치면 가장 오래된 명령부터 버립니다.
+    가장 최근 명령은 혼자서 상한을 넘더라도(대용량 가져오기 등) 항상 되돌릴 수 있도록 남겨 둡니다.
+    """
+
+    def __init__(self, max_commands=100, max_rows=200000):
+        self.max_commands = max_commands
+        self.max_rows = max_rows
+        self._undo = deque() # 오래된 명령을 앞에서 버리므로 deque (popleft O(1))
+        self._redo = []
+        self._undo_rows = 0
+
+    def push(self, command):
+        """새 명령을 기록합니다. 다시 실행 목록은 비워집니다."""
+        self._undo.append(command)
+        self._undo_rows += command.row_count()
+        self._redo = []
+        self._trim()
+
+    def _trim(self):
+        while len(self._undo) > 1 and (len(self._undo) > self.max_commands or self._undo_rows > self.max_rows):
+            dropped = self._undo.popleft()
+            self._undo_rows -= dropped.row_count()
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo_text(self):
+        return self._undo[-1].description if self._undo else ""
+
+    def redo_text(self):
+        return self._redo[-1].description if self._redo else ""
+
+    def pop_undo(self):
+        """되돌릴 명령을 꺼내 다시 실행 목록으로 옮기고 반환합니다."""
+        command = self._undo.pop()
+        self._undo_rows -= command.row_count()
+        self._redo.append(command)
+        return command
+
+    def pop_redo(self):
+        """다시 실행할 명령을 꺼내 실행 취소 목록으로 옮기고 반환합니다."""
+        command = self._redo.pop()
+        self._undo.append(command)
+        self._undo_rows += command.row_count()
+        self._trim()
+        return command
+
+    def clear(self):
+        self._undo = deque()
+        self._redo = []
+        self._undo_rows = 0
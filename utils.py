@@ -27,10 +27,19 @@ def calculate_d_day(target_date_str):
     except ValueError:
         return None # 날짜 형식 오류 시
 
-def format_currency(amount):
-    """숫자를 천 단위 콤마와 '원'을 붙여 통화 형식으로 포맷합니다."""
+DEFAULT_CURRENCY = "KRW" # '통화' 필드가 없는 자산의 통화 (이전 데이터 호환)
+# 통화 코드 -> 표시 단위 (목록에 없는 코드는 코드 그대로 표시)
+CURRENCY_UNITS = {"KRW": "원", "USD": "달러", "JPY": "엔", "EUR": "유로", "CNY": "위안"}
+
+def asset_currency(asset):
+    """자산의 통화 코드를 반환합니다. 지정되지 않았으면 DEFAULT_CURRENCY입니다."""
+    return asset.get('통화') or DEFAULT_CURRENCY
+
+def format_currency(amount, currency=DEFAULT_CURRENCY):
+    """숫자를 천 단위 콤마와 통화 단위(기본 '원')를 붙여 통화 형식으로 포맷합니다."""
+    unit = CURRENCY_UNITS.get(currency, currency)
     try:
-        return f"{int(amount):,} 원"
+        return f"{int(amount):,} {unit}"
     except (ValueError, TypeError):
-        return str(amount) + " 원" # 숫자가 아닌 경우 원본 값에 '원'만 붙여 반환
+        return f"{amount} {unit}" # 숫자가 아닌 경우 원본 값에 단위만 붙여 반환
 
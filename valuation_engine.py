@@ -0,0 +1,105 @@
+try:
+    import numpy as np # 있으면 컬럼 단위 벡터 연산 사용
+except ImportError:
+    np = None
+
+def parse_number(value):
+    """'1,000' 같은 문자열도 float으로 변환합니다. 변환할 수 없으면 None."""
+    try:
+        return float(str(value).replace(',', '').strip())
+    except ValueError:
+        return None
+
+
+class ValuationEngine:
+    """
+    보유 자산의 평가 금액/평가 손익/수익률을 컬럼(수량, 매입 단가, 현재 단가) 단위로 계산하는 엔진입니다.
+    NumPy가 있으면 배열 연산 한 번으로, 없으면 같은 규칙의 순수 파이썬 반복으로 계산합니다.
+
+    계산 규칙 (매입 총액 = 수량 x 매입 단가):
+      평가 금액 = 수량 x 현재 단가
+      평가 손익 = 평가 금액 - 매입 총액
+      수익률(%) = 평가 손익 / 매입 총액 x 100 (매입 총액이 0 이하이면 계산하지 않음: None)
+    """
+
+    def __init__(self):
+        self.row_count = 0
+        self.quantities = []
+        self.purchase_prices = []
+        self.current_prices = []
+        self.evaluations = []
+        self.profit_losses = []
+        self.profit_rates = [] # NumPy 사용 시 계산 불가 값은 NaN
+
+    def load(self, quantities, purchase_prices, current_prices):
+        """세 컬럼(숫자 리스트)을 설정하고 전체 행을 계산합니다."""
+        self.row_count = len(quantities)
+        if np is not None:
+            self.quantities = np.asarray(quantities, dtype=float)
+            self.purchase_prices = np.asarray(purchase_prices, dtype=float)
+            self.current_prices = np.asarray(current_prices, dtype=float)
+            self.evaluations = np.zeros(self.row_count)
+            self.profit_losses = np.zeros(self.row_count)
+            self.profit_rates = np.full(self.row_count, np.nan)
+        else:
+            self.quantities = list(quantities)
+            self.purchase_prices = list(purchase_prices)
+            self.current_prices = list(current_prices)
+            self.evaluations = [0.0] * self.row_count
+            self.profit_losses = [0.0] * self.row_count
+            self.profit_rates = [None] * self.row_count
+        self.recompute()
+
+    def recompute(self, rows=None):
+        """rows(행 번호 리스트)만 다시 계산합니다. None이면 전체 행을 계산합니다."""
+        if np is not None:
+            index = slice(None) if rows is None else np.asarray(rows, dtype=int)
+            quantities = self.quantities[index]
+            costs = quantities * self.purchase_prices[index]
+            evaluations = quantities * self.current_prices[index]
+            profit_losses = evaluations - costs
+            with np.errstate(divide='ignore', invalid='ignore'):
+                profit_rates = np.where(costs > 0, profit_losses / costs * 100, np.nan)
+            self.evaluations[index] = evaluations
+            self.profit_losses[index] = profit_losses
+            self.profit_rates[index] = profit_rates
+            return
+
+        for row in (range(self.row_count) if rows is None else rows):
+            quantity = self.quantities[row]
+            cost = quantity * self.purchase_prices[row]
+            evaluation = quantity * self.current_prices[row]
+            profit_loss = evaluation - cost
+            self.evaluations[row] = evaluation
+            self.profit_losses[row] = profit_loss
+            self.profit_rates[row] = profit_loss / cost * 100 if cost > 0 else None
+
+    def set_current_prices(self, row_prices):
+        """
+        {행 번호: 현재 단가}를 적용하고 값이 실제로 바뀐 행만 다시 계산합니다.
+        다시 계산된 행 번호 리스트(오름차순)를 반환합니다.
+        """
+        changed_rows = sorted(row for row, price in row_prices.items() if self.current_prices[row] != price)
+        if not changed_rows:
+            return []
+        if np is not None:
+            index = np.asarray(changed_rows, dtype=int)
+            self.current_prices[index] = [row_prices[row] for row in changed_rows]
+        else:
+            for row in changed_rows:
+                self.current_prices[row] = row_prices[row]
+        self.recompute(changed_rows)
+        return changed_rows
+
+    def values(self, row):
+        """행의 (평가 금액, 평가 손익, 수익률 또는 None)을 파이썬 숫자로 반환합니다."""
+        profit_rate = self.profit_rates[row]
+        if profit_rate is not None and profit_rate != profit_rate: # NaN
+            profit_rate = None
+        return float(self.evaluations[row]), float(self.profit_losses[row]), (None if profit_rate is None else float(profit_rate))
+
+    def totals(self):
+        """전체 (평가 금액 합계, 평가 손익 합계)를 반환합니다."""
+        if np is not None:
+            return float(self.evaluations.sum()), float(self.profit_losses.sum())
+        return float(sum(self.evaluations)), float(sum(self.profit_losses))
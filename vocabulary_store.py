@@ -0,0 +1,106 @@
+import bisect
+import json
+import os
+from PyQt5.QtCore import QTimer
+
+# 목록 파일 이름 -> VocabularyStore 인스턴스 (프로세스 전역 캐시)
+_stores = {}
+
+class VocabularyStore:
+    """
+    콤보박스 목록 데이터(자산 종류, 세부 분류, 자산 명 등)를 메모리에 보관하는 저장소입니다.
+    목록은 항상 정렬된 상태를 유지하며(bisect 삽입), 변경 사항은 일정 시간 뒤에 한 번에 파일로 저장됩니다.
+    """
+    SAVE_DELAY_MS = 2000 # 마지막 변경 후 파일 저장까지의 대기 시간
+
+    def __init__(self, filename, default_items=None):
+        self.filename = filename
+        self.items = self._load(default_items if default_items is not None else [])
+        self._dirty = False
+        self._save_timer = None
+
+    def _load(self, default_items):
+        """파일에서 목록을 읽어 정렬/중복 제거된 리스트로 반환합니다. (세션 중 한 번만 호출)"""
+        data_list = default_items
+        if os.path.exists(self.filename):
+            try:
+                with open(self.filename, 'r', encoding='utf-8') as f:
+                    data_list = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                pass
+        return sorted(set(str(item) for item in data_list))
+
+    def __contains__(self, text):
+        index = bisect.bisect_left(self.items, text)
+        return index < len(self.items) and self.items[index] == text
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def items_with_prefix(self, prefix, limit=None):
+        """prefix로 시작하는 항목을 정렬 순서대로 반환합니다. (bisect로 시작 위치 탐색)"""
+        result = []
+        index = bisect.bisect_left(self.items, prefix)
+        while index < len(self.items) and self.items[index].startswith(prefix):
+            result.append(self.items[index])
+            if limit is not None and len(result) >= limit:
+                break
+            index += 1
+        return result
+
+    def add(self, text):
+        """항목을 정렬 위치에 삽입합니다. 새로 추가되었으면 True를 반환합니다."""
+        index = bisect.bisect_left(self.items, text)
+        if index < len(self.items) and self.items[index] == text:
+            return False
+        self.items.insert(index, text)
+        self._mark_dirty()
+        return True
+
+    def remove(self, text):
+        """항목을 삭제합니다. 실제로 삭제되었으면 True를 반환합니다."""
+        index = bisect.bisect_left(self.items, text)
+        if index >= len(self.items) or self.items[index] != text:
+            return False
+        del self.items[index]
+        self._mark_dirty()
+        return True
+
+    def _mark_dirty(self):
+        """변경 사항을 기록하고 지연 저장 타이머를 (재)시작합니다."""
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.timeout.connect(self.flush)
+        self._save_timer.start(self.SAVE_DELAY_MS)
+
+    def flush(self):
+        """변경된 내용이 있으면 파일에 저장합니다."""
+        if not self._dirty:
+            return
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump(self.items, f, ensure_ascii=False, indent=4)
+            self._dirty = False
+        except Exception as e:
+            print(f"Error saving list data to {self.filename}: {e}")
+
+
+def get_vocabulary(filename, default_items=None):
+    """filename에 해당하는 공유 VocabularyStore를 반환합니다. 처음 요청될 때만 파일을 읽습니다."""
+    store = _stores.get(filename)
+    if store is None:
+        store = VocabularyStore(filename, default_items)
+        _stores[filename] = store
+    return store
+
+def flush_all_vocabularies():
+    """저장되지 않은 모든 목록 변경 사항을 즉시 파일에 기록합니다. (프로그램 종료 시 호출)"""
+    for store in _stores.values():
+        store.flush()